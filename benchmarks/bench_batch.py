@@ -0,0 +1,60 @@
+"""
+Throughput of HangmanBatch against one HangmanGame per game.
+Every game guesses a random permutation of the alphabet until it ends.
+The batch is built both from answer strings (one Python step per game)
+and with HangmanBatch.from_word_ids (answers drawn as word-list indices).
+
+    python benchmarks/bench_batch.py [games]
+"""
+import string
+import sys
+import time
+
+import numpy as np
+
+from hangman.batch import HangmanBatch, PLAYING
+from hangman.engine import HangmanGame
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def bench_scalar(answers, orders):
+    start = time.perf_counter()
+    for answer, order in zip(answers, orders):
+        game = HangmanGame(answer)
+        for k in order:
+            if game.state.status() != "playing":
+                break
+            game.guess(string.ascii_lowercase[k])
+    return time.perf_counter() - start
+
+
+def bench_batch(make, orders):
+    start = time.perf_counter()
+    batch = make()
+    for letters in orders:
+        batch.guess(letters)
+        if not (batch.status == PLAYING).any():
+            break
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 200_000
+    corpus = BASIC_WORDS + INTERMEDIATE_PHRASES
+    ids = np.random.default_rng(0).integers(0, len(corpus), n)
+    answers = [corpus[i] for i in ids]
+    orders = np.argsort(np.random.default_rng(0).random((n, 26)), axis=1).astype(np.int16)
+
+    scalar_n = min(n, 20_000)
+    scalar = bench_scalar(answers[:scalar_n], orders[:scalar_n].tolist()) / scalar_n
+    columns = np.ascontiguousarray(orders.T)
+    print(f"scalar:           {1 / scalar:,.0f} games/s")
+    for label, make in (("batch (strings):", lambda: HangmanBatch(answers)),
+                        ("batch (word ids):", lambda: HangmanBatch.from_word_ids(corpus, ids))):
+        batch = min(bench_batch(make, columns) for _ in range(5)) / n
+        print(f"{label:<17} {1 / batch:,.0f} games/s ({scalar / batch:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
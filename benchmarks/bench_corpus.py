@@ -0,0 +1,59 @@
+"""
+Loading a large word list: reading the plain-text file into a list
+against opening the compiled corpus, then dealing words from each.
+Memory is the tracemalloc peak of the load itself.
+
+    python benchmarks/bench_corpus.py [words]
+"""
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from hangman.corpus import Corpus, compile_corpus, read_wordlist
+from hangman.dealer import WordDealer
+
+
+def measure(label, load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    levels = load()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    dealer = WordDealer(levels, seed=1)
+    dealer.deal("words")  # 第一次发牌时建立牌堆
+    start = time.perf_counter()
+    for _ in range(100_000):
+        dealer.deal("words")
+    per_deal = (time.perf_counter() - start) / 100_000
+    print(f"{label:<14} load {elapsed * 1e3:8.1f} ms  {peak / 2 ** 20:7.1f} MiB  "
+          f"deal {per_deal * 1e9:5.0f} ns")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 500_000
+    rng = random.Random(1)
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 14))))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text = os.path.join(tmp, "words.txt")
+        with open(text, "w", encoding="utf-8") as f:
+            f.write("\n".join(words))
+        compiled = os.path.join(tmp, "words.hgc")
+        start = time.perf_counter()
+        compile_corpus(compiled, {"words": words})
+        print(f"compile {n} words: {time.perf_counter() - start:.2f} s, "
+              f"{os.path.getsize(compiled) / 2 ** 20:.1f} MiB on disk")
+        measure("text list", lambda: {"words": read_wordlist(text)})
+        measure("mmap corpus", lambda: Corpus(compiled))
+
+
+if __name__ == "__main__":
+    main()
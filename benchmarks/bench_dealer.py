@@ -0,0 +1,36 @@
+"""
+Word draw cost: a fresh random.SystemRandom() per game (the old
+choose_answer) against WordDealer.deal, with and without per-player decks.
+
+    python benchmarks/bench_dealer.py [draws]
+"""
+import random
+import sys
+import timeit
+
+from hangman.dealer import WordDealer
+from hangman.words import BASIC_WORDS
+
+
+def old_choose_answer():
+    return random.SystemRandom().choice(BASIC_WORDS)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 200_000
+    dealer = WordDealer(seed=1)
+    players = WordDealer(seed=1)
+    ids = list(range(1000))
+    cases = {
+        "SystemRandom per draw": old_choose_answer,
+        "WordDealer shared deck": lambda: dealer.deal("basic"),
+        "WordDealer 1000 players": lambda: players.deal("basic", ids[random.randrange(1000)]),
+    }
+    for label, fn in cases.items():
+        per_draw = min(timeit.repeat(fn, number=n, repeat=3)) / n
+        print(f"{label:<24} {per_draw * 1e9:8.0f} ns/draw")
+
+
+if __name__ == "__main__":
+    main()
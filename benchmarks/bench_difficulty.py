@@ -0,0 +1,42 @@
+"""
+Difficulty index on a large synthetic corpus: building it (without the
+solver pass, which is the slow offline part), loading it back from the
+on-disk cache, and picking a word from a percentile range.
+
+    python benchmarks/bench_difficulty.py [words]
+"""
+import random
+import string
+import sys
+import tempfile
+import time
+import timeit
+
+from hangman.difficulty import DifficultyIndex
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 300_000
+    rng = random.Random(1)
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 12))))
+    words = sorted(words)
+
+    with tempfile.TemporaryDirectory() as cache:
+        start = time.perf_counter()
+        DifficultyIndex.load(words, cache, use_solver=False)
+        print(f"build + cache {n} words  {time.perf_counter() - start:8.2f} s")
+        start = time.perf_counter()
+        index = DifficultyIndex.load(words, cache, use_solver=False)
+        print(f"load from cache          {time.perf_counter() - start:8.2f} s")
+
+    reps = 200_000
+    for lo, hi in ((0.0, 0.1), (0.45, 0.55), (0.9, 1.0)):
+        per_pick = min(timeit.repeat(lambda: index.choose(lo, hi, rng), number=reps, repeat=3)) / reps
+        print(f"choose {lo:.2f}-{hi:.2f}         {per_pick * 1e9:8.0f} ns/pick")
+
+
+if __name__ == "__main__":
+    main()
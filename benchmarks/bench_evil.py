@@ -0,0 +1,60 @@
+"""
+Evil-mode guess cost on one large shape class: the straightforward
+partition (compute every candidate's pattern for the letter and group
+them in a dict) against the bitset split used by EvilHangmanGame.
+
+    python benchmarks/bench_evil.py [words] [alphabet]
+"""
+import random
+import sys
+import time
+
+from hangman.evil import EvilHangmanGame
+from hangman.solver import WordIndex
+
+
+def naive_guess(candidates, letter):
+    classes = {}
+    for word in candidates:
+        key = 0
+        for p, ch in enumerate(word):
+            if ch == letter:
+                key |= 1 << p
+        classes.setdefault(key, []).append(word)
+    return max(classes.items(), key=lambda kv: (len(kv[1]), -bin(kv[0]).count("1"), -kv[0]))[1]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 100_000
+    alphabet = argv[1] if len(argv) > 1 else "etaoinshrdlcumwfgypb"
+    rng = random.Random(1)
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(alphabet) for _ in range(9)))
+    words = sorted(words)
+    start = time.perf_counter()
+    index = WordIndex(words)
+    print(f"index {n} words: {time.perf_counter() - start:.2f} s (once per word list)")
+
+    candidates, naive = words, []
+    for letter in alphabet:
+        start = time.perf_counter()
+        candidates = naive_guess(candidates, letter)
+        naive.append(time.perf_counter() - start)
+
+    game = EvilHangmanGame(words[0], lives=len(alphabet) + 1, index=index)
+    fast = []
+    for letter in alphabet:
+        start = time.perf_counter()
+        game.guess(letter)
+        fast.append(time.perf_counter() - start)
+
+    print(f"{'':<8} {'first guess':>12} {'max':>10} {'mean':>10}")
+    for label, times in (("dict", naive), ("bitset", fast)):
+        print(f"{label:<8} {times[0] * 1e3:10.3f}ms {max(times) * 1e3:8.3f}ms "
+              f"{sum(times) / len(times) * 1e3:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+GUI countdown wakeups and CPU: per-turn timer threads vs the after() scheduler.
+Runs one turn countdown for a few real seconds on a minimal stand-in
+for the Tk event loop (no display needed) and counts callbacks,
+label redraws and process CPU time.
+
+    python benchmarks/bench_gui_timer.py [seconds]
+"""
+import heapq
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from hangman.engine import HangmanGame
+from hangman.gui import HangmanGUI
+
+
+class FakeRoot:
+    """Thread-safe after()/after_cancel() loop that counts wakeups"""
+
+    def __init__(self):
+        self.jobs = []
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.wakeups = 0
+
+    def __getattr__(self, name):
+        # title()/geometry()/... are irrelevant here
+        return lambda *args, **kwargs: None
+
+    def after(self, ms, fn):
+        with self.cond:
+            self.seq += 1
+            heapq.heappush(self.jobs, (time.monotonic() + ms / 1000, self.seq, fn))
+            self.cond.notify()
+            return self.seq
+
+    def after_cancel(self, job):
+        with self.cond:
+            self.jobs = [j for j in self.jobs if j[1] != job]
+            heapq.heapify(self.jobs)
+
+    def run(self, seconds):
+        end = time.monotonic() + seconds
+        while True:
+            with self.cond:
+                now = time.monotonic()
+                if now >= end:
+                    return
+                if not self.jobs or self.jobs[0][0] > now:
+                    wait = min(end, self.jobs[0][0] if self.jobs else end) - now
+                    self.cond.wait(wait)
+                    continue
+                _, _, fn = heapq.heappop(self.jobs)
+            self.wakeups += 1
+            fn()
+
+
+def legacy_start_timer(gui):
+    """The previous implementation: one sleeping thread per turn"""
+    gui.timer_running = True
+    gui.current_time_left = gui.game.state.seconds_per_turn
+    gui.game.start_turn(time.monotonic())
+
+    def timer_thread():
+        while gui.timer_running and gui.current_time_left > 0:
+            gui.root.after(0, gui.update_timer_display)
+            time.sleep(0.1)
+            gui.current_time_left -= 0.1
+            if gui.game and gui.timer_running and gui.game.tick(time.monotonic()):
+                break
+    threading.Thread(target=timer_thread, daemon=True).start()
+
+
+def measure(label, start, seconds):
+    root = FakeRoot()
+    with patch("tkinter.Tk", return_value=root), \
+         patch.object(HangmanGUI, "setup_styles"), patch.object(HangmanGUI, "create_widgets"), \
+         patch.object(HangmanGUI, "setup_layout"), patch.object(HangmanGUI, "bind_events"), \
+         patch.object(HangmanGUI, "new_game"):
+        gui = HangmanGUI()
+    gui.timer_label = Mock()
+    gui.game = HangmanGame("python", seconds_per_turn=60)
+    cpu = time.process_time()
+    start(gui)
+    root.run(seconds)
+    cpu = time.process_time() - cpu
+    gui.timer_running = False
+    print(f"{label:>10}: {root.wakeups / seconds:5.1f} wakeups/s, "
+          f"{gui.timer_label.config.call_count / seconds:5.1f} redraws/s, "
+          f"{cpu / seconds * 100:.2f}% CPU")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    seconds = float(argv[0]) if argv else 3.0
+    measure("threads", legacy_start_timer, seconds)
+    measure("after()", HangmanGUI.start_timer, seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Leaderboard with many players: score updates per second, rank and top-10
+query time for the blocked SortedScores against one flat bisect-sorted
+list (whose inserts and deletes move half the list on average), plus
+replay time of a write-ahead log with one line per player.
+
+    python benchmarks/bench_leaderboard.py [players]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from bisect import bisect_left, insort
+
+from hangman.leaderboard import Leaderboard, SortedScores
+
+
+class FlatScores:
+    def __init__(self):
+        self.keys = []
+
+    def add(self, key):
+        insort(self.keys, key)
+
+    def remove(self, key):
+        del self.keys[bisect_left(self.keys, key)]
+
+    def rank(self, key):
+        return bisect_left(self.keys, key)
+
+    def top(self, k):
+        return self.keys[:k]
+
+
+def measure(scores, best, rng, updates):
+    names = list(best)
+    start = time.perf_counter()
+    for _ in range(updates):
+        player = rng.choice(names)
+        old = best[player]
+        best[player] = new = old + rng.randrange(1, 50)
+        scores.remove((-old, player))
+        scores.add((-new, player))
+    update = (time.perf_counter() - start) / updates
+    start = time.perf_counter()
+    for _ in range(updates):
+        player = rng.choice(names)
+        scores.rank((-best[player], player))
+    rank = (time.perf_counter() - start) / updates
+    start = time.perf_counter()
+    for _ in range(updates):
+        scores.top(10)
+    top = (time.perf_counter() - start) / updates
+    return update, rank, top
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 1_000_000
+    rng = random.Random(1)
+    best = {f"player{i}": rng.randrange(10_000) for i in range(n)}
+    keys = sorted((-score, player) for player, score in best.items())
+    print(f"{n:,} players{'':<6} {'update':>10} {'rank':>10} {'top-10':>10}")
+    for label, scores in (("FlatScores", FlatScores()), ("SortedScores", SortedScores())):
+        for key in keys:  # 已排序，两者都是追加
+            scores.add(key)
+        update, rank, top = measure(scores, dict(best), random.Random(2), 20_000)
+        print(f"{label:<16} {update * 1e6:>8.2f}us {rank * 1e6:>8.2f}us {top * 1e6:>8.2f}us")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scores.wal")
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(f'["{player}",{score}]\n' for player, score in best.items())
+        start = time.perf_counter()
+        board = Leaderboard(path)
+        print(f"replay {len(board):,} log lines: {time.perf_counter() - start:.2f}s")
+        start = time.perf_counter()
+        for i in range(20_000):
+            board.submit(f"player{i}", 20_000 + i)
+        print(f"Leaderboard.submit with log: {(time.perf_counter() - start) / 20_000 * 1e6:.2f}us")
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
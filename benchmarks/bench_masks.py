@@ -0,0 +1,81 @@
+"""
+Masked-answer rendering across many sessions sharing a word list. Each
+session makes eight random guesses and renders its display after each:
+
+    per-char loop   the original masked_answer (rebuilds every time)
+    list join       per-state character list patched on a hit, then joined
+                    (what HangmanState did before the shared cache)
+    MaskCache       guessed mask updated on a hit, then one cache lookup
+
+Also reports how many distinct display strings the sessions hold at the
+end, and the cache's hit rate and evictions.
+
+    python benchmarks/bench_masks.py [sessions] [cache size]
+"""
+import random
+import sys
+import time
+
+from hangman.engine import REVEAL_CHAR, MaskCache, _answer_index, letter_bit
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def per_char(answer, guessed):
+    out = []
+    for ch in answer:
+        if ch.isalpha():
+            out.append(ch if ch.lower() in guessed else REVEAL_CHAR)
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 100_000
+    maxsize = int(argv[1]) if len(argv) > 1 else 65536
+    rng = random.Random(1)
+    answers = BASIC_WORDS + INTERMEDIATE_PHRASES
+    sessions = [(rng.choice(answers), rng.sample("etaoinshrdlcumwfgypbvkjxqz", 8)) for _ in range(n)]
+    cache = MaskCache(maxsize)
+
+    def per_char_session(answer, letters):
+        guessed, shown = set(), None
+        for letter in letters:
+            guessed.add(letter)
+            shown = per_char(answer, guessed)
+        return shown
+
+    def list_join_session(answer, letters):
+        positions, _, _, blank, _ = _answer_index(answer)
+        masked, shown = list(blank), None
+        for letter in letters:
+            for p in positions.get(letter, ()):
+                masked[p] = answer[p]
+            shown = "".join(masked)
+        return shown
+
+    def cached_session(answer, letters):
+        positions, answer_mask, _, _, _ = _answer_index(answer)
+        mask, shown = 0, None
+        for letter in letters:
+            mask |= letter_bit(letter)
+            shown = cache.get(answer, mask & answer_mask)
+        return shown
+
+    for label, play in (("per-char loop", per_char_session), ("list join", list_join_session),
+                        ("MaskCache", cached_session)):
+        start = time.perf_counter()
+        held = [play(answer, letters) for answer, letters in sessions]
+        elapsed = time.perf_counter() - start
+        distinct = {id(s): s for s in held}
+        size = sum(sys.getsizeof(s) for s in distinct.values())
+        print(f"{label:<14} {elapsed / (n * 8) * 1e9:6.0f} ns/guess+render  "
+              f"{len(distinct):>7} distinct strings held ({size / 2 ** 20:.1f} MiB)")
+    stats = cache.stats()
+    print(f"cache {stats['size']}/{maxsize} entries, hit rate {stats['hit_rate']:.1%}, "
+          f"{stats['evictions']} evictions")
+
+
+if __name__ == "__main__":
+    main()
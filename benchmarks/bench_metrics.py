@@ -0,0 +1,58 @@
+"""
+Cost of instrumentation on the engine hot path: one full game of guesses
+plus masked_answer and tick calls, timed before metrics.enable(), while
+enabled, and after metrics.disable(), and the memory allocated per
+Histogram.observe (should be none).
+
+    python benchmarks/bench_metrics.py [repeat]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from hangman import metrics
+from hangman.engine import HangmanGame
+
+LETTERS = "etaoinshrdlucmfwypvbgkqjxz"
+
+
+def play():
+    game = HangmanGame("programming", lives=30)
+    game.start_turn(0.0)
+    for letter in LETTERS:
+        game.tick(0.5)
+        game.state.masked_answer()
+        game.guess(letter)
+
+
+def per_game(repeat):
+    return min(timeit.repeat(play, number=repeat, repeat=5)) / repeat
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    repeat = int(argv[0]) if argv else 2000
+    off = per_game(repeat)
+    metrics.enable()
+    on = per_game(repeat)
+    metrics.disable()
+    after = per_game(repeat)
+    print(f"game of 26 turns   off {off * 1e6:7.1f}us   on {on * 1e6:7.1f}us "
+          f"({on / off - 1:+.0%})   disabled again {after * 1e6:7.1f}us ({after / off - 1:+.0%})")
+
+    h = metrics.Histogram()
+    values = [1e-6 * (i % 97 + 1) for i in range(100_000)]
+    for value in values:  # 预热
+        h.observe(value)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for value in values:
+        h.observe(value)
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    observe = min(timeit.repeat(lambda: h.observe(3e-6), number=100_000, repeat=5)) / 100_000
+    print(f"Histogram.observe  {observe * 1e9:.0f}ns, {allocated} bytes retained after {len(values):,} samples")
+
+
+if __name__ == "__main__":
+    main()
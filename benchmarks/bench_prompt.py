@@ -0,0 +1,87 @@
+"""
+Wakeups, writes and bytes per CLI turn: 100 ms polling loop vs selectors.
+Feeds stdin through a pipe that receives a letter after a delay and
+counts select/selector calls, stdout write/flush calls and bytes.
+
+    python benchmarks/bench_prompt.py [answer_after_seconds]
+"""
+import os
+import select
+import selectors
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+from hangman import cli
+
+
+def legacy_prompt_with_timer(prompt, timeout):
+    """The previous implementation, kept here for comparison"""
+    start_time = time.monotonic()
+    sys.stdout.write(f"\r{prompt}[{timeout}s] ")
+    sys.stdout.flush()
+    while True:
+        elapsed = time.monotonic() - start_time
+        remaining = max(0, timeout - int(elapsed))
+        if remaining == 0:
+            sys.stdout.write("\r" + " " * 50 + "\r")
+            return ""
+        sys.stdout.write(f"\r{prompt}[{remaining}s] ")
+        sys.stdout.flush()
+        r, _, _ = select.select([sys.stdin], [], [], 0.1)
+        if r:
+            result = sys.stdin.readline().rstrip("\r\n")
+            sys.stdout.write("\r" + " " * 50 + "\r")
+            return result
+
+
+class CountingStdout:
+    def __init__(self):
+        self.writes = self.flushes = self.bytes = 0
+
+    def write(self, text):
+        self.writes += 1
+        self.bytes += len(text.encode())
+
+    def flush(self):
+        self.flushes += 1
+
+
+def measure(label, prompt, delay):
+    r, w = os.pipe()
+    stdin = os.fdopen(r)
+    out = CountingStdout()
+    calls = {"select": 0}
+    real_select = select.select
+    real_selector_select = selectors.DefaultSelector.select
+
+    def counting_select(*args, **kwargs):
+        calls["select"] += 1
+        return real_select(*args, **kwargs)
+
+    def counting_selector_select(self, *args, **kwargs):
+        calls["select"] += 1
+        return real_selector_select(self, *args, **kwargs)
+
+    threading.Timer(delay, os.write, (w, b"e\n")).start()
+    with patch.object(sys, "stdin", stdin), patch.object(sys, "stdout", out), \
+         patch("select.select", counting_select), \
+         patch.object(selectors.DefaultSelector, "select", counting_selector_select):
+        prompt("Enter a letter: ", 15)
+    stdin.close()
+    os.close(w)
+    print(f"{label:>9}: {calls['select']:3d} select calls, {out.writes:3d} writes, "
+          f"{out.flushes:3d} flushes, {out.bytes:5d} bytes per turn")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    delay = float(argv[0]) if argv else 4.5
+    print(f"answer typed after {delay}s:")
+    measure("polling", legacy_prompt_with_timer, delay)
+    measure("selectors", cli.prompt_with_timer, delay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Replay throughput.
+Records N synthetic sessions (random guesses, occasional slow turns),
+writes them to a session log and replays the log in batches.
+
+    python benchmarks/bench_replay.py [sessions] [workers]
+"""
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+from hangman.replay import RecordingGame, SessionLog, iter_sessions, replay_all
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def record(rng, answer):
+    game = RecordingGame(answer, lives=6, seconds_per_turn=15)
+    now = 0.0
+    letters = iter(rng.sample(string.ascii_lowercase, 26))
+    while game.state.status() == "playing":
+        game.start_turn(now)
+        now += rng.expovariate(1 / 6)
+        if not game.tick(now):
+            game.guess(next(letters))
+    return game
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 100_000
+    workers = int(argv[1]) if len(argv) > 1 else 1
+    rng = random.Random(0)
+    corpus = BASIC_WORDS + INTERMEDIATE_PHRASES
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sessions.log")
+        with SessionLog(path, batch_size=1000) as log:
+            for _ in range(n):
+                log.append(record(rng, rng.choice(corpus)))
+        start = time.perf_counter()
+        total, diverged = replay_all(iter_sessions(path), workers=workers)
+        elapsed = time.perf_counter() - start
+    print(f"{total} sessions replayed in {elapsed:.2f}s ({total / elapsed:,.0f}/s, "
+          f"{workers} workers), {len(diverged)} diverged")
+
+
+if __name__ == "__main__":
+    main()
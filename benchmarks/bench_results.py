@@ -0,0 +1,53 @@
+"""
+Result log write cost and streaming summary throughput.
+Appends N records through ResultLog, then summarizes the file while
+tracking peak memory to show it does not grow with the number of games.
+
+    python benchmarks/bench_results.py [records]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from hangman.results import GameResult, ResultLog, summarize
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 500_000
+    rng = random.Random(0)
+    corpus = BASIC_WORDS + INTERMEDIATE_PHRASES
+    records = [GameResult(rng.choice(corpus), "basic", rng.random() < 0.7, rng.randint(0, 6),
+                          rng.randrange(-30, 120, 5), rng.randint(0, 10), rng.randint(0, 6),
+                          "etaoinshr", rng.uniform(5, 120)) for _ in range(n)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.log")
+        start = time.perf_counter()
+        with ResultLog(path) as log:
+            for r in records:
+                log.append(r)
+        write = time.perf_counter() - start
+        del records
+
+        for limit in (n // 10, n):
+            sub = os.path.join(tmp, f"part-{limit}.log")
+            with open(path) as src, open(sub, "w") as dst:
+                for i, line in zip(range(limit), src):
+                    dst.write(line)
+            tracemalloc.start()
+            start = time.perf_counter()
+            summary = summarize(sub)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"summarize {summary.games:>9,} records: {summary.games / elapsed:,.0f} records/s, "
+                  f"peak {peak / 1024:,.0f} KiB")
+        print(f"append: {write / n * 1e6:.2f} us/record ({os.path.getsize(path) / n:.0f} bytes/record)")
+
+
+if __name__ == "__main__":
+    main()
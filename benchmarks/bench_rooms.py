@@ -0,0 +1,76 @@
+"""
+Room fan-out without sockets: thousands of rooms with hundreds of players
+each, every room receiving a burst of guesses per loop iteration. Reports
+guesses applied per second and bytes written per player per guess, with
+delta lines against re-sending the full "Word: ... Lives: ..." line.
+
+    python benchmarks/bench_rooms.py [rooms] [players] [guesses per burst]
+"""
+import asyncio
+import random
+import string
+import sys
+import time
+
+from hangman.engine import HangmanGame
+from hangman.rooms import Room
+from hangman.words import INTERMEDIATE_PHRASES
+
+
+class _Transport:
+    def get_write_buffer_size(self):
+        return 0
+
+
+class CountingWriter:
+    __slots__ = ("bytes",)
+    transport = _Transport()
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+
+
+async def run(rooms, players, burst):
+    rng = random.Random(1)
+    all_rooms = []
+    for r in range(rooms):
+        room = Room(str(r), lambda: HangmanGame(rng.choice(INTERMEDIATE_PHRASES), lives=26))
+        for p in range(players):
+            room.join(CountingWriter(), f"p{p}")
+        all_rooms.append(room)
+    joined = sum(w.bytes for room in all_rooms for w in room.players)
+
+    guesses = full = 0
+    start = time.perf_counter()
+    for _ in range(10):
+        for room in all_rooms:
+            writers = list(room.players)
+            for _ in range(burst):
+                room.submit(rng.choice(writers), rng.choice(string.ascii_lowercase))
+            guesses += burst
+            state = room.game.state
+            full += burst * len(f"Word: {state.masked_answer()} Lives: {state.lives}\n")
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    sent = sum(w.bytes for room in all_rooms for w in room.players) - joined
+    per_player = sent / (rooms * players)
+    print(f"{rooms} rooms x {players} players, bursts of {burst}: "
+          f"{guesses / elapsed:,.0f} guesses/s, {sent / elapsed / 2 ** 20:,.0f} MiB/s fanned out")
+    print(f"bytes per player per guess: delta {per_player / (guesses / rooms):.1f}, "
+          f"full mask {full / guesses:.1f}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    rooms = int(argv[0]) if argv else 2000
+    players = int(argv[1]) if len(argv) > 1 else 200
+    burst = int(argv[2]) if len(argv) > 2 else 5
+    asyncio.run(run(rooms, players, burst))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Guess latency of the asyncio server with many idle sessions open.
+Opens N idle connections (each parked at its first prompt), then one
+active client plays games and records per-guess round-trip latency.
+
+    python benchmarks/bench_server.py [idle_sessions] [guesses]
+"""
+import asyncio
+import resource
+import statistics
+import string
+import sys
+import time
+
+from hangman.server import HangmanServer, PLAY_AGAIN, PROMPT
+
+
+async def read_until(reader, *markers):
+    while True:
+        line = (await reader.readline()).decode().rstrip("\n")
+        if line in markers:
+            return line
+
+
+async def run(idle, guesses):
+    server = HangmanServer(seconds_per_turn=3600, answer_source=lambda level: "artificial intelligence")
+    await server.start()
+    idle_conns = []
+    for _ in range(idle):
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        idle_conns.append((reader, writer))
+    for reader, _ in idle_conns:
+        await read_until(reader, PROMPT)
+    print(f"{server.sessions} sessions open")
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    await read_until(reader, PROMPT)
+    latencies = []
+    letters = iter(string.ascii_lowercase * (guesses // 26 + 1))
+    while len(latencies) < guesses:
+        start = time.perf_counter()
+        writer.write(f"{next(letters)}\n".encode())
+        marker = await read_until(reader, PROMPT, PLAY_AGAIN)
+        latencies.append(time.perf_counter() - start)
+        if marker == PLAY_AGAIN:
+            writer.write(b"y\n")
+            await read_until(reader, PROMPT)
+
+    latencies.sort()
+    q = statistics.quantiles(latencies, n=100)
+    print(f"guess latency p50 {q[49] * 1e3:.3f} ms  p95 {q[94] * 1e3:.3f} ms  p99 {q[98] * 1e3:.3f} ms")
+    for _, w in idle_conns + [(reader, writer)]:
+        w.close()
+    while server.sessions:
+        await asyncio.sleep(0.01)
+    server.server.close()
+    await server.server.wait_closed()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    idle = int(argv[0]) if argv else 10_000
+    guesses = int(argv[1]) if len(argv) > 1 else 2_000
+    # 客户端和服务端在同一进程，每个会话占两个文件描述符
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    want = 2 * idle + 100
+    if hard != resource.RLIM_INFINITY and want > hard:
+        sys.exit(f"need {want} file descriptors, hard limit is {hard}")
+    if soft < want:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (want, hard))
+    asyncio.run(run(idle, guesses))
+
+
+if __name__ == "__main__":
+    main()
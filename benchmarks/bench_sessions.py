@@ -0,0 +1,50 @@
+"""
+Memory per parked session, measured with tracemalloc: HangmanGame (with
+its HangmanState) against CompactSession. Sessions are measured fresh
+with a turn running and mid-game after a few guesses; answers come from
+the built-in list, so they are shared in both cases.
+
+    python benchmarks/bench_sessions.py [sessions]
+"""
+import sys
+import timeit
+import tracemalloc
+
+from hangman.engine import HangmanGame
+from hangman.session import CompactSession
+from hangman.words import BASIC_WORDS
+
+
+def bytes_per_session(factory, guesses, n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [None] * n  # 列表本身不计入
+    list_size = tracemalloc.get_traced_memory()[0] - before
+    for i in range(n):
+        session = factory(BASIC_WORDS[i % len(BASIC_WORDS)])
+        session.start_turn(86_400.0 + i / 1000)
+        for letter in guesses:
+            session.guess(letter)
+        sessions[i] = session
+    used = tracemalloc.get_traced_memory()[0] - before - list_size
+    tracemalloc.stop()
+    return used / n
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 200_000
+    print(f"{n} sessions{'':<14} {'fresh':>10} {'mid-game':>10}")
+    for label, factory in (("HangmanGame", HangmanGame), ("CompactSession", CompactSession)):
+        fresh = bytes_per_session(factory, "", n)
+        mid = bytes_per_session(factory, "ztoe", n)
+        print(f"{label:<30} {fresh:8.0f} B {mid:8.0f} B")
+
+    for label, factory in (("HangmanGame", HangmanGame), ("CompactSession", CompactSession)):
+        per_game = min(timeit.repeat(lambda: [factory("python").guess(c) for c in "ztyponh"],
+                                     number=20_000, repeat=3)) / 20_000
+        print(f"{label:<30} {per_game * 1e6:8.2f} us per 7-guess game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Snapshot size and speed against pickle.
+Saves N in-progress sessions with save_states and with pickle, then
+loads everything back and reads single sessions through mmap.
+
+    python benchmarks/bench_snapshot.py [sessions]
+"""
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from hangman.engine import HangmanGame
+from hangman.snapshot import SnapshotFile, load_states, save_states
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 200_000
+    rng = random.Random(0)
+    states = []
+    for _ in range(n):
+        g = HangmanGame(rng.choice(BASIC_WORDS + INTERMEDIATE_PHRASES))
+        for letter in rng.sample("etaoinsrhl", 3):
+            g.guess(letter)
+        g.start_turn(0.0)
+        states.append(g.state)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snap_path = os.path.join(tmp, "sessions.bin")
+        pickle_path = os.path.join(tmp, "sessions.pickle")
+
+        start = time.perf_counter()
+        save_states(snap_path, states, now=1.0)
+        snap_save = time.perf_counter() - start
+        start = time.perf_counter()
+        with open(pickle_path, "wb") as f:
+            pickle.dump(states, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle_save = time.perf_counter() - start
+
+        start = time.perf_counter()
+        load_states(snap_path)
+        snap_load = time.perf_counter() - start
+        start = time.perf_counter()
+        with open(pickle_path, "rb") as f:
+            pickle.load(f)
+        pickle_load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with SnapshotFile(snap_path) as snap:
+            for i in range(0, n, max(1, n // 1000)):
+                snap.state(i)
+        single = (time.perf_counter() - start) / min(n, 1000)
+
+        for label, path, save, load in (("snapshot", snap_path, snap_save, snap_load),
+                                        ("pickle", pickle_path, pickle_save, pickle_load)):
+            print(f"{label:>8}: {os.path.getsize(path) / n:6.1f} bytes/session, "
+                  f"save {save:.2f}s, load {load:.2f}s")
+        print(f"single session via mmap: {single * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Solver throughput and quality.
+Plays every word of a list once per strategy and reports solves per
+second and average wrong guesses per word.
+
+    python benchmarks/bench_solver.py [wordlist.txt] [--lives N]
+"""
+import argparse
+import time
+
+from hangman.engine import HangmanGame
+from hangman.solver import STRATEGIES, Solver, WordIndex, play
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def load_words(path):
+    with open(path, encoding="utf-8") as f:
+        return [w.strip().lower() for w in f if w.strip() and w.strip().isascii()]
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser()
+    p.add_argument("wordlist", nargs="?")
+    p.add_argument("--lives", type=int, default=26)
+    p.add_argument("--limit", type=int, default=2000, help="words to solve per strategy")
+    a = p.parse_args(argv)
+    words = load_words(a.wordlist) if a.wordlist else BASIC_WORDS + INTERMEDIATE_PHRASES
+
+    start = time.perf_counter()
+    index = WordIndex(words)
+    print(f"index: {len(words)} words in {time.perf_counter() - start:.3f}s")
+    sample = words[:: max(1, len(words) // a.limit)]
+    for strategy in STRATEGIES:
+        solver = Solver(index, strategy=strategy, seed=0)
+        wrong = wins = 0
+        start = time.perf_counter()
+        for answer in sample:
+            game = HangmanGame(answer, lives=a.lives)
+            play(game, solver)
+            wrong += game.state.get_wrong_guesses()
+            wins += game.state.is_won()
+        elapsed = time.perf_counter() - start
+        print(f"{strategy:>9}: {len(sample) / elapsed:,.0f} solves/s, "
+              f"{wrong / len(sample):.2f} wrong guesses/word, "
+              f"{wins / len(sample):.0%} won")
+
+
+if __name__ == "__main__":
+    main()
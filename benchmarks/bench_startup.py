@@ -0,0 +1,60 @@
+"""
+Startup cost of the CLI.
+Reports `python -X importtime` totals for importing hangman.cli (with and
+without the GUI module, which the package used to import eagerly) and the
+wall time from launching run_hangman.py to its first prompt.
+
+    python benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time_us(code):
+    """Sum of top-level cumulative import times reported by -X importtime"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # 只累加顶层导入
+            total += int(cumulative)
+    return total
+
+
+def time_to_first_prompt():
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, "run_hangman.py")], cwd=ROOT,
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    buf = b""
+    while b"Enter a letter" not in buf:
+        chunk = os.read(proc.stdout.fileno(), 4096)
+        if not chunk:
+            break
+        buf += chunk
+    elapsed = time.perf_counter() - start
+    proc.kill()
+    proc.wait()
+    return elapsed
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    runs = int(argv[0]) if argv else 5
+    for label, code in (("import hangman.cli", "import hangman.cli"),
+                        ("  + hangman.gui", "import hangman.cli, hangman.gui")):
+        samples = [import_time_us(code) for _ in range(runs)]
+        print(f"{label:<20} {statistics.median(samples) / 1000:7.1f} ms (median importtime)")
+    samples = [time_to_first_prompt() for _ in range(runs)]
+    print(f"{'first prompt':<20} {statistics.median(samples) * 1000:7.1f} ms (run_hangman.py, CLI mode)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Timing wheel cost with many armed turn timers.
+Arms N games with spread-out deadlines, cancels a tenth of them (as if
+the player answered), then advances virtual time to fire the rest and
+compares against polling game.tick() on every game every 100 ms.
+
+    python benchmarks/bench_timers.py [timers]
+"""
+import random
+import sys
+import time
+
+from hangman.engine import HangmanGame
+from hangman.timers import TurnTimers
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    n = int(argv[0]) if argv else 100_000
+    rng = random.Random(0)
+    games = [HangmanGame("timeout", lives=1, seconds_per_turn=rng.randint(5, 30)) for _ in range(n)]
+
+    fired = []
+    timers = TurnTimers(fired.extend, resolution=0.1)
+    start = time.perf_counter()
+    for g in games:
+        timers.arm(g, 0.0)
+    arm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for g in games[::10]:
+        timers.cancel(g)
+    cancel = time.perf_counter() - start
+
+    start = time.perf_counter()
+    now, batches = 0.0, 0
+    while len(timers):
+        now += 0.1
+        batches += bool(timers.advance(now))
+    fire = time.perf_counter() - start
+    print(f"arm:    {arm / n * 1e9:,.0f} ns/timer")
+    print(f"cancel: {cancel / (n // 10) * 1e9:,.0f} ns/timer")
+    print(f"fire:   {fire / len(fired) * 1e9:,.0f} ns/timer "
+          f"({len(fired)} timeouts in {batches} batches over {now:.0f}s virtual)")
+
+    # 对照：每 100ms 对每个游戏调用一次 tick()
+    games = [HangmanGame("timeout", lives=1, seconds_per_turn=rng.randint(5, 30)) for _ in range(n)]
+    for g in games:
+        g.start_turn(0.0)
+    start = time.perf_counter()
+    for step in range(10):
+        for g in games:
+            g.tick(step * 0.1)
+    poll = (time.perf_counter() - start) / 10
+    print(f"polling every game: {poll * 1e3:,.1f} ms per 100 ms step "
+          f"(wheel: {fire / (now / 0.1) * 1e3:,.2f} ms per step)")
+
+
+if __name__ == "__main__":
+    main()
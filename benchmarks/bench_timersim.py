@@ -0,0 +1,36 @@
+"""
+Throughput of the timer simulator in turns per minute on one core, per
+solver strategy, with and without the policy cache (random always asks
+the solver), for a few numbers of concurrent players (heap size).
+
+    python benchmarks/bench_timersim.py [games]
+"""
+import sys
+import time
+
+from hangman.solver import Solver
+from hangman.timersim import LogNormal, simulate
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    games = int(argv[0]) if argv else 20_000
+    words = BASIC_WORDS + INTERMEDIATE_PHRASES
+    response = LogNormal(4.0, 0.8)
+    print(f"{games} games, 8s turns, 6 lives")
+    for strategy in ("frequency", "partition", "random"):
+        solver = Solver(words, strategy=strategy)
+        for players, cached in ((1000, True), (1000, False), (100_000, True)):
+            policy = None if cached else (lambda game, wrong: solver.next_guess(game.state.masked_answer(), wrong))
+            if strategy == "random" and not cached:
+                continue
+            start = time.perf_counter()
+            stats = simulate(words, 8, 6, response, solver, games, players, seed=1, policy=policy)
+            elapsed = time.perf_counter() - start
+            label = strategy if strategy == "random" else f"{strategy} {'cached' if cached else 'uncached'}"
+            print(f"{label:<20} {players:>7} players  {stats.turns / elapsed * 60:>12,.0f} turns/min")
+
+
+if __name__ == "__main__":
+    main()
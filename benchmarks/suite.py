@@ -0,0 +1,319 @@
+"""
+Benchmark suite for the main paths, with stored baselines and a
+regression gate.
+
+Each benchmark is calibrated so one sample takes about --sample-time
+seconds, then sampled --samples times, round-robin across benchmarks and
+spread over --processes fresh interpreters (differences between
+processes, such as memory layout and hash seeds, are part of the noise
+being tested against); results are seconds per operation.
+
+`save` stores them as benchmarks/baselines/<fingerprint>.json, where the
+fingerprint hashes the CPU, core count, OS and Python build, so numbers
+are only ever compared with numbers from the same kind of machine.
+`compare` measures again (or loads --results) and flags a benchmark when
+its median is more than --threshold slower than the baseline and a
+one-sided Mann-Whitney U test says the slowdown is significant at
+--alpha. It exits 1 when anything regressed.
+
+    PYTHONPATH=. python benchmarks/suite.py run
+    PYTHONPATH=. python benchmarks/suite.py save
+    PYTHONPATH=. python benchmarks/suite.py compare --only guess,masked_answer
+"""
+import argparse
+import contextlib
+import gc
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from hangman import cli
+from hangman.engine import HangmanGame
+from hangman.profiling import run_cli_session
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+LETTERS = "etaoinshrdlucmfwypvbgkqjxz"
+ANSWER = "programming"
+
+
+# 每个基准接收操作次数 n，返回每次操作的秒数
+def bench_guess(n):
+    games = [HangmanGame(ANSWER, lives=30) for _ in range(max(1, n // len(LETTERS)))]
+    start = time.perf_counter()
+    for game in games:
+        for letter in LETTERS:
+            game.guess(letter)
+    return (time.perf_counter() - start) / (len(games) * len(LETTERS))
+
+
+def _mid_game():
+    game = HangmanGame(ANSWER, lives=30)
+    for letter in "rgz":
+        game.guess(letter)
+    return game
+
+
+def bench_masked_answer(n):
+    state = _mid_game().state
+    start = time.perf_counter()
+    for _ in range(n):
+        state.masked_answer()
+    return (time.perf_counter() - start) / n
+
+
+def bench_is_won(n):
+    state = _mid_game().state
+    start = time.perf_counter()
+    for _ in range(n):
+        state.is_won()
+    return (time.perf_counter() - start) / n
+
+
+def bench_tick(n):
+    game = _mid_game()
+    game.start_turn(0.0)
+    start = time.perf_counter()
+    for i in range(n):
+        game.tick(1.0)
+    return (time.perf_counter() - start) / n
+
+
+def bench_choose_answer(n):
+    start = time.perf_counter()
+    for _ in range(n):
+        cli.choose_answer("basic")
+    return (time.perf_counter() - start) / n
+
+
+def bench_cli_game(n):
+    """整局 CLI 游戏：脚本输入、虚拟时钟，打印输出写到 /dev/null"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        run_cli_session([], games=n)
+        return (time.perf_counter() - start) / n
+
+
+class _Label:
+    """Stand-in for a Tk label: config() records nothing"""
+
+    def config(self, **kwargs):
+        pass
+
+
+def bench_gui_update_display(n):
+    from hangman.gui import HangmanGUI  # 只有这个基准需要 tkinter
+    gui = HangmanGUI.__new__(HangmanGUI)  # 不创建 Tk 窗口
+    gui.game = _mid_game()
+    for name in ("word_label", "lives_label", "hint_label", "guessed_label", "correct_label", "wrong_label"):
+        setattr(gui, name, _Label())
+    start = time.perf_counter()
+    for _ in range(n):
+        gui.update_display()
+    return (time.perf_counter() - start) / n
+
+
+BENCHMARKS = {
+    "guess": bench_guess,
+    "masked_answer": bench_masked_answer,
+    "is_won": bench_is_won,
+    "tick": bench_tick,
+    "choose_answer": bench_choose_answer,
+    "cli_game": bench_cli_game,
+    "gui_update_display": bench_gui_update_display,
+}
+
+
+def fingerprint():
+    """机器指纹：CPU、核数、系统与 Python 构建"""
+    info = {
+        "machine": platform.machine(),
+        "processor": platform.processor() or _cpu_model(),
+        "cpus": os.cpu_count(),
+        "system": platform.system(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+    key = hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()[:12]
+    return key, info
+
+
+def _cpu_model():
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return ""
+
+
+def calibrate(fn, sample_time):
+    """选择 n，使一次采样约 sample_time 秒"""
+    n = 1
+    while fn(n) * n < sample_time / 4 and n < 1 << 24:
+        n *= 4
+    return max(1, int(n * sample_time / max(fn(n) * n, 1e-9)))
+
+
+def run_here(names, samples, sample_time):
+    """各基准轮流采样（机器状态的漂移均摊到所有基准），采样时关闭 GC（同 timeit）"""
+    sizes = {name: calibrate(BENCHMARKS[name], sample_time) for name in names}
+    values = {name: [] for name in names}
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            for name in names:
+                values[name].append(BENCHMARKS[name](sizes[name]))
+    finally:
+        if enabled:
+            gc.enable()
+    return {name: {"n": sizes[name], "samples": values[name]} for name in names}
+
+
+def run(names, samples, sample_time, processes=1):
+    """采样分摊到 processes 个子进程（包含进程间的差异，如内存布局与哈希种子）"""
+    if processes <= 1:
+        results = run_here(names, samples, sample_time)
+    else:
+        results = {name: {"n": [], "samples": []} for name in names}
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in range(processes):
+                path = os.path.join(tmp, f"{i}.json")
+                share = samples // processes + (i < samples % processes)
+                subprocess.run([sys.executable, os.path.abspath(__file__), "run", "--only", ",".join(names),
+                                "--samples", str(share), "--sample-time", str(sample_time),
+                                "--processes", "1", "--results", path],
+                               check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                with open(path, encoding="utf-8") as f:
+                    for name, result in json.load(f)["benchmarks"].items():
+                        results[name]["n"].append(result["n"])
+                        results[name]["samples"] += result["samples"]
+    for name, result in results.items():
+        result["median"] = median = statistics.median(result["samples"])
+        spread = statistics.stdev(result["samples"]) / median if len(result["samples"]) > 1 else 0.0
+        print(f"{name:<20} {format_time(median):>10}/op  (±{spread:.1%})", file=sys.stderr)
+    return results
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds * 1e9:.1f}ns"
+
+
+def mann_whitney_greater(a, b):
+    """单侧 Mann-Whitney U 检验（正态近似，含并列校正）：a 是否整体大于 b，返回 p 值"""
+    ranked = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(ranked)
+    ties = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    n1, n2 = len(a), len(b)
+    u = sum(r for r, (_, group) in zip(ranks, ranked) if group == 0) - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1))))
+    if sigma == 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / sigma  # 连续性校正
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(current, baseline, threshold, alpha):
+    """逐项比较，返回退化的基准名列表"""
+    regressed = []
+    print(f"{'benchmark':<20} {'baseline':>10} {'current':>10} {'change':>8} {'p':>8}")
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<20} {'-':>10} {format_time(statistics.median(result['samples'])):>10}   (no baseline)")
+            continue
+        current_median, base_median = statistics.median(result["samples"]), statistics.median(base["samples"])
+        change = current_median / base_median - 1
+        p = mann_whitney_greater(result["samples"], base["samples"])
+        flag = ""
+        if change > threshold and p < alpha:
+            flag = "  REGRESSION"
+            regressed.append(name)
+        elif change < -threshold and mann_whitney_greater(base["samples"], result["samples"]) < alpha:
+            flag = "  faster"
+        print(f"{name:<20} {format_time(base_median):>10} {format_time(current_median):>10} "
+              f"{change:>+8.1%} {p:>8.4f}{flag}")
+    return regressed
+
+
+def baseline_path(directory):
+    return os.path.join(directory, f"{fingerprint()[0]}.json")
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Hangman benchmark suite")
+    p.add_argument("command", choices=["run", "save", "compare"])
+    p.add_argument("--only", help="comma-separated benchmarks (default: all)")
+    p.add_argument("--samples", type=int, default=20)
+    p.add_argument("--processes", type=int, default=4, help="spread the samples over this many processes")
+    p.add_argument("--sample-time", type=float, default=0.05, help="seconds per sample")
+    p.add_argument("--baseline-dir", default=BASELINE_DIR)
+    p.add_argument("--results", help="run: write results here; compare: use these instead of measuring")
+    p.add_argument("--threshold", type=float, default=0.10, help="ignore slowdowns below this fraction")
+    p.add_argument("--alpha", type=float, default=0.01, help="significance level")
+    a = p.parse_args(argv)
+    names = a.only.split(",") if a.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        p.error(f"unknown benchmarks: {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+    key, info = fingerprint()
+
+    if a.command == "compare":
+        path = baseline_path(a.baseline_dir)
+        if not os.path.exists(path):
+            p.error(f"no baseline for this machine ({key}); run `save` first")
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)["benchmarks"]
+        if a.results:
+            with open(a.results, encoding="utf-8") as f:
+                document = json.load(f)
+            if document["fingerprint"] != key:
+                p.error(f"{a.results} was measured on machine {document['fingerprint']}, not {key}")
+            current = {k: v for k, v in document["benchmarks"].items() if k in names}
+        else:
+            current = run(names, a.samples, a.sample_time, a.processes)
+        regressed = compare(current, baseline, a.threshold, a.alpha)
+        print(f"{len(regressed)} regression(s)" + (f": {', '.join(regressed)}" if regressed else ""))
+        return 1 if regressed else 0
+
+    document = {"fingerprint": key, "machine": info, "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "benchmarks": run(names, a.samples, a.sample_time, a.processes)}
+    path = a.results
+    if a.command == "save":
+        path = baseline_path(a.baseline_dir)
+        os.makedirs(a.baseline_dir, exist_ok=True)
+        if os.path.exists(path) and a.only:  # 只更新选中的基准
+            with open(path, encoding="utf-8") as f:
+                old = json.load(f)["benchmarks"]
+            document["benchmarks"] = {**old, **document["benchmarks"]}
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=1)
+        print(f"wrote {path} (machine {key})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,31 @@
-from .engine import HangmanGame, HangmanState
-
-# Optional GUI import (may not be available on all systems)
-try:
-    from .gui import HangmanGUI
-    GUI_AVAILABLE = True
-except ImportError:
-    GUI_AVAILABLE = False
+"""
+Hangman game package.
+Public names are imported lazily so that headless users (the CLI, tests,
+worker processes) never pay for importing the Tkinter GUI.
+"""
+import importlib
+from importlib.util import find_spec
+
+_LAZY = {
+    "HangmanGame": ".engine",
+    "HangmanState": ".engine",
+    "HangmanGUI": ".gui",
+}
+
+__all__ = ["GUI_AVAILABLE", *_LAZY]
+
+# Optional GUI (may not be available on all systems); checked without importing tkinter
+GUI_AVAILABLE = find_spec("tkinter") is not None and find_spec("_tkinter") is not None
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
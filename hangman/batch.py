@@ -0,0 +1,205 @@
+"""
+Vectorized Hangman engine for simulating many games at once.
+Each game is a row in a set of NumPy arrays; one call applies a guess
+(or a tick) to every game and gives the same results as HangmanGame.
+
+Answers are ASCII, so a guess of a letter outside a-z (such as "é") is
+always a miss. The first six distinct such letters get codes 26-31 in the
+guessed bitmask, so a repeated one is free, as in HangmanGame.
+"""
+from __future__ import annotations
+from typing import Dict, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from .engine import REVEAL_CHAR
+
+PLAYING, WON, LOST = 0, 1, 2
+STATUS_NAMES = ("playing", "won", "lost")
+
+PAD_CODE = 0        # padding after the end of an answer
+OTHER_CODE = 255    # spaces, hyphens and other non-letters (always shown)
+EXTRA_CODES = 6     # codes 26-31: letters outside a-z (always a miss)
+
+
+def encode_letters(letters: Sequence[str], extra: Optional[Dict[str, int]] = None) -> "np.ndarray":
+    """把一组单字母猜测转换为 0-25 的编码，无效输入为 -1；
+    给出 extra 时 a-z 以外的字母按 extra 编为 26-31（新字母追加进 extra）"""
+    out = np.full(len(letters), -1, dtype=np.int16)
+    for i, s in enumerate(letters):
+        if not s or len(s) != 1 or not s.isalpha():
+            continue
+        s = s.lower()
+        if "a" <= s <= "z":
+            out[i] = ord(s) - ord("a")
+        elif extra is not None:
+            code = extra.get(s)
+            if code is None:
+                if len(extra) == EXTRA_CODES:
+                    raise ValueError(f"HangmanBatch supports at most {EXTRA_CODES} distinct guesses outside a-z")
+                code = extra[s] = 26 + len(extra)
+            out[i] = code
+    return out
+
+
+_BITS = (np.uint32(1) << np.arange(26, dtype=np.uint32)) if HAS_NUMPY else None
+
+
+def _popcount32(values: "np.ndarray") -> "np.ndarray":
+    bits = np.unpackbits(values.astype("<u4").view(np.uint8).reshape(-1, 4), axis=1)
+    return bits.sum(axis=1, dtype=np.int32)
+
+
+class HangmanBatch:
+    """N independent Hangman games stored as arrays"""
+
+    def __init__(self, answers: Sequence[str], lives: Union[int, Sequence[int]] = 6,
+                 seconds_per_turn: Union[float, Sequence[float]] = 15):
+        if not HAS_NUMPY:
+            raise ImportError("HangmanBatch requires numpy")
+        # 相同答案只编码一次，每个游戏只保存答案编号
+        vocab: Dict[str, int] = {}
+        ids = [vocab.setdefault(a.lower(), len(vocab)) for a in answers]
+        self._setup(list(vocab), np.asarray(ids, dtype=np.int32), lives, seconds_per_turn)
+
+    @classmethod
+    def from_word_ids(cls, words: Sequence[str], ids: Union[Sequence[int], "np.ndarray"],
+                      lives: Union[int, Sequence[int]] = 6,
+                      seconds_per_turn: Union[float, Sequence[float]] = 15) -> "HangmanBatch":
+        """游戏 i 的答案为 words[ids[i]]：只编码词表，不逐个游戏处理字符串"""
+        if not HAS_NUMPY:
+            raise ImportError("HangmanBatch requires numpy")
+        ids = np.asarray(ids, dtype=np.int32)
+        if len(ids) and not (0 <= ids.min() and ids.max() < len(words)):
+            raise ValueError("word ids out of range")
+        batch = cls.__new__(cls)
+        batch._setup([w.lower() for w in words], ids, lives, seconds_per_turn)
+        return batch
+
+    def _setup(self, vocab: List[str], answer_id: "np.ndarray", lives, seconds_per_turn) -> None:
+        self.vocab = vocab
+        self.answer_id = answer_id
+        self.extra_letters: Dict[str, int] = {}  # a-z 以外的字母 -> 编码 26-31
+        n = len(answer_id)
+
+        width = max((len(a) for a in self.vocab), default=0)
+        try:
+            raw = b"".join(a.encode("ascii").ljust(width, b"\0") for a in self.vocab)
+        except UnicodeEncodeError:
+            raise ValueError("HangmanBatch only supports ASCII answers") from None
+        raw = np.frombuffer(raw, dtype=np.uint8).reshape(len(self.vocab), width)
+        is_letter = (raw >= ord("a")) & (raw <= ord("z"))
+
+        # 答案矩阵：1-26 为字母，255 为其他字符，0 为填充
+        self.codes = np.where(is_letter, raw - (ord("a") - 1),
+                              np.where(raw == 0, PAD_CODE, OTHER_CODE)).astype(np.uint8)
+        self.counts = np.zeros((len(self.vocab), 26), dtype=np.uint8)
+        for k in range(26):
+            self.counts[:, k] = (self.codes == k + 1).sum(axis=1)
+        vocab_mask = ((self.counts > 0).astype(np.uint32) * _BITS).sum(axis=1, dtype=np.uint32)
+        self.answer_mask = vocab_mask[self.answer_id]
+        self._flat_counts = self.counts.ravel()
+        self._count_base = self.answer_id.astype(np.intp) * 26
+
+        self.guessed = np.zeros(n, dtype=np.uint32)
+        self.lives = np.broadcast_to(np.asarray(lives, dtype=np.int32), (n,)).copy()
+        self.score = np.zeros(n, dtype=np.int32)
+        self.seconds_per_turn = np.broadcast_to(
+            np.asarray(seconds_per_turn, dtype=np.float64), (n,)).copy()
+        self.last_tick = np.full(n, np.nan, dtype=np.float64)
+        self.status = np.zeros(n, dtype=np.uint8)
+        self._update_status()
+
+    def __len__(self) -> int:
+        return len(self.answer_id)
+
+    def _update_status(self) -> None:
+        won = (self.answer_mask & ~self.guessed) == 0
+        self.status = np.where(won, np.uint8(WON), (self.lives <= 0) * np.uint8(LOST))
+        self._set_live()
+
+    def _set_live(self) -> None:
+        live = np.flatnonzero(self.status == PLAYING)
+        self._live = slice(None) if len(live) == len(self) else live
+
+    def start_turn(self, now: Union[float, "np.ndarray"], where: Optional["np.ndarray"] = None) -> None:
+        if where is None:
+            self.last_tick[:] = now
+        else:
+            self.last_tick[where] = np.broadcast_to(now, self.last_tick.shape)[where]
+
+    def tick(self, now: Union[float, "np.ndarray"]) -> "np.ndarray":
+        """对所有进行中的游戏执行 tick，返回哪些游戏超时"""
+        now = np.broadcast_to(np.asarray(now, dtype=np.float64), self.last_tick.shape)
+        playing = self.status == PLAYING
+        unset = playing & np.isnan(self.last_tick)
+        self.last_tick[unset] = now[unset]
+        with np.errstate(invalid="ignore"):
+            due = playing & ~unset & (now - self.last_tick >= self.seconds_per_turn)
+        self.lives -= due
+        self.last_tick[due] = now[due]
+        self._update_status()
+        return due
+
+    def guess(self, letters: Union[Sequence[str], "np.ndarray"]):
+        """对每个游戏猜一个字母（编码 0-25，26-31 见 extra_letters，负数表示本轮不猜）
+
+        返回 (ok, count) 两个数组，与 HangmanGame.guess 的返回值逐项一致。
+        """
+        if not isinstance(letters, np.ndarray) or letters.dtype.kind not in "iu":
+            letters = encode_letters(letters, self.extra_letters)
+        # 只处理仍在进行中的游戏；全部进行中时用切片避免复制
+        rows = self._live
+        code = letters[rows]
+        # 负数转成无符号后也 >= 32，一次比较即可排除
+        c = code.astype(np.uint32)
+        valid = c < 32
+        letter = c < 26  # 26-31 不在任何答案中
+        c *= valid
+        bit = np.left_shift(np.uint32(1), c)  # 移位比查 _BITS 表快得多
+        count = self._flat_counts[self._count_base[rows] + c * letter] * letter
+        hit = count > 0
+        guessed = self.guessed[rows]
+        new = valid & ((guessed & bit) == 0)
+        miss = new & ~hit
+        guessed |= bit * new
+        lives = self.lives[rows] - miss
+        self.guessed[rows] = guessed
+        self.lives[rows] = lives
+        self.score[rows] += (new * 10) - (miss * 15)
+        status = np.where((self.answer_mask[rows] & ~guessed) == 0,
+                          np.uint8(WON), (lives <= 0) * np.uint8(LOST))
+        self.status[rows] = status
+        if status.any():
+            self._set_live()
+
+        if isinstance(rows, slice):
+            return hit, count
+        out_hit = np.zeros(len(self), dtype=bool)
+        out_count = np.zeros(len(self), dtype=count.dtype)
+        out_hit[rows] = hit
+        out_count[rows] = count
+        return out_hit, out_count
+
+    def correct_guesses(self) -> "np.ndarray":
+        return _popcount32(self.guessed & self.answer_mask)
+
+    def wrong_guesses(self) -> "np.ndarray":
+        return _popcount32(self.guessed & ~self.answer_mask)
+
+    def answer(self, i: int) -> str:
+        return self.vocab[self.answer_id[i]]
+
+    def status_name(self, i: int) -> str:
+        return STATUS_NAMES[int(self.status[i])]
+
+    def masked_answer(self, i: int) -> str:
+        guessed = int(self.guessed[i])
+        return "".join(
+            ch if not ("a" <= ch <= "z") or guessed >> (ord(ch) - ord("a")) & 1 else REVEAL_CHAR
+            for ch in self.answer(i)
+        )
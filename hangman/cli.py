@@ -1,17 +1,45 @@
 from __future__ import annotations
-import argparse, random, sys, time
+import argparse, math, random, selectors, sys, time
 try:
     import select
     HAS_SELECT = True
 except ImportError:
     HAS_SELECT = False
-from typing import List
-from .engine import HangmanGame
-from .words import BASIC_WORDS, INTERMEDIATE_PHRASES
+from typing import TYPE_CHECKING, List, Mapping, Optional, Tuple
+from .dealer import DEFAULT_DEALER
+from .engine import MODES, HangmanGame
+if TYPE_CHECKING:
+    from .leaderboard import BackgroundSubmitter
+    from .replay import SessionLog
+    from .results import ResultLog
 
-def choose_answer(level: str) -> str:
-    rng = random.SystemRandom()
-    return rng.choice(BASIC_WORDS if level == "basic" else INTERMEDIATE_PHRASES)
+def choose_answer(level: str, rng: Optional[random.Random] = None,
+                  difficulty: Optional[Tuple[float, float]] = None) -> str:
+    """选择答案：默认从共享牌堆发词（用完前不重复）；传入 rng 时独立随机抽取；
+    传入 difficulty=(lo, hi) 时从该难度百分位范围内抽取"""
+    if difficulty is not None:
+        from .difficulty import level_index  # 只在按难度选词时加载（启动更快）
+        return level_index(level, corpus_path()).choose(*difficulty, rng=rng)
+    if rng is None:
+        return DEFAULT_DEALER.deal(level)
+    return rng.choice(DEFAULT_DEALER.levels[level])
+
+def corpus_path() -> Optional[str]:
+    """当前使用的编译语料路径；内置词表时为 None（用作各类索引的缓存键）"""
+    return getattr(DEFAULT_DEALER.levels, "path", None)
+
+def active_metrics():
+    """已启用的 Metrics；指标模块从未加载（没有 --metrics）时直接返回 None，不导入它"""
+    metrics = sys.modules.get(__package__ + ".metrics")
+    return None if metrics is None else metrics.active()
+
+def default_player() -> str:
+    """排行榜上的默认名字：登录名"""
+    import getpass
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):  # 没有 USER 等环境变量时
+        return "player"
 
 def ask_play_again() -> bool:
     """询问用户是否想要再次游玩"""
@@ -25,35 +53,42 @@ def ask_play_again() -> bool:
             print("Please enter 'y' for yes or 'n' for no.")
 
 def prompt_with_timer(prompt: str, timeout: int) -> str:
-    """带实时倒计时显示的输入提示"""
+    """带实时倒计时显示的输入提示
+
+    只在 stdin 可读或倒计时的秒数变化时醒来，秒数不变时不重写提示。
+    """
     if not HAS_SELECT:
         # Fallback for systems without select (like Windows)
         print(f"{prompt}(Timeout: {timeout}s) ", end="", flush=True)
         return input().rstrip("\r\n")
-    
-    import select
-    start_time = time.monotonic()
-    sys.stdout.write(f"\r{prompt}[{timeout}s] ")
-    sys.stdout.flush()
-    
-    while True:
-        elapsed = time.monotonic() - start_time
-        remaining = max(0, timeout - int(elapsed))
-        
-        if remaining == 0:
-            sys.stdout.write("\r" + " " * 50 + "\r")  # 清除行
-            return ""
-        
-        # 更新倒计时显示
-        sys.stdout.write(f"\r{prompt}[{remaining}s] ")
-        sys.stdout.flush()
-        
-        # 检查是否有输入
-        r, _, _ = select.select([sys.stdin], [], [], 0.1)
-        if r:
-            result = sys.stdin.readline().rstrip("\r\n")
-            sys.stdout.write("\r" + " " * 50 + "\r")  # 清除行
-            return result
+
+    deadline = time.monotonic() + timeout
+    shown = None
+    with selectors.DefaultSelector() as sel:
+        try:
+            sel.register(sys.stdin, selectors.EVENT_READ)
+            pollable = True
+        except (OSError, ValueError):  # 重定向自普通文件时 epoll 拒绝注册；普通文件总是可读
+            pollable = False
+        while True:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                sys.stdout.write("\r" + " " * 50 + "\r")  # 清除行
+                sys.stdout.flush()
+                return ""
+
+            # 更新倒计时显示（仅在显示的秒数变化时）
+            remaining = math.ceil(remaining_time)
+            if remaining != shown:
+                sys.stdout.write(f"\r{prompt}[{remaining}s] ")
+                sys.stdout.flush()
+                shown = remaining
+
+            # 睡到有输入或下一个整秒边界
+            if not pollable or sel.select(remaining_time - (remaining - 1)):
+                result = sys.stdin.readline().rstrip("\r\n")
+                sys.stdout.write("\r" + " " * 50 + "\r")  # 清除行
+                return result
 
 def prompt_with_timeout(prompt: str, timeout: int) -> str:
     sys.stdout.write(prompt); sys.stdout.flush()
@@ -66,32 +101,61 @@ def prompt_with_timeout(prompt: str, timeout: int) -> str:
         return sys.stdin.readline().rstrip("\r\n")
     return ""
 
-def play_single_game(level: str, lives: int = 6, seconds_per_turn: int = 15) -> int:
+def play_turn(game: HangmanGame, s: str, now: float, guesses: List[str]) -> None:
+    """处理一个回合的输入：先结算计时，再校验并提交字母"""
+    timed_out = game.tick(now)
+    if timed_out and not s:
+        print("Time's up! Life -1"); return
+    if not s: print("Try again."); return
+    
+    # 验证输入：只接受单个字母
+    user_input = s.strip().lower()
+    if len(user_input) != 1 or not user_input.isalpha():
+        print("Please enter a single letter only."); return
+        
+    ok, cnt = game.guess(user_input)
+    guesses.append(user_input)
+    print(("Correct +" if ok else "Wrong -"), cnt)
+
+def play_single_game(level: str, lives: int = 6, seconds_per_turn: int = 15,
+                     results: Optional[ResultLog] = None, sessions: Optional[SessionLog] = None,
+                     difficulty: Optional[Tuple[float, float]] = None, mode: str = "classic",
+                     leaderboard: Optional[BackgroundSubmitter] = None, player: str = "") -> int:
     """执行单次游戏"""
-    answer = choose_answer(level)
-    game = HangmanGame(answer=answer, lives=lives, seconds_per_turn=seconds_per_turn)
+    answer = choose_answer(level, difficulty=difficulty)
+    if sessions is not None:
+        from .replay import RecordingGame  # 只在 --record 时加载
+        game = RecordingGame(answer=answer, lives=lives, seconds_per_turn=seconds_per_turn)
+    elif mode == "classic":
+        game = HangmanGame(answer, lives, seconds_per_turn)
+    else:
+        from .evil import create_game  # evil 模式才加载（连同 solver 的索引）
+        game = create_game(mode, answer, level, lives, seconds_per_turn, corpus_path())
+    guesses: List[str] = []
+    started = time.monotonic()
     print("Welcome to Hangman! Level:", level)
     print(f"Hint: The word has {game.state.get_word_length()} letters.")
+    metrics = active_metrics()
     while game.state.status() == "playing":
         print("Word:", game.state.masked_answer(), "Lives:", game.state.lives)
-        game.start_turn(time.monotonic())
+        turn_started = time.monotonic()
+        game.start_turn(turn_started)
         s = prompt_with_timer("Enter a letter: ", seconds_per_turn)
-        timed_out = game.tick(time.monotonic())
-        if timed_out and not s:
-            print("Time's up! Life -1"); continue
-        if not s: print("Try again."); continue
-        
-        # 验证输入：只接受单个字母
-        user_input = s.strip().lower()
-        if len(user_input) != 1 or not user_input.isalpha():
-            print("Please enter a single letter only."); continue
-            
-        ok, cnt = game.guess(user_input)
-        print(("Correct +" if ok else "Wrong -"), cnt)
+        answered = time.monotonic()
+        play_turn(game, s, answered, guesses)
+        if metrics is not None:
+            metrics.observe_turn(answered - turn_started, time.monotonic() - answered)
+    if results is not None:
+        from .results import GameResult  # 只在 --results 时加载
+        results.append(GameResult.from_game(game, level, guesses, time.monotonic() - started))
+    if sessions is not None:
+        sessions.append(game)
+    if leaderboard is not None:
+        leaderboard.submit(player, game.state.score)  # 后台线程写入，不阻塞
     
     # 显示游戏结果和答案
     print("\n" + "="*50)
-    print("Answer:", answer)
+    print("Answer:", game.state.answer)
     
     # 显示游戏统计信息
     print("\nGame Statistics:")
@@ -106,25 +170,113 @@ def play_single_game(level: str, lives: int = 6, seconds_per_turn: int = 15) ->
     else:
         print("\nGame Over! You failed to guess the word.")
         print("Better luck next time!")
+    if leaderboard is not None:
+        print(f"Score {game.state.score} submitted to the leaderboard as {player}.")
     
     print("="*50)
     return 0 if game.state.is_won() else 1
 
-def run(level: str, lives: int = 6, seconds_per_turn: int = 15) -> int:
+def run(level: str, lives: int = 6, seconds_per_turn: int = 15,
+        results: Optional[ResultLog] = None, sessions: Optional[SessionLog] = None,
+        difficulty: Optional[Tuple[float, float]] = None, mode: str = "classic",
+        leaderboard: Optional[BackgroundSubmitter] = None, player: str = "") -> int:
     """主游戏循环，支持重新开始"""
     while True:
-        result = play_single_game(level, lives, seconds_per_turn)
+        result = play_single_game(level, lives, seconds_per_turn, results, sessions, difficulty, mode,
+                                  leaderboard, player)
         if not ask_play_again():
             print("Thanks for playing!")
             return result
 
+def start_metrics(path: Optional[str], interval: float = 10.0, port: Optional[int] = None):
+    """指定了快照文件或端口时启用指标并开始导出，返回 Exporter（否则 None）"""
+    if path is None and port is None:
+        return None
+    from .metrics import Exporter, enable  # 只在需要时加载
+    return Exporter(enable(), path, interval, port)
+
+def add_game_options(p: argparse.ArgumentParser, seconds: bool = True) -> None:
+    """--level/--lives/--seconds/--corpus，与其他工具（如 server、loadgen）共用；
+    没有回合计时的工具（rooms）传 seconds=False"""
+    p.add_argument("--level", default="basic", help="basic, intermediate or a level of --corpus")
+    p.add_argument("--lives", type=int, default=6)
+    if seconds:
+        p.add_argument("--seconds", type=int, default=15)
+    p.add_argument("--corpus", help="compiled word corpus (see python -m hangman.corpus)")
+
+def use_levels(p: argparse.ArgumentParser, corpus: Optional[str], level: str,
+               seed: Optional[int] = None) -> Mapping:
+    """打开 --corpus（若有）并校验 --level，出错时按用法错误退出；
+    指定语料时让共享牌堆改从语料发词，指定 seed 时重置牌堆"""
+    levels = DEFAULT_DEALER.levels
+    if corpus:
+        from .corpus import load_levels  # 只在 --corpus 时加载
+        try:
+            levels = load_levels(corpus)
+        except (OSError, ValueError) as e:
+            p.error(str(e))
+    if level not in levels:
+        p.error(f"unknown level {level!r} (choose from {', '.join(levels)})")
+    if corpus:
+        DEFAULT_DEALER.levels = levels
+    if corpus or seed is not None:
+        DEFAULT_DEALER.reseed(seed)
+    return levels
+
+
 def main(argv: List[str] | None = None) -> int:
     p = argparse.ArgumentParser()
-    p.add_argument("--level", choices=["basic","intermediate"], default="basic")
-    p.add_argument("--lives", type=int, default=6)
-    p.add_argument("--seconds", type=int, default=15)
+    add_game_options(p)
+    p.add_argument("--mode", choices=MODES, default="classic",
+                   help="evil: the answer keeps changing to dodge your guesses")
+    p.add_argument("--seed", type=int, help="seed the word deck for a reproducible run")
+    p.add_argument("--difficulty", help="easy, medium, hard or a percentile range such as 0.8-1.0")
+    p.add_argument("--results", help="append finished games to this result log")
+    p.add_argument("--record", help="append event streams of finished games to this session log")
+    p.add_argument("--leaderboard", help="submit scores to this leaderboard log")
+    p.add_argument("--player", help="name on the leaderboard (default: login name)")
+    p.add_argument("--metrics", help="write a metrics snapshot to this file (.prom: Prometheus text, else JSON)")
+    p.add_argument("--metrics-interval", type=float, default=10.0, help="seconds between metrics snapshots")
+    p.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on localhost:PORT/metrics")
     a = p.parse_args(argv)
-    return run(a.level, a.lives, a.seconds)
+    if a.mode != "classic" and a.record:
+        p.error("--record only supports --mode classic")
+    difficulty = None
+    if a.difficulty:
+        from .difficulty import parse_range
+        try:
+            difficulty = parse_range(a.difficulty)
+        except ValueError as e:
+            p.error(str(e))
+    use_levels(p, a.corpus, a.level, a.seed)
+    results = None
+    if a.results:
+        from .results import ResultLog  # 只在需要时加载（启动更快）
+        results = ResultLog(a.results)
+    sessions = None
+    if a.record:
+        from .replay import SessionLog  # 只在需要时加载（启动更快）
+        sessions = SessionLog(a.record)
+    leaderboard, player = None, ""
+    if a.leaderboard:
+        player = a.player or default_player()
+        from .leaderboard import BackgroundSubmitter, Leaderboard  # 只在需要时加载（启动更快）
+        leaderboard = BackgroundSubmitter(Leaderboard(a.leaderboard))
+    exporter = start_metrics(a.metrics, a.metrics_interval, a.metrics_port)
+    try:
+        return run(a.level, a.lives, a.seconds, results, sessions, difficulty, a.mode, leaderboard, player)
+    finally:
+        if exporter is not None:
+            exporter.close()
+        for log in (results, sessions):
+            if log is not None:
+                log.close()
+        if leaderboard is not None:
+            leaderboard.close()
+            rank = leaderboard.board.rank(player)
+            if rank is not None:
+                print(f"Leaderboard: {player} is #{rank} of {len(leaderboard.board)} "
+                      f"with a best score of {leaderboard.board.best[player]}")
 
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,235 @@
+"""
+Compiled word corpora.
+Plain-text word lists (one word or phrase per line) are compiled into a
+single binary file that is opened with mmap, so loading is O(1) and the
+pages are shared by every process that opens the same file. Words are
+decoded only when they are read.
+
+File layout (little endian):
+    header   magic(8s) word_count(Q) level_count(I) range_count(I)
+    levels   level_count x LEVEL   name, first word, end word
+    ranges   range_count x RANGE   level id, length, first word, end word
+    offsets  (word_count + 1) x uint64, into the string blob
+    blob     UTF-8 words, concatenated
+
+Within a level, words are sorted by length and then alphabetically, so
+each (level, length) pair is one contiguous range.
+
+    python -m hangman.corpus build corpus.hgc basic=words.txt phrases=phrases.txt
+    python -m hangman.corpus build corpus.hgc --builtin
+    python -m hangman.corpus info corpus.hgc
+"""
+from __future__ import annotations
+import argparse
+import mmap
+import struct
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .words import LEVELS
+
+MAGIC = b"HGCORP01"
+HEADER = struct.Struct("<8sQII")
+LEVEL = struct.Struct("<32sQQ")
+RANGE = struct.Struct("<IIQQ")
+OFFSET = struct.Struct("<Q")
+
+
+def read_wordlist(path: str) -> List[str]:
+    """读取纯文本词表：每行一个词或短语，忽略空行和 # 注释"""
+    with open(path, encoding="utf-8") as f:
+        return [w for w in (line.strip().lower() for line in f) if w and not w.startswith("#")]
+
+
+def compile_corpus(path: str, levels: Mapping) -> int:
+    """把 {等级: 词列表} 编译为二进制语料文件，返回写入的词数"""
+    words: List[bytes] = []
+    level_rows, range_rows = [], []
+    for level_id, (name, entries) in enumerate(levels.items()):
+        encoded = name.encode("utf-8")
+        if len(encoded) > LEVEL.size - 16:
+            raise ValueError(f"level name too long: {name!r}")
+        unique = sorted({w.strip().lower() for w in entries if w.strip()}, key=lambda w: (len(w), w))
+        start = len(words)
+        for i, word in enumerate(unique):
+            if i == 0 or len(word) != len(unique[i - 1]):
+                range_rows.append([level_id, len(word), start + i, start + i])
+            range_rows[-1][3] += 1
+        words += [w.encode("utf-8") for w in unique]
+        level_rows.append((encoded, start, len(words)))
+
+    out = bytearray(HEADER.pack(MAGIC, len(words), len(level_rows), len(range_rows)))
+    for row in level_rows:
+        out += LEVEL.pack(*row)
+    for row in range_rows:
+        out += RANGE.pack(*row)
+    position = 0
+    for blob in words:
+        out += OFFSET.pack(position)
+        position += len(blob)
+    out += OFFSET.pack(position)
+    with open(path, "wb") as f:
+        f.write(out)
+        f.write(b"".join(words))
+    return len(words)
+
+
+class CorpusView(Sequence):
+    """A read-only slice of a corpus; words are decoded on access"""
+
+    __slots__ = ("corpus", "start", "stop")
+
+    def __init__(self, corpus: "Corpus", start: int, stop: int):
+        self.corpus, self.start, self.stop = corpus, start, stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.corpus.word(self.start + j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.corpus.word(self.start + i)
+
+    def __iter__(self) -> Iterator[str]:
+        word = self.corpus.word
+        for i in range(self.start, self.stop):
+            yield word(i)
+
+    def __repr__(self) -> str:
+        return f"<CorpusView {self.corpus.path} [{self.start}:{self.stop}]>"
+
+
+class Corpus(Mapping):
+    """mmap-backed compiled corpus; a Mapping of level name to words like words.LEVELS"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < HEADER.size or self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compiled Hangman corpus")
+        _, self.word_count, level_count, range_count = HEADER.unpack_from(self._mm, 0)
+        pos = HEADER.size
+        self._levels: Dict[str, Tuple[int, int]] = {}
+        names = []
+        for _ in range(level_count):
+            name, start, end = LEVEL.unpack_from(self._mm, pos)
+            name = name.rstrip(b"\0").decode("utf-8")
+            names.append(name)
+            self._levels[name] = (start, end)
+            pos += LEVEL.size
+        self._ranges: Dict[Tuple[str, int], Tuple[int, int]] = {}
+        for _ in range(range_count):
+            level_id, length, start, end = RANGE.unpack_from(self._mm, pos)
+            self._ranges[names[level_id], length] = (start, end)
+            pos += RANGE.size
+        self._offsets = pos
+        self._blob = pos + (self.word_count + 1) * OFFSET.size
+
+    def __reduce__(self):
+        # 传给工作进程时只传路径，由子进程重新 mmap 同一文件
+        return open_corpus, (self.path,)
+
+    def word(self, i: int) -> str:
+        start, end = struct.unpack_from("<QQ", self._mm, self._offsets + i * OFFSET.size)
+        return self._mm[self._blob + start:self._blob + end].decode("utf-8")
+
+    def __getitem__(self, level: str) -> CorpusView:
+        start, end = self._levels[level]
+        return CorpusView(self, start, end)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._levels)
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def by_length(self, level: str, length: int) -> CorpusView:
+        """某等级中长度（字符数）为 length 的所有词"""
+        if level not in self._levels:
+            raise KeyError(level)
+        start, end = self._ranges.get((level, length), (0, 0))
+        return CorpusView(self, start, end)
+
+    def lengths(self, level: str) -> Dict[int, int]:
+        """某等级中 长度 -> 词数"""
+        return {n: end - start for (name, n), (start, end) in self._ranges.items() if name == level}
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "Corpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@lru_cache(maxsize=None)
+def open_corpus(path: str) -> Corpus:
+    """打开（并在进程内共享）一个编译好的语料文件"""
+    return Corpus(path)
+
+
+def load_levels(path: Optional[str] = None) -> Mapping:
+    """返回等级映射：不指定文件时使用内置词表"""
+    return LEVELS if path is None else open_corpus(path)
+
+
+def _parse_sources(specs: Iterable[str]) -> Dict[str, List[str]]:
+    levels: Dict[str, List[str]] = {}
+    for spec in specs:
+        name, sep, path = spec.partition("=")
+        if not sep:
+            raise ValueError(f"expected LEVEL=PATH, got {spec!r}")
+        levels.setdefault(name, []).extend(read_wordlist(path))
+    return levels
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Compile or inspect Hangman word corpora")
+    sub = p.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="compile plain-text word lists")
+    build.add_argument("output")
+    build.add_argument("sources", nargs="*", metavar="LEVEL=PATH")
+    build.add_argument("--builtin", action="store_true", help="include the built-in levels")
+    info = sub.add_parser("info", help="show the levels of a compiled corpus")
+    info.add_argument("path")
+    a = p.parse_args(argv)
+
+    if a.command == "build":
+        levels: Dict[str, List[str]] = {k: list(v) for k, v in LEVELS.items()} if a.builtin else {}
+        try:
+            for name, words in _parse_sources(a.sources).items():
+                levels.setdefault(name, []).extend(words)
+        except (OSError, ValueError) as e:  # 词表不存在或不可读、参数格式错误
+            p.error(str(e))
+        if not levels:
+            p.error("nothing to compile: give LEVEL=PATH sources or --builtin")
+        try:
+            count = compile_corpus(a.output, levels)
+        except (OSError, ValueError) as e:
+            p.error(str(e))
+        print(f"{count} words in {len(levels)} levels -> {a.output}")
+        return 0
+
+    try:
+        corpus = Corpus(a.path)
+    except (OSError, ValueError) as e:
+        p.error(str(e))
+    with corpus:
+        print(f"{corpus.word_count} words")
+        for level, words in corpus.items():
+            lengths = corpus.lengths(level) or {0: 0}
+            print(f"  {level:<16} {len(words):>9} words, lengths {min(lengths)}-{max(lengths)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+"""
+Non-repeating word dealer shared by the CLI, GUI and server.
+Each level (and optionally each player) gets a shuffled deck; words are
+dealt in O(1) without repeats until the deck runs out, then the deck is
+reshuffled. A seed makes the whole sequence reproducible. Any mapping of
+level name to a word sequence works, including a compiled Corpus.
+"""
+from __future__ import annotations
+import random
+from array import array
+from typing import Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+from .words import LEVELS
+
+
+class _Deck:
+    """Shuffled word indices; words are looked up only when dealt"""
+
+    __slots__ = ("words", "order", "pos", "rng")
+
+    def __init__(self, words: Sequence[str], rng: random.Random):
+        # 只打乱下标，大词表（如 mmap 语料）无需复制成字符串列表
+        self.words = words
+        self.order = array("I", range(len(words)))
+        self.rng = rng
+        self.rng.shuffle(self.order)
+        self.pos = 0
+
+    def deal(self) -> str:
+        order = self.order
+        if self.pos == len(order):
+            last = order[-1]
+            self.rng.shuffle(order)
+            # 新一轮的第一个词不与上一轮最后一个词相同
+            if len(order) > 1 and order[0] == last:
+                k = self.rng.randrange(1, len(order))
+                order[0], order[k] = order[k], order[0]
+            self.pos = 0
+        word = self.words[order[self.pos]]
+        self.pos += 1
+        return word
+
+
+class WordDealer:
+    """Deal words per level from shuffled decks"""
+
+    def __init__(self, levels: Mapping[str, Sequence[str]] = LEVELS, seed: Optional[int] = None):
+        self.levels = levels
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int] = None) -> None:
+        """重新设定种子并丢弃所有牌堆"""
+        self.seed = seed
+        self.rng = random.Random(seed)  # seed=None 时只从系统熵源取一次种子
+        self._decks: Dict[Tuple[str, Hashable], _Deck] = {}
+
+    def _deck(self, level: str, player: Hashable) -> _Deck:
+        key = (level, player)
+        deck = self._decks.get(key)
+        if deck is None:
+            if level not in self.levels:
+                raise ValueError(f"unknown level: {level}")
+            if not len(self.levels[level]):
+                raise ValueError(f"level {level!r} has no words")
+            if player is None:
+                rng = self.rng
+            elif self.seed is None:
+                rng = random.Random(self.rng.getrandbits(64))
+            else:
+                # 每个玩家的牌堆只取决于种子、等级和玩家，与发牌顺序无关
+                rng = random.Random(f"{self.seed}:{level}:{player}")
+            deck = self._decks[key] = _Deck(self.levels[level], rng)
+        return deck
+
+    def deal(self, level: str, player: Hashable = None) -> str:
+        """发一个词；player 不为 None 时使用该玩家自己的牌堆"""
+        return self._deck(level, player).deal()
+
+    def forget(self, player: Hashable) -> None:
+        """释放某个玩家的所有牌堆"""
+        for key in [k for k in self._decks if k[1] == player]:
+            del self._decks[key]
+
+
+# CLI、GUI 和服务器共享的默认发牌器
+DEFAULT_DEALER = WordDealer()
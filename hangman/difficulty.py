@@ -0,0 +1,239 @@
+"""
+Per-word difficulty computed from the corpus itself.
+Scores combine unique-letter count, letter rarity, how many words share
+the word's shape and the solver's wrong guesses on it. The scored,
+sorted corpus is cached on disk under a hash of its content, the solver
+setting and the feature weights, so a word from any percentile range can
+be picked in O(1).
+
+    python -m hangman.difficulty words.txt
+"""
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .corpus import load_levels, read_wordlist
+from .engine import HangmanGame
+from .solver import Solver, WordIndex, play, word_shape
+
+FORMAT_VERSION = 1
+# 各特征（标准化后）的权重
+WEIGHTS = {"unique": 1.0, "rarity": 1.0, "shape": 0.5, "solver": 2.0}
+BUCKETS = {"easy": (0.0, 1 / 3), "medium": (1 / 3, 2 / 3), "hard": (2 / 3, 1.0)}
+PARALLEL_MIN = 2000  # 词数达到该值时 level_index 用进程池计算求解器特征
+
+
+def default_cache_dir() -> str:
+    return os.environ.get("HANGMAN_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "hangman")
+
+
+def corpus_hash(words: Sequence[str], use_solver: bool = True) -> str:
+    """缓存键：词表内容、是否使用求解器特征与 WEIGHTS 任一变化都得到新的键"""
+    weights = json.dumps(WEIGHTS, sort_keys=True)
+    h = hashlib.sha256(f"difficulty-v{FORMAT_VERSION}:solver={use_solver}:weights={weights}:".encode())
+    for word in words:
+        h.update(word.encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def solver_wrong_guesses(words: Sequence[str], start: int = 0, stop: Optional[int] = None) -> List[int]:
+    """求解器在 words[start:stop] 上各猜错几次（候选集为整个词表）"""
+    solver = Solver(WordIndex(words))
+    out = []
+    for word in words[start:stop]:
+        game = HangmanGame(word, lives=26)
+        play(game, solver)
+        out.append(game.state.get_wrong_guesses())
+    return out
+
+
+def word_features(words: Sequence[str], use_solver: bool = True,
+                  workers: int = 1) -> Dict[str, List[float]]:
+    """计算每个词的原始特征"""
+    n = len(words)
+    letter_docs: Dict[str, int] = {}
+    shapes: Dict[str, int] = {}
+    for word in words:
+        for ch in set(word):
+            if ch.isalpha():
+                letter_docs[ch] = letter_docs.get(ch, 0) + 1
+        shape = word_shape(word)
+        shapes[shape] = shapes.get(shape, 0) + 1
+
+    unique, rarity, shape_share = [], [], []
+    for word in words:
+        letters = {ch for ch in word if ch.isalpha()}
+        unique.append(len(letters))
+        rarity.append(sum(-math.log(letter_docs[ch] / n) for ch in letters) / max(1, len(letters)))
+        shape_share.append(math.log(shapes[word_shape(word)]))
+
+    solver_wrong: List[float] = []
+    if not use_solver:
+        solver_wrong = [0.0] * n
+    elif workers <= 1:
+        solver_wrong = solver_wrong_guesses(words)
+    else:
+        words = list(words)
+        step = -(-n // workers)
+        from concurrent.futures import ProcessPoolExecutor  # 进程池较重，按需导入
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(solver_wrong_guesses, [words] * workers,
+                                 range(0, n, step), range(step, n + step, step)):
+                solver_wrong += part
+    return {"unique": unique, "rarity": rarity, "shape": shape_share, "solver": solver_wrong}
+
+
+def _standardize(values: List[float]) -> List[float]:
+    mean = sum(values) / len(values)
+    sd = math.sqrt(sum((v - mean) ** 2 for v in values) / len(values))
+    return [(v - mean) / sd if sd else 0.0 for v in values]
+
+
+def score_words(words: Sequence[str], use_solver: bool = True, workers: int = 1) -> List[float]:
+    """综合难度分数：各特征标准化后加权求和"""
+    if not words:
+        return []
+    features = word_features(words, use_solver, workers)
+    scores = [0.0] * len(words)
+    for name, values in features.items():
+        weight = WEIGHTS[name]
+        for i, z in enumerate(_standardize(values)):
+            scores[i] += weight * z
+    return scores
+
+
+class DifficultyIndex:
+    """Words sorted by difficulty; pick from any percentile range in O(1)"""
+
+    def __init__(self, words: List[str], scores: List[float]):
+        self.words = words    # 按难度从易到难排序
+        self.scores = scores
+
+    @classmethod
+    def build(cls, words: Sequence[str], use_solver: bool = True,
+              workers: int = 1) -> "DifficultyIndex":
+        words = list(dict.fromkeys(w.lower() for w in words))
+        scores = score_words(words, use_solver, workers)
+        order = sorted(range(len(words)), key=lambda i: (scores[i], words[i]))
+        return cls([words[i] for i in order], [round(scores[i], 4) for i in order])
+
+    @staticmethod
+    def _cache_path(digest: str, cache_dir: Optional[str]) -> str:
+        return os.path.join(cache_dir or default_cache_dir(), f"difficulty-{digest[:16]}.json")
+
+    @classmethod
+    def cached(cls, words: Sequence[str], cache_dir: Optional[str] = None,
+               use_solver: bool = True) -> Optional["DifficultyIndex"]:
+        """只读磁盘缓存；没有可用的缓存时返回 None"""
+        digest = corpus_hash(words, use_solver)
+        try:
+            with open(cls._cache_path(digest, cache_dir), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("hash") == digest and data.get("solver") == use_solver:
+                return cls(data["words"], data["scores"])
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @classmethod
+    def load(cls, words: Sequence[str], cache_dir: Optional[str] = None,
+             use_solver: bool = True, workers: int = 1) -> "DifficultyIndex":
+        """从磁盘缓存读取；词表、求解器设置或权重变化（哈希不同）时重新计算并写入"""
+        index = cls.cached(words, cache_dir, use_solver)
+        if index is not None:
+            return index
+        digest = corpus_hash(words, use_solver)
+        cache_dir = cache_dir or default_cache_dir()
+        path = cls._cache_path(digest, cache_dir)
+        index = cls.build(words, use_solver, workers)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"hash": digest, "solver": use_solver,
+                           "words": index.words, "scores": index.scores}, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # 缓存不可写时仍可使用内存中的结果
+        return index
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def percentile_of(self, word: str) -> float:
+        return self.words.index(word) / len(self.words)
+
+    def choose(self, lo: float = 0.0, hi: float = 1.0, rng: Optional[random.Random] = None) -> str:
+        """从难度百分位 [lo, hi) 中随机选一个词"""
+        if not 0.0 <= lo < hi <= 1.0:
+            raise ValueError(f"invalid percentile range: {lo}-{hi}")
+        n = len(self.words)
+        start = min(int(lo * n), n - 1)
+        end = max(start + 1, int(math.ceil(hi * n)))
+        rng = rng or random
+        return self.words[rng.randrange(start, end)]
+
+
+@lru_cache(maxsize=None)
+def level_index(level: str, corpus: Optional[str] = None) -> DifficultyIndex:
+    """某等级的难度索引（首次使用时从磁盘缓存读取或计算）；corpus 为编译语料路径
+
+    需要计算时先在 stderr 上提示；大词表的求解器特征用进程池计算。
+    """
+    levels = load_levels(corpus)
+    if level not in levels:
+        raise ValueError(f"unknown level: {level}")
+    words = levels[level]
+    index = DifficultyIndex.cached(words)
+    if index is None:
+        workers = (os.cpu_count() or 1) if len(words) >= PARALLEL_MIN else 1
+        print(f"Building the difficulty index for level {level!r} ({len(words)} words, "
+              f"{workers} worker(s)); it is cached for later runs...", file=sys.stderr, flush=True)
+        index = DifficultyIndex.load(words, workers=workers)
+    return index
+
+
+def parse_range(text: str) -> Tuple[float, float]:
+    """解析 'easy' / 'hard' 或 '0.5-1.0' 形式的百分位范围"""
+    if text in BUCKETS:
+        return BUCKETS[text]
+    try:
+        lo, hi = (float(x) for x in text.split("-"))
+    except ValueError:
+        raise ValueError(f"expected one of {', '.join(BUCKETS)} or LO-HI, got {text!r}") from None
+    if not 0.0 <= lo < hi <= 1.0:
+        raise ValueError(f"invalid percentile range: {text}")
+    return lo, hi
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Build or show the difficulty index of a word list")
+    p.add_argument("wordlist", nargs="?", help="one word or phrase per line (default: built-in lists)")
+    p.add_argument("--corpus", help="use every level of this compiled corpus instead")
+    p.add_argument("--no-solver", action="store_true", help="skip the solver feature (faster)")
+    p.add_argument("--cache-dir")
+    p.add_argument("--workers", type=int, default=os.cpu_count(), help="processes for the solver pass")
+    p.add_argument("--show", type=int, default=10, help="easiest/hardest words to print")
+    a = p.parse_args(argv)
+    if a.wordlist:
+        words = read_wordlist(a.wordlist)
+    else:
+        words = [w for level in load_levels(a.corpus).values() for w in level]
+    index = DifficultyIndex.load(words, a.cache_dir, use_solver=not a.no_solver, workers=a.workers)
+    print(f"{len(index)} words")
+    print("easiest:", ", ".join(index.words[:a.show]))
+    print("hardest:", ", ".join(index.words[-a.show:]))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
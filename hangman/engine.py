@@ -1,8 +1,185 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Set, Optional, Tuple
+import copy
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 
 REVEAL_CHAR = "_"
+MODES = ("classic", "evil")  # 游戏模式；evil 模式的实现在 hangman.evil
+
+# a-z occupy the low 26 bits. Other alphabetic characters have no global
+# bit (guesses come from the network, so a global table would grow without
+# bound): letters of the answer get answer-local bits from 26 up, and any
+# other guess is only kept in the state's letters_guessed.
+_LETTER_BITS: Dict[str, int] = {chr(ord("a") + i): 1 << i for i in range(26)}
+_EXTRA_SHIFT = len(_LETTER_BITS)
+
+
+def letter_bit(letter: str) -> int:
+    """返回 a-z 字母的位掩码；其他字符返回 0"""
+    return _LETTER_BITS.get(letter, 0)
+
+
+def letters_to_mask(letters: Iterable[str]) -> int:
+    """把字母集合转换为位掩码"""
+    mask = 0
+    for letter in letters:
+        mask |= letter_bit(letter)
+    return mask
+
+
+def mask_to_letters(mask: int, answer: Optional[str] = None) -> Set[str]:
+    """把位掩码转换回字母集合；给出 answer 时也还原该答案内 a-z 以外的字母"""
+    letters = {letter for letter, bit in _LETTER_BITS.items() if mask & bit}
+    if answer is not None and mask >> _EXTRA_SHIFT:
+        letters.update(letter for letter, bit in _answer_index(answer)[4].items() if mask & bit)
+    return letters
+
+
+@lru_cache(maxsize=4096)
+def _answer_index(answer: str) -> Tuple[Dict[str, Tuple[int, ...]], int, int, Tuple[str, ...],
+                                        Dict[str, int]]:
+    """为答案建立 字母 -> 位置 索引与 字母 -> 位 映射；相同答案共享同一份（只读）索引"""
+    positions: Dict[str, List[int]] = {}
+    for i, ch in enumerate(answer):
+        if ch.isalpha():
+            positions.setdefault(ch.lower(), []).append(i)
+    index = {k: tuple(v) for k, v in positions.items()}
+    bits: Dict[str, int] = {}
+    extra = _EXTRA_SHIFT
+    for letter in index:
+        bit = _LETTER_BITS.get(letter)
+        if bit is None:  # a-z 以外的字母：按出现顺序分配答案内的位
+            bit, extra = 1 << extra, extra + 1
+        bits[letter] = bit
+    blank = tuple(REVEAL_CHAR if ch.isalpha() else ch for ch in answer)
+    answer_mask = 0
+    for bit in bits.values():
+        answer_mask |= bit
+    return index, answer_mask, sum(len(v) for v in index.values()), blank, bits
+
+
+def render_mask(answer: str, mask: int) -> str:
+    """显示串：mask 中的字母显示出来，其余字母显示为 REVEAL_CHAR"""
+    positions, _, _, blank, bits = _answer_index(answer)
+    masked = list(blank)
+    for letter, where in positions.items():
+        if mask & bits[letter]:
+            for i in where:
+                masked[i] = answer[i]
+    return "".join(masked)
+
+
+class MaskCache:
+    """Bounded LRU of rendered masks keyed by (answer, guessed mask).
+
+    Every state showing the same answer with the same letters revealed
+    gets the same string object.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        # lru_cache 的 C 实现；每次未命中插入一项，所以淘汰数 = 未命中数 - 当前大小
+        self.get = lru_cache(maxsize=maxsize)(render_mask)
+
+    def __len__(self) -> int:
+        return self.get.cache_info().currsize
+
+    def stats(self) -> Dict[str, float]:
+        hits, misses, maxsize, size = self.get.cache_info()
+        lookups = hits + misses
+        return {"size": size, "maxsize": maxsize, "hits": hits, "misses": misses,
+                "evictions": misses - size, "hit_rate": hits / lookups if lookups else 0.0}
+
+    @property
+    def hit_rate(self) -> float:
+        return self.stats()["hit_rate"]
+
+    def clear(self) -> None:
+        self.get.cache_clear()
+
+
+# 所有 HangmanState 和 CompactSession 共享的显示串缓存
+MASK_CACHE = MaskCache()
+
+
+class _GuessedLetters(set):
+    """A set of guessed letters that keeps its owning state's index in sync."""
+
+    def __init__(self, iterable: Iterable[str] = (), owner: Optional["HangmanState"] = None):
+        super().__init__(iterable)
+        self._owner = owner
+
+    def __repr__(self) -> str:
+        return repr(set(self))
+
+    # 副本是普通 set，不带 _owner（否则修改副本会改动原状态）
+    def __copy__(self) -> Set[str]:
+        return set(self)
+
+    def __deepcopy__(self, memo) -> Set[str]:
+        return set(self)
+
+    def _resync(self) -> None:
+        if self._owner is not None:
+            self._owner._rebuild_guesses()
+
+    def add(self, letter: str) -> None:
+        if letter in self:
+            return
+        super().add(letter)
+        if self._owner is not None:
+            self._owner._apply_guess(letter)
+
+    def update(self, *others: Iterable[str]) -> None:
+        for other in others:
+            for letter in other:
+                self.add(letter)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def discard(self, letter: str) -> None:
+        super().discard(letter)
+        self._resync()
+
+    def remove(self, letter: str) -> None:
+        super().remove(letter)
+        self._resync()
+
+    def pop(self) -> str:
+        letter = super().pop()
+        self._resync()
+        return letter
+
+    def clear(self) -> None:
+        super().clear()
+        self._resync()
+
+    def difference_update(self, *others: Iterable[str]) -> None:
+        super().difference_update(*others)
+        self._resync()
+
+    def intersection_update(self, *others: Iterable[str]) -> None:
+        super().intersection_update(*others)
+        self._resync()
+
+    def symmetric_difference_update(self, other: Iterable[str]) -> None:
+        super().symmetric_difference_update(other)
+        self._resync()
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
 
 
 @dataclass
@@ -14,17 +191,83 @@ class HangmanState:
     seconds_per_turn: int = 15
     score: int = 0  # TDD: Add score field
 
+    # answer 和 letters_guessed 赋值时重建索引，其余字段直接写入
+    def __setattr__(self, name: str, value) -> None:
+        if name == "answer":
+            object.__setattr__(self, name, value)
+            self._index_answer()
+            if "letters_guessed" in self.__dict__:
+                self._rebuild_guesses()
+        elif name == "letters_guessed":
+            object.__setattr__(self, name, _GuessedLetters(value, owner=self))
+            self._rebuild_guesses()
+        else:
+            object.__setattr__(self, name, value)
+
+    # 副本各有自己的 letters_guessed 与索引（默认的浅拷贝会共享集合及其 _owner）
+    def __copy__(self) -> "HangmanState":
+        values = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        values["letters_guessed"] = set(self.letters_guessed)
+        return type(self)(**values)
+
+    def __deepcopy__(self, memo) -> "HangmanState":
+        values = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        values["letters_guessed"] = set(self.letters_guessed)
+        return type(self)(**copy.deepcopy(values, memo))
+
+    # 内部字段直接写 __dict__，绕过上面的 __setattr__
+    def _index_answer(self) -> None:
+        d = self.__dict__
+        d["_positions"], d["_answer_mask"], d["_letter_count"], _, d["_bits"] = _answer_index(self.answer)
+
+    def _rebuild_guesses(self) -> None:
+        """从 letters_guessed 重新计算掩码和计数"""
+        d = self.__dict__
+        d["_guessed_mask"] = 0
+        d["_hidden"] = self._letter_count
+        d["_correct"] = 0
+        d["_wrong"] = 0
+        d["_masked_str"] = None
+        for letter in self.letters_guessed:
+            self._apply_guess(letter)
+
+    def _apply_guess(self, letter: str) -> None:
+        """增量更新掩码和计数；猜中时显示串失效"""
+        d = self.__dict__
+        bit = _LETTER_BITS.get(letter) or self._bits.get(letter, 0)
+        if d["_guessed_mask"] & bit:
+            return
+        d["_guessed_mask"] |= bit
+        positions = self._positions.get(letter)
+        if positions is None:
+            d["_wrong"] += 1  # 没有位的字母（不在答案中）由 letters_guessed 去重
+            return
+        d["_correct"] += 1
+        d["_hidden"] -= len(positions)
+        d["_masked_str"] = None
+
+    @property
+    def guessed_mask(self) -> int:
+        """已猜字母的位掩码（26 位以上是本答案内 a-z 以外的字母）"""
+        return self._guessed_mask
+
+    def has_guessed(self, letter: str) -> bool:
+        """字母是否已经猜过"""
+        bit = _LETTER_BITS.get(letter) or self._bits.get(letter)
+        return bool(self._guessed_mask & bit) if bit else letter in self.letters_guessed
+
+    def positions(self, letter: str) -> Tuple[int, ...]:
+        """返回字母在答案中出现的位置"""
+        return self._positions.get(letter, ())
+
     def masked_answer(self) -> str:
-        out = []
-        for ch in self.answer:
-            if ch.isalpha():
-                out.append(ch if ch.lower() in self.letters_guessed else REVEAL_CHAR)
-            else:
-                out.append(ch)
-        return "".join(out)
+        if self._masked_str is None:
+            # 只用命中的字母作键，错误字母不同的状态也共享同一个显示串
+            self.__dict__["_masked_str"] = MASK_CACHE.get(self.answer, self._guessed_mask & self._answer_mask)
+        return self._masked_str
 
     def is_won(self) -> bool:
-        return all((not c.isalpha()) or (c.lower() in self.letters_guessed) for c in self.answer)
+        return self._hidden == 0
 
     def is_lost(self) -> bool:
         return self.lives <= 0
@@ -35,22 +278,22 @@ class HangmanState:
         if self.is_lost():
             return "lost"
         return "playing"
-    
+
     def get_word_length(self) -> int:
         """返回单词中字母的总数量（不包括空格等非字母字符）"""
-        return sum(1 for c in self.answer if c.isalpha())
-    
+        return self._letter_count
+
     def get_guessed_letters(self) -> str:
         """返回已经猜过的字母，按字母顺序排列"""
         return ', '.join(sorted(self.letters_guessed)) if self.letters_guessed else 'None'
-    
+
     def get_correct_guesses(self) -> int:
         """返回正确猜测的次数"""
-        return sum(1 for letter in self.letters_guessed if letter in self.answer)
-    
+        return self._correct
+
     def get_wrong_guesses(self) -> int:
         """返回错误猜测的次数"""
-        return sum(1 for letter in self.letters_guessed if letter not in self.answer)
+        return self._wrong
 
 
 class HangmanGame:
@@ -80,13 +323,14 @@ class HangmanGame:
         if not letter or len(letter) != 1 or not letter.isalpha():
             return False, 0
         letter = letter.lower()
-        if letter in self.state.letters_guessed:
-            return (letter in self.state.answer), self.state.answer.count(letter) if letter in self.state.answer else 0
+        count = len(self.state.positions(letter))
+        if self.state.has_guessed(letter):
+            return count > 0, count
         self.state.letters_guessed.add(letter)
-        if letter in self.state.answer:
+        if count:
             # TDD: Add score for correct guess
             self.state.score += 10
-            return True, self.state.answer.count(letter)
+            return True, count
         # TDD: Subtract score for wrong guess
         self.state.score -= 5
         self.state.lives -= 1
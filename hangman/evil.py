@@ -0,0 +1,142 @@
+"""
+Adversarial ("evil") Hangman.
+The answer is not fixed: the game keeps every word of the answer's shape
+as a candidate and, on each guess, splits the candidates into classes by
+where the guessed letter appears, then keeps the largest class. The split
+uses the solver's precomputed per-(position, letter) bitsets, so one
+guess costs a few big-integer ANDs per hidden position instead of a pass
+over the words.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from .corpus import load_levels
+from .engine import MODES, HangmanGame, HangmanState, REVEAL_CHAR
+from .solver import WordIndex, _members, _popcount, _ShapeGroup, word_shape
+
+
+def partition(group: _ShapeGroup, bits: int, letter: str,
+              positions: Sequence[int]) -> List[Tuple[int, int]]:
+    """把候选位集按字母出现的位置切分，返回 [(位置掩码, 候选位集)]"""
+    present = bits & group.contains.get(letter, 0)
+    classes = [(0, bits ^ present)] if bits != present else []
+    if present:
+        split = [(0, present)]
+        for p in positions:
+            at = group.at.get((p, letter), 0) & present
+            if not at:
+                continue
+            refined = []
+            for key, members in split:
+                inside = members & at
+                if inside:
+                    refined.append((key | 1 << p, inside))
+                if inside != members:
+                    refined.append((key, members ^ inside))
+            split = refined
+        classes += split
+    return classes
+
+
+def largest_class(group: _ShapeGroup, bits: int, letter: str,
+                  positions: Sequence[int]) -> Tuple[int, int]:
+    """与 max(partition(...)) 相同：最大的类，同样大时选揭示位置更少的（未命中优先）
+
+    比未命中类小或相等的类（及其子类）不可能胜出，切分时直接丢弃。
+    """
+    present = bits & group.contains.get(letter, 0)
+    miss = bits ^ present
+    floor = _popcount(miss)
+    best = (floor, 0, 0, miss)
+    split = [(0, present)] if _popcount(present) > floor else []
+    for p in positions:
+        if not split:
+            break
+        at = group.at.get((p, letter), 0) & present
+        if not at:
+            continue
+        refined = []
+        for key, members in split:
+            inside = members & at
+            for k, m in ((key | 1 << p, inside), (key, members ^ inside)):
+                if m and (m == members or _popcount(m) > floor):
+                    refined.append((k, m))
+        split = refined
+    for key, members in split:
+        candidate = (_popcount(members), -_popcount(key), -key, members)
+        if candidate > best:
+            best = candidate
+    return -best[2], best[3]
+
+
+@dataclass
+class EvilHangmanState(HangmanState):
+    """HangmanState whose answer is a stand-in for a set of candidates.
+
+    Every candidate has the same letters at the guessed positions, so the
+    stand-in answer gives the same masked display and counts as any of them.
+    """
+    group: Optional[_ShapeGroup] = None
+    candidates: int = 0  # bit i -> group.words[i]
+
+    def candidate_count(self) -> int:
+        return _popcount(self.candidates)
+
+    def candidate_words(self, limit: Optional[int] = None) -> List[str]:
+        words = []
+        for i in _members(self.candidates):
+            if limit is not None and len(words) >= limit:
+                break
+            words.append(self.group.words[i])
+        return words
+
+
+class EvilHangmanGame(HangmanGame):
+    """Hangman that commits to an answer as late as possible"""
+
+    def __init__(self, answer: str, lives: int = 6, seconds_per_turn: int = 15,
+                 index: Optional[WordIndex] = None):
+        answer = answer.lower()
+        group = (index or WordIndex([answer])).groups.get(word_shape(answer))
+        if group is None:
+            group = WordIndex([answer]).groups[word_shape(answer)]
+        self.state = EvilHangmanState(answer=answer, lives=lives, seconds_per_turn=seconds_per_turn,
+                                      group=group, candidates=group.all)
+
+    def guess(self, letter: str) -> Tuple[bool, int]:
+        state = self.state
+        if (state.status() == "playing" and letter and len(letter) == 1 and letter.isalpha()
+                and not state.has_guessed(letter.lower())):
+            self._narrow(letter.lower())
+        return super().guess(letter)
+
+    def _narrow(self, letter: str) -> None:
+        """保留最大的模式类，并把答案换成该类中的一个词"""
+        state = self.state
+        hidden = [p for p, ch in enumerate(state.masked_answer()) if ch == REVEAL_CHAR]
+        _, members = largest_class(state.group, state.candidates, letter, hidden)
+        state.candidates = members
+        answer = state.group.words[(members & -members).bit_length() - 1]
+        if answer != state.answer:
+            state.answer = answer
+
+
+@lru_cache(maxsize=None)
+def level_word_index(level: str, corpus: Optional[str] = None) -> WordIndex:
+    """某等级词表的候选索引（每个进程只构建一次）；corpus 为编译语料路径"""
+    levels = load_levels(corpus)
+    if level not in levels:
+        raise ValueError(f"unknown level: {level}")
+    return WordIndex(levels[level])
+
+
+def create_game(mode: str, answer: str, level: str, lives: int = 6, seconds_per_turn: int = 15,
+                corpus: Optional[str] = None) -> HangmanGame:
+    """按模式创建游戏；evil 模式以 answer 的形状在该等级词表中取候选"""
+    if mode == "classic":
+        return HangmanGame(answer, lives, seconds_per_turn)
+    if mode == "evil":
+        return EvilHangmanGame(answer, lives, seconds_per_turn, level_word_index(level, corpus))
+    raise ValueError(f"unknown mode: {mode}")
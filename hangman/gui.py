@@ -5,27 +5,42 @@ Provides a graphical interface while maintaining the core game logic.
 from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk, messagebox, font
-import threading
+import math
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from .engine import HangmanGame
-from .words import BASIC_WORDS, INTERMEDIATE_PHRASES
+from .cli import active_metrics, corpus_path, default_player, start_metrics
+from .dealer import DEFAULT_DEALER
+from .engine import MODES, HangmanGame
+
+if TYPE_CHECKING:
+    from .leaderboard import BackgroundSubmitter
+    from .results import ResultLog
 
 
 class HangmanGUI:
     """Tkinter-based GUI for Hangman game"""
     
-    def __init__(self):
+    def __init__(self, results: Optional[ResultLog] = None,
+                 leaderboard: Optional[BackgroundSubmitter] = None, player: str = ""):
         self.root = tk.Tk()
         self.root.title("Hangman Game")
-        self.root.geometry("600x500")
+        self.root.geometry("720x500")
         self.root.resizable(False, False)
         
         # Game state
         self.game: Optional[HangmanGame] = None
         self.timer_running = False
         self.current_time_left = 0
+        self.turn_deadline = 0.0
+        self.turn_started = 0.0
+        self.timer_job: Optional[str] = None
+        self.shown_seconds: Optional[int] = None
+        self.results = results
+        self.leaderboard = leaderboard
+        self.player = player
+        self.guesses: List[str] = []
+        self.game_started = 0.0
         
         # Setup GUI
         self.setup_styles()
@@ -62,9 +77,10 @@ class HangmanGUI:
         # Level and settings
         self.level_frame = ttk.Frame(self.info_frame)
         tk.Label(self.level_frame, text="Level:", font=self.info_font).grid(row=0, column=0, sticky="w")
-        self.level_var = tk.StringVar(value="basic")
+        levels = list(DEFAULT_DEALER.levels)  # 内置词表或 --corpus 的等级
+        self.level_var = tk.StringVar(value="basic" if "basic" in levels else levels[0])
         self.level_combo = ttk.Combobox(self.level_frame, textvariable=self.level_var, 
-                                       values=["basic", "intermediate"], state="readonly", width=10)
+                                       values=levels, state="readonly", width=10)
         
         tk.Label(self.level_frame, text="Lives:", font=self.info_font).grid(row=0, column=2, sticky="w", padx=(20,0))
         self.lives_var = tk.StringVar(value="6")
@@ -74,6 +90,11 @@ class HangmanGUI:
         self.timeout_var = tk.StringVar(value="15")
         self.timeout_spin = tk.Spinbox(self.level_frame, from_=5, to=30, textvariable=self.timeout_var, width=5)
         
+        tk.Label(self.level_frame, text="Mode:", font=self.info_font).grid(row=0, column=6, sticky="w", padx=(20,0))
+        self.mode_var = tk.StringVar(value="classic")
+        self.mode_combo = ttk.Combobox(self.level_frame, textvariable=self.mode_var,
+                                      values=list(MODES), state="readonly", width=8)
+        
         # Word display
         self.word_frame = ttk.Frame(self.main_frame)
         self.word_label = tk.Label(
@@ -128,6 +149,7 @@ class HangmanGUI:
         self.level_combo.grid(row=0, column=1, padx=(5, 0))
         self.lives_spin.grid(row=0, column=3, padx=(5, 0))
         self.timeout_spin.grid(row=0, column=5, padx=(5, 0))
+        self.mode_combo.grid(row=0, column=7, padx=(5, 0))
         
         # Word display
         self.word_frame.pack(pady=20)
@@ -173,15 +195,13 @@ class HangmanGUI:
         self.letter_entry.focus_set()
     
     def choose_answer(self, level: str) -> str:
-        """Choose a random word based on level"""
-        import random
-        rng = random.SystemRandom()
-        return rng.choice(BASIC_WORDS if level == "basic" else INTERMEDIATE_PHRASES)
+        """Deal the next word for the level from the shared deck"""
+        return DEFAULT_DEALER.deal(level)
     
     def new_game(self):
         """Start a new game"""
         # Stop any running timer
-        self.timer_running = False
+        self.cancel_timer()
         
         # Get settings
         level = self.level_var.get()
@@ -190,7 +210,14 @@ class HangmanGUI:
         
         # Create new game
         answer = self.choose_answer(level)
-        self.game = HangmanGame(answer=answer, lives=lives, seconds_per_turn=timeout)
+        mode = self.mode_var.get()
+        if mode == "classic":
+            self.game = HangmanGame(answer, lives, timeout)
+        else:
+            from .evil import create_game  # evil 模式才加载（连同 solver 的索引）
+            self.game = create_game(mode, answer, level, lives, timeout, corpus_path())
+        self.guesses = []
+        self.game_started = time.monotonic()
         
         # Reset UI
         self.update_display()
@@ -210,6 +237,7 @@ class HangmanGUI:
         if not self.game or self.game.state.status() != "playing":
             return
         
+        received = time.monotonic()
         letter = self.letter_var.get().strip().lower()
         
         # Validate input
@@ -221,12 +249,16 @@ class HangmanGUI:
         # Make guess
         self.game.start_turn(time.monotonic())
         ok, count = self.game.guess(letter)
+        self.guesses.append(letter)
         
         # Update display
         self.update_display()
         
         # Clear input
         self.letter_var.set("")
+        metrics = active_metrics()
+        if metrics is not None:
+            metrics.observe_turn(received - self.turn_started, time.monotonic() - received)
         
         # Check game status
         if self.game.state.status() != "playing":
@@ -236,43 +268,59 @@ class HangmanGUI:
             self.start_timer()
     
     def start_timer(self):
-        """Start the countdown timer"""
+        """Start the countdown for a new turn"""
         if not self.game:
             return
-            
+
+        self.cancel_timer()
+        now = time.monotonic()
         self.timer_running = True
+        self.turn_started = now
+        self.turn_deadline = now + self.game.state.seconds_per_turn
         self.current_time_left = self.game.state.seconds_per_turn
-        self.game.start_turn(time.monotonic())
-        
-        # Start timer thread
-        threading.Thread(target=self.timer_thread, daemon=True).start()
-    
-    def timer_thread(self):
-        """Timer thread for countdown"""
-        while self.timer_running and self.current_time_left > 0:
-            # Update timer display
-            self.root.after(0, self.update_timer_display)
-            
-            time.sleep(0.1)
-            self.current_time_left -= 0.1
-            
-            # Check if game timed out
-            if self.game and self.timer_running:
-                timed_out = self.game.tick(time.monotonic())
-                if timed_out:
-                    self.root.after(0, self.handle_timeout)
-                    break
-    
+        self.shown_seconds = None
+        self.game.start_turn(now)
+        self.on_timer()
+
+    def cancel_timer(self):
+        """Stop the countdown and drop any pending callback"""
+        self.timer_running = False
+        if self.timer_job is not None:
+            self.root.after_cancel(self.timer_job)
+            self.timer_job = None
+
+    def on_timer(self):
+        """Tk event-loop callback: redraw when the shown second changes, then sleep until the next change"""
+        self.timer_job = None
+        if not self.timer_running or not self.game:
+            return
+
+        now = time.monotonic()
+        if self.game.tick(now):
+            self.handle_timeout()
+            return
+
+        remaining = self.turn_deadline - now
+        self.current_time_left = max(0.0, remaining)
+        shown = max(0, math.ceil(remaining))
+        if shown != self.shown_seconds:
+            self.shown_seconds = shown
+            self.update_timer_display()
+
+        # 下一次唤醒：显示的秒数变化时（或到期时）
+        wait = remaining - (shown - 1) if remaining > 0 else 0.001
+        self.timer_job = self.root.after(max(1, math.ceil(wait * 1000)), self.on_timer)
+
     def update_timer_display(self):
         """Update timer display on main thread"""
         if self.timer_running and self.current_time_left > 0:
-            self.timer_label.config(text=f"Time: {int(self.current_time_left)}s")
+            self.timer_label.config(text=f"Time: {math.ceil(self.current_time_left)}s")
         else:
             self.timer_label.config(text="Time: 0s")
     
     def handle_timeout(self):
         """Handle timer timeout"""
-        self.timer_running = False
+        self.cancel_timer()
         messagebox.showinfo("Time's Up!", "Time's up! Life -1")
         self.update_display()
         
@@ -304,11 +352,19 @@ class HangmanGUI:
     
     def end_game(self):
         """Handle game end"""
-        self.timer_running = False
+        self.cancel_timer()
         
         if not self.game:
             return
         
+        if self.results is not None:
+            from .results import GameResult  # 只在记录结果时加载
+            self.results.append(GameResult.from_game(
+                self.game, self.level_var.get(), self.guesses, time.monotonic() - self.game_started))
+        if self.leaderboard is not None:
+            # 后台线程写入，不阻塞界面
+            self.leaderboard.submit(self.player, self.game.state.score)
+
         # Disable input
         self.letter_entry.config(state="disabled")
         self.guess_button.config(state="disabled")
@@ -336,6 +392,8 @@ class HangmanGUI:
             f"• Lives remaining: {self.game.state.lives}\n\n"
             f"{detail}"
         )
+        if self.leaderboard is not None:
+            stats += f"\n\nScore {self.game.state.score} submitted to the leaderboard as {self.player}."
         
         # Ask for new game
         response = messagebox.askyesno(
@@ -359,10 +417,33 @@ class HangmanGUI:
         self.root.mainloop()
 
 
-def main():
+def main(results_path: Optional[str] = None, leaderboard_path: Optional[str] = None,
+         player: Optional[str] = None, metrics_path: Optional[str] = None,
+         metrics_port: Optional[int] = None, corpus: Optional[str] = None):
     """Main entry point for GUI version"""
-    app = HangmanGUI()
-    app.run()
+    if corpus:
+        from .corpus import load_levels  # 只在指定语料时加载
+        DEFAULT_DEALER.levels = load_levels(corpus)
+        DEFAULT_DEALER.reseed()
+    results = None
+    if results_path:
+        from .results import ResultLog  # 只在需要时加载（启动更快）
+        results = ResultLog(results_path)
+    leaderboard = None
+    if leaderboard_path:
+        from .leaderboard import BackgroundSubmitter, Leaderboard
+        leaderboard = BackgroundSubmitter(Leaderboard(leaderboard_path))
+    exporter = start_metrics(metrics_path, port=metrics_port)
+    app = HangmanGUI(results, leaderboard, player or default_player())
+    try:
+        app.run()
+    finally:
+        if exporter is not None:
+            exporter.close()
+        if results is not None:
+            results.close()
+        if leaderboard is not None:
+            leaderboard.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,329 @@
+"""
+Persistent best-score leaderboard.
+Scores are kept in a blocked sorted list: short bisect-sorted blocks
+plus a Fenwick tree over the block sizes, so inserts move at most one
+block and rank queries are O(log n) even with millions of players.
+
+Every improvement is appended to a write-ahead log (one JSON array
+[player, score] per line) and flushed before the in-memory board
+changes; pass fsync=True to also force it to disk. On open, a
+half-written last line left by a crash is cut off and unreadable lines
+are skipped. When the log holds many superseded records it is compacted
+by rewriting one line per player and atomically replacing the file.
+Game front ends submit through BackgroundSubmitter, so a slow disk or a
+compaction never blocks a turn; a submit that fails is logged.
+
+    python -m hangman.leaderboard scores.wal --top 10
+    python -m hangman.leaderboard scores.wal --player alice
+"""
+from __future__ import annotations
+import argparse
+import json
+import logging
+import os
+import queue
+import threading
+from bisect import bisect_left, insort
+from concurrent.futures import Future
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+Key = Tuple[int, str]  # (-score, player)：分数高的排在前面，同分按名字
+
+log = logging.getLogger(__name__)
+
+
+class SortedScores:
+    """Order-statistics list of keys: add/remove O(load + log n), rank O(log n)"""
+
+    def __init__(self, load: int = 512):
+        self.load = load
+        self._blocks: List[List[Key]] = []
+        self._maxes: List[Key] = []
+        self._tree: List[int] = [0]
+        self._len = 0
+
+    @classmethod
+    def from_sorted(cls, keys: List[Key], load: int = 512) -> "SortedScores":
+        """由已排序的键一次性切块构建"""
+        scores = cls(load)
+        scores._blocks = [keys[i:i + load] for i in range(0, len(keys), load)]
+        scores._maxes = [block[-1] for block in scores._blocks]
+        scores._len = len(keys)
+        scores._rebuild()
+        return scores
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Key]:
+        return chain.from_iterable(self._blocks)
+
+    def _rebuild(self) -> None:
+        # Fenwick 树：_tree[i] 覆盖若干个块的长度和（下标从 1 开始）
+        tree = [0] + [len(block) for block in self._blocks]
+        for i in range(1, len(tree)):
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self._tree = tree
+
+    def _update(self, block: int, delta: int) -> None:
+        i = block + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, block: int) -> int:
+        """前 block 个块的元素总数"""
+        total = 0
+        while block:
+            total += self._tree[block]
+            block -= block & -block
+        return total
+
+    def add(self, key: Key) -> None:
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            self._rebuild()
+            return
+        i = min(bisect_left(self._maxes, key), len(self._blocks) - 1)
+        block = self._blocks[i]
+        insort(block, key)
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * self.load:
+            self._blocks[i:i + 1] = [block[:self.load], block[self.load:]]
+            self._maxes[i:i + 1] = [block[self.load - 1], block[-1]]
+            self._rebuild()
+        else:
+            self._update(i, 1)
+
+    def remove(self, key: Key) -> None:
+        i = bisect_left(self._maxes, key)
+        block = self._blocks[i] if i < len(self._blocks) else []
+        j = bisect_left(block, key)
+        if j == len(block) or block[j] != key:
+            raise KeyError(key)
+        del block[j]
+        self._len -= 1
+        if block:
+            self._maxes[i] = block[-1]
+            self._update(i, -1)
+        else:
+            del self._blocks[i], self._maxes[i]
+            self._rebuild()
+
+    def rank(self, key: Key) -> int:
+        """比 key 小（排在前面）的元素个数"""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._blocks):
+            return self._len
+        return self._prefix(i) + bisect_left(self._blocks[i], key)
+
+    def top(self, k: int) -> List[Key]:
+        return list(islice(self, k))
+
+
+class Leaderboard:
+    """Best score per player, backed by a write-ahead log"""
+
+    def __init__(self, path: Optional[str] = None, fsync: bool = False,
+                 compact_min: int = 10000, load: int = 512):
+        self.path = path
+        self.fsync = fsync
+        self.compact_min = compact_min
+        self.best: Dict[str, int] = {}
+        self.log_records = 0
+        self.skipped = 0  # 重放时跳过的损坏行
+        self._lock = threading.Lock()
+        self._file = None
+        if path is not None:
+            if os.path.exists(path):
+                _repair_tail(path)
+                self._replay(path)
+            self._file = open(path, "a", encoding="utf-8")
+        self.scores = SortedScores.from_sorted(sorted((-score, player) for player, score in self.best.items()),
+                                               load)
+
+    def _replay(self, path: str) -> None:
+        """重放日志，只保留每个玩家的最高分（有序结构最后一次性构建）"""
+        best = self.best
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    player, score = json.loads(line)
+                    if not isinstance(player, str) or not isinstance(score, int):
+                        raise ValueError(line)
+                except ValueError:
+                    self.skipped += 1  # 损坏的行：跳过，后面的记录照常重放
+                    continue
+                self.log_records += 1
+                if score > best.get(player, score - 1):
+                    best[player] = score
+
+    def _apply(self, player: str, score: int) -> None:
+        old = self.best.get(player)
+        if old is not None:
+            self.scores.remove((-old, player))
+        self.best[player] = score
+        self.scores.add((-score, player))
+
+    def _write(self, player: str, score: int) -> None:
+        """先写日志并刷到操作系统（fsync=True 时落盘），再更新内存"""
+        self._file.write(json.dumps([player, score], ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def submit(self, player: str, score: int) -> bool:
+        """提交一局的分数；只有刷新个人最高分时才写日志，返回是否刷新"""
+        with self._lock:
+            old = self.best.get(player)
+            if old is not None and score <= old:
+                return False
+            if self._file is not None:
+                self._write(player, score)
+                self.log_records += 1
+            self._apply(player, score)
+            if self._file is not None and self.log_records >= max(self.compact_min, 2 * len(self.best)):
+                self._compact()
+            return True
+
+    def _compact(self) -> None:
+        """每个玩家只保留一行，原子替换日志文件"""
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for neg, player in self.scores:
+                f.write(json.dumps([player, -neg], ensure_ascii=False, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(tmp, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self.log_records = len(self.best)
+
+    def compact(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._compact()
+
+    def rank(self, player: str) -> Optional[int]:
+        """名次（从 1 开始）；没有成绩时返回 None"""
+        with self._lock:
+            score = self.best.get(player)
+            return None if score is None else self.scores.rank((-score, player)) + 1
+
+    def top(self, k: int = 10) -> List[Tuple[str, int]]:
+        with self._lock:
+            return [(player, -neg) for neg, player in self.scores.top(k)]
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "Leaderboard":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _repair_tail(path: str) -> None:
+    """崩溃可能留下没有换行符的半行：截掉它，使之后追加的记录从新的一行开始"""
+    with open(path, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        # 向前找到最后一个换行符
+        pos = size
+        while pos > 0:
+            step = min(4096, pos)
+            f.seek(pos - step)
+            chunk = f.read(step)
+            i = chunk.rfind(b"\n")
+            if i >= 0:
+                f.truncate(pos - step + i + 1)
+                return
+            pos -= step
+        f.truncate(0)
+
+
+def _log_failure(future: Future, player: str, score: int) -> None:
+    """调用方通常不等待 future：失败的提交（如写日志出错）在这里记录，不会悄悄丢失"""
+    e = future.exception()
+    if e is not None:
+        log.error("leaderboard submit of %s for %r failed: %s", score, player, e, exc_info=e)
+
+
+class BackgroundSubmitter:
+    """Submit scores from a worker thread; submit() never blocks the caller"""
+
+    def __init__(self, board: Leaderboard):
+        self.board = board
+        self._queue: "queue.Queue[Optional[Tuple[str, int, Future]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="leaderboard", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            player, score, future = item
+            try:
+                self.board.submit(player, score)
+                future.set_result(self.board.rank(player))
+            except Exception as e:  # 交给调用方通过 future 处理
+                future.set_exception(e)
+
+    def submit(self, player: str, score: int) -> "Future[Optional[int]]":
+        """排队提交；返回的 future 完成时给出玩家当前名次"""
+        future: Future = Future()
+        future.add_done_callback(lambda f: _log_failure(f, player, score))
+        self._queue.put((player, score, future))
+        return future
+
+    def close(self) -> None:
+        """处理完已排队的提交后停止，并把日志写盘"""
+        self._queue.put(None)
+        self._thread.join()
+        self.board.close()
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Show a Hangman leaderboard")
+    p.add_argument("path")
+    p.add_argument("--top", type=int, default=10)
+    p.add_argument("--player", help="show this player's rank")
+    p.add_argument("--compact", action="store_true", help="rewrite the log with one line per player")
+    a = p.parse_args(argv)
+    with Leaderboard(a.path) as board:
+        if a.compact:
+            board.compact()
+        if a.player:
+            rank = board.rank(a.player)
+            if rank is None:
+                print(f"{a.player}: no score yet")
+            else:
+                print(f"{a.player}: #{rank} of {len(board)} with {board.best[a.player]}")
+            return 0
+        for i, (player, score) in enumerate(board.top(a.top), 1):
+            print(f"{i:>4}. {player:<24} {score:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
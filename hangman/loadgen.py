@@ -0,0 +1,217 @@
+"""
+Load generator for the line-protocol game server.
+Opens many simulated clients, each playing full games with a solver
+strategy and a random think time. Every finished game is checked on the
+client side by replaying the observed turns on a HangmanGame built from
+the revealed answer, so a server that answers fast but wrongly shows up
+as mismatches.
+
+Think times are exponential with the given mean; a draw that would not
+reach the server before the turn limit is not sent at all, so that turn
+times out and costs a life (reported as timeout life losses). A client
+whose solver runs out of letters (the answer is not in its word list)
+disconnects and is reported as having given up.
+
+    python -m hangman.loadgen --clients 2000 --games 3 --think 0.2 --seconds 2
+    python -m hangman.loadgen --connect 127.0.0.1:7777 --clients 500
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+from .cli import add_game_options, use_levels
+from .engine import HangmanGame
+from .server import HangmanServer, PLAY_AGAIN, PROMPT
+from .solver import STRATEGIES, Solver
+
+# 思考时间超过回合时限的这一比例时不再发送（避免迟到的字母落到下一回合）
+SEND_MARGIN = 0.1
+TICK, GUESS = "t", "g"
+
+
+class LoadStats:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.games = 0
+        self.wins = 0
+        self.timeouts = 0       # lives lost to the turn timer
+        self.mismatches = 0     # games whose responses disagree with HangmanGame
+        self.errors = 0         # clients that failed (connection reset, protocol error)
+        self.gave_up = 0        # clients whose solver had no letter left to guess
+
+    def percentiles(self) -> Tuple[float, float, float]:
+        if len(self.latencies) < 2:
+            value = self.latencies[0] if self.latencies else 0.0
+            return value, value, value
+        q = statistics.quantiles(self.latencies, n=100)
+        return q[49], q[94], q[98]
+
+    def format(self, elapsed: float, clients: int) -> str:
+        p50, p95, p99 = self.percentiles()
+        guesses = len(self.latencies)
+        return "\n".join([
+            f"{clients} clients, {self.games} games, {guesses} guesses in {elapsed:.2f}s",
+            f"throughput   {guesses / elapsed:,.0f} guesses/s, {self.games / elapsed:,.1f} games/s",
+            f"latency      p50 {p50 * 1e3:.3f} ms  p95 {p95 * 1e3:.3f} ms  p99 {p99 * 1e3:.3f} ms",
+            f"timeouts     {self.timeouts} lives lost "
+            f"({self.timeouts / self.games if self.games else 0:.2f} per game)",
+            f"win rate     {self.wins / self.games if self.games else 0:.1%}",
+            f"mismatches   {self.mismatches}   client errors {self.errors}   gave up {self.gave_up}",
+        ])
+
+
+def check_game(answer: str, lives: int, seconds: float, frames: List[Tuple[str, int]],
+               events: list, won: bool) -> bool:
+    """用 HangmanGame 重放客户端看到的回合，检查服务器的每个回应"""
+    game = HangmanGame(answer, lives=lives, seconds_per_turn=seconds)
+    if len(frames) != len(events):
+        return False
+    for (masked, shown_lives), event in zip(frames, events):
+        if (game.state.masked_answer(), game.state.lives) != (masked, shown_lives):
+            return False
+        if event[0] == TICK:
+            game.start_turn(0.0)
+            if not game.tick(seconds):
+                return False
+        elif list(game.guess(event[1])) != event[2]:
+            return False
+    return game.state.is_won() == won and game.state.status() != "playing"
+
+
+async def play_client(host: str, port: int, games: int, lives: int, seconds: float,
+                      solver: Solver, think: float, rng: random.Random, stats: LoadStats,
+                      gate: Optional[asyncio.Semaphore] = None) -> None:
+    if gate is None:
+        reader, writer = await asyncio.open_connection(host, port)
+    else:
+        async with gate:  # 限制同时建立的连接数，避免超出服务器的监听队列
+            reader, writer = await asyncio.open_connection(host, port)
+    loop = asyncio.get_running_loop()
+    try:
+        for n in range(games):
+            frames: List[Tuple[str, int]] = []
+            events: list = []
+            sent: deque = deque()
+            wrong: set = set()
+            masked, answer, won = "", "", False
+            while True:
+                line = (await reader.readline()).decode()
+                if not line:
+                    raise ConnectionError("server closed the connection")
+                line = line.rstrip("\n")
+                if line.startswith("Word: "):
+                    masked, _, shown = line[6:].rpartition(" Lives: ")
+                    frames.append((masked, int(shown)))
+                elif line == PROMPT:
+                    delay = rng.expovariate(1 / think) if think > 0 else 0.0
+                    if delay >= seconds * (1 - SEND_MARGIN):
+                        continue  # 不作答，等待超时
+                    if delay:
+                        await asyncio.sleep(delay)
+                    letter = solver.next_guess(masked, wrong)
+                    if not letter:  # 答案不在求解器的词表中：断开，不发送空行
+                        stats.gave_up += 1
+                        return
+                    writer.write(f"{letter}\n".encode())
+                    sent.append((letter, loop.time()))
+                elif line.startswith(("Correct + ", "Wrong - ")):
+                    letter, started = sent.popleft()
+                    stats.latencies.append(loop.time() - started)
+                    ok = line.startswith("Correct")
+                    if not ok:
+                        wrong.add(letter)
+                    events.append([GUESS, letter, [ok, int(line.rsplit(" ", 1)[1])]])
+                elif line == "Time's up! Life -1":
+                    stats.timeouts += 1
+                    events.append([TICK])
+                elif line.startswith("Answer: "):
+                    answer = line[8:]
+                elif line.startswith("Congratulations"):
+                    won = True
+                elif line == PLAY_AGAIN:
+                    break
+            stats.games += 1
+            stats.wins += won
+            if not check_game(answer, lives, seconds, frames, events, won):
+                stats.mismatches += 1
+            writer.write(b"y\n" if n + 1 < games else b"n\n")
+        await reader.readline()  # Thanks for playing!
+    finally:
+        writer.close()
+
+
+def raise_fd_limit(needed: int) -> None:
+    """需要时把打开文件数的软限制提高到硬限制"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard if hard != resource.RLIM_INFINITY else needed, hard))
+
+
+async def run_load(clients: int, games: int, level: str = "basic", lives: int = 6, seconds: float = 15,
+                   strategy: str = "frequency", think: float = 0.0, seed: Optional[int] = None,
+                   connect: Optional[Tuple[str, int]] = None, connect_concurrency: int = 100,
+                   words: Optional[Sequence[str]] = None) -> Tuple[LoadStats, float]:
+    """运行负载；connect 为空时在本进程内启动服务器；words 为求解器词表（默认内置词表）。
+    返回 (统计, 耗时)"""
+    server = None
+    if connect is None:
+        server = HangmanServer(level, lives, seconds)
+        await server.start()
+        connect = ("127.0.0.1", server.port)
+    stats = LoadStats()
+    solver = Solver(words, strategy=strategy, seed=seed)
+    gate = asyncio.Semaphore(connect_concurrency)
+
+    async def one(i: int) -> None:
+        rng = random.Random(f"{seed}:{i}")
+        try:
+            await play_client(connect[0], connect[1], games, lives, seconds, solver, think, rng, stats, gate)
+        except (ConnectionError, OSError, ValueError, IndexError):
+            stats.errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+    if server is not None:
+        while server.sessions:
+            await asyncio.sleep(0.01)
+        server.server.close()
+        await server.server.wait_closed()
+    return stats, elapsed
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Load-test the Hangman server")
+    add_game_options(p)
+    p.add_argument("--clients", type=int, default=1000)
+    p.add_argument("--games", type=int, default=3, help="games per client")
+    p.add_argument("--strategy", choices=STRATEGIES, default="frequency")
+    p.add_argument("--think", type=float, default=0.0, help="mean think time per turn in seconds")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--connect", metavar="HOST:PORT",
+                   help="load an already running server (same --lives/--seconds) instead of an in-process one")
+    a = p.parse_args(argv)
+    levels = use_levels(p, a.corpus, a.level)
+    words = [w for level in levels.values() for w in level] if a.corpus else None
+    connect = None
+    if a.connect:
+        host, _, port = a.connect.rpartition(":")
+        connect = (host or "127.0.0.1", int(port))
+    raise_fd_limit(a.clients * (1 if connect else 2) + 100)
+    stats, elapsed = asyncio.run(run_load(a.clients, a.games, a.level, a.lives, a.seconds, a.strategy,
+                                          a.think, a.seed, connect, words=words))
+    print(stats.format(elapsed, a.clients))
+    return 1 if stats.mismatches or stats.errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
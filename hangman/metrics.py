@@ -0,0 +1,263 @@
+"""
+Optional instrumentation for the engine and the CLI/GUI turn loops.
+Nothing is measured until enable() is called: it swaps timing wrappers
+onto HangmanGame.guess/tick and HangmanState.masked_answer, and disable()
+puts the original methods back, so switched-off metrics cost nothing.
+(EvilHangmanGame's narrowing runs before the wrapped guess and is not
+included in guess_seconds.)
+
+Histograms use fixed log-scale buckets (powers of two from 100ns to
+about 107s) counted in a preallocated array, so an observation is one
+bisect and three additions with no per-sample allocation.
+
+Export either as a snapshot file rewritten every few seconds (JSON, or
+Prometheus text for a .prom path) or over HTTP on localhost:
+
+    python run_hangman.py --metrics metrics.json
+    python run_hangman.py --metrics-port 9108   # curl localhost:9108/metrics
+"""
+from __future__ import annotations
+import json
+import os
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from functools import wraps
+from typing import Dict, Optional
+
+from .engine import HangmanGame, HangmanState
+
+PREFIX = "hangman_"
+BUCKETS = tuple(1e-7 * 2 ** k for k in range(31))  # 100ns .. 107s（上界，秒）
+
+COUNTERS = {
+    "guesses": "Letters guessed",
+    "correct_guesses": "Guesses that revealed a letter",
+    "wrong_guesses": "Guesses that cost a life",
+    "timeouts": "Turns lost to the timer",
+    "wins": "Games won",
+    "losses": "Games lost",
+}
+HISTOGRAMS = {
+    "guess_seconds": "HangmanGame.guess call time",
+    "tick_seconds": "HangmanGame.tick call time",
+    "masked_answer_seconds": "HangmanState.masked_answer call time",
+    "turn_input_seconds": "Time a turn waited for the player's input",
+    "turn_process_seconds": "Time a turn spent handling the input",
+}
+
+
+class Histogram:
+    """Fixed log-bucket histogram; counts[i] holds values <= bounds[i] (last slot: +Inf)"""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds=BUCKETS):
+        self.bounds = bounds
+        self.counts = array("Q", bytes(8 * (len(bounds) + 1)))
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """近似分位数：所在桶的上界"""
+        if not self.count:
+            return 0.0
+        target, seen = q * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= target:
+                return self.bounds[i] if i < len(self.bounds) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, object]:
+        return {"count": self.count, "sum": self.sum,
+                "p50": self.quantile(0.5), "p99": self.quantile(0.99),
+                "buckets": {format(b, ".3g"): n for b, n in zip(self.bounds, self.counts) if n},
+                "overflow": self.counts[-1]}
+
+
+class Metrics:
+    """Counters and histograms of one process"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.histograms: Dict[str, Histogram] = {name: Histogram() for name in HISTOGRAMS}
+
+    def inc(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def observe(self, name: str, value: float) -> None:
+        self.histograms[name].observe(value)
+
+    def observe_turn(self, waited: float, processed: float) -> None:
+        """一个回合：等待输入的时间与处理输入的时间"""
+        self.histograms["turn_input_seconds"].observe(waited)
+        self.histograms["turn_process_seconds"].observe(processed)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {"time": time.time(), "uptime": time.time() - self.started,
+                "counters": dict(self.counters),
+                "histograms": {name: h.snapshot() for name, h in self.histograms.items()}}
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 文本格式（0.0.4）"""
+        lines = []
+        for name, value in self.counters.items():
+            metric = f"{PREFIX}{name}_total"
+            lines += [f"# HELP {metric} {COUNTERS[name]}", f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, h in self.histograms.items():
+            metric = PREFIX + name
+            lines += [f"# HELP {metric} {HISTOGRAMS[name]}", f"# TYPE {metric} histogram"]
+            total = 0
+            for bound, n in zip(h.bounds, h.counts):
+                total += n
+                lines.append(f'{metric}_bucket{{le="{bound:.3g}"}} {total}')
+            lines += [f'{metric}_bucket{{le="+Inf"}} {h.count}', f"{metric}_sum {h.sum!r}",
+                      f"{metric}_count {h.count}"]
+        return "\n".join(lines) + "\n"
+
+
+METRICS: Optional[Metrics] = None
+_ORIGINALS: Dict[str, object] = {}
+
+
+def active() -> Optional[Metrics]:
+    """当前启用的 Metrics；未启用时为 None"""
+    return METRICS
+
+
+def _count_end(counters: Dict[str, int], state: HangmanState) -> None:
+    status = state.status()
+    if status != "playing":
+        counters["wins" if status == "won" else "losses"] += 1
+
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    """安装计时包装；重复调用返回已启用的实例"""
+    global METRICS
+    if METRICS is not None:
+        return METRICS
+    m = METRICS = metrics or Metrics()
+    guess, tick, masked_answer = HangmanGame.guess, HangmanGame.tick, HangmanState.masked_answer
+    _ORIGINALS.update(guess=guess, tick=tick, masked_answer=masked_answer)
+    clock, counters = time.perf_counter, m.counters
+    guess_hist, tick_hist, mask_hist = (m.histograms[name] for name in
+                                        ("guess_seconds", "tick_seconds", "masked_answer_seconds"))
+
+    @wraps(guess)
+    def timed_guess(self, letter):
+        playing = self.state.status() == "playing"
+        start = clock()
+        result = guess(self, letter)
+        guess_hist.observe(clock() - start)
+        if playing:
+            counters["guesses"] += 1
+            counters["correct_guesses" if result[0] else "wrong_guesses"] += 1
+            _count_end(counters, self.state)
+        return result
+
+    @wraps(tick)
+    def timed_tick(self, now):
+        start = clock()
+        expired = tick(self, now)
+        tick_hist.observe(clock() - start)
+        if expired:
+            counters["timeouts"] += 1
+            _count_end(counters, self.state)
+        return expired
+
+    @wraps(masked_answer)
+    def timed_masked_answer(self):
+        start = clock()
+        masked = masked_answer(self)
+        mask_hist.observe(clock() - start)
+        return masked
+
+    HangmanGame.guess, HangmanGame.tick = timed_guess, timed_tick
+    HangmanState.masked_answer = timed_masked_answer
+    return m
+
+
+def disable() -> None:
+    """恢复原始方法"""
+    global METRICS
+    if METRICS is None:
+        return
+    HangmanGame.guess, HangmanGame.tick = _ORIGINALS["guess"], _ORIGINALS["tick"]
+    HangmanState.masked_answer = _ORIGINALS["masked_answer"]
+    _ORIGINALS.clear()
+    METRICS = None
+
+
+def write_snapshot(metrics: Metrics, path: str) -> None:
+    """原子写入快照；.prom 路径写 Prometheus 文本，其余写 JSON"""
+    text = metrics.to_prometheus() if path.endswith(".prom") else metrics.to_json()
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+class Exporter:
+    """Periodic snapshot file and/or a localhost HTTP endpoint, each on a daemon thread"""
+
+    def __init__(self, metrics: Metrics, path: Optional[str] = None, interval: float = 10.0,
+                 port: Optional[int] = None, host: str = "127.0.0.1"):
+        self.metrics = metrics
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self.http = None
+        if path is not None:
+            self._writer = threading.Thread(target=self._write_loop, name="metrics-writer", daemon=True)
+            self._writer.start()
+        if port is not None:
+            from http.server import ThreadingHTTPServer  # 只在需要 HTTP 导出时加载
+            self.http = ThreadingHTTPServer((host, port), _handler(metrics))
+            threading.Thread(target=self.http.serve_forever, name="metrics-http", daemon=True).start()
+
+    def _write_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            write_snapshot(self.metrics, self.path)
+
+    def close(self) -> None:
+        """停止导出；快照文件最后再写一次"""
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join()
+            write_snapshot(self.metrics, self.path)
+        if self.http is not None:
+            self.http.shutdown()
+            self.http.server_close()
+
+
+def _handler(metrics: Metrics):
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/metrics.json"):
+                body, kind = metrics.to_json().encode(), "application/json"
+            else:
+                body, kind = metrics.to_prometheus().encode(), "text/plain; version=0.0.4"
+            self.send_response(200)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass  # 不在终端上打印访问日志
+
+    return Handler
@@ -0,0 +1,208 @@
+"""
+Reproducible profiling of whole play sessions.
+A scripted player replaces the keyboard and a virtual clock replaces real
+time, so a session never waits for input or sleeps. The same session is
+run twice from the same seed: once under cProfile for call statistics and
+once under tracemalloc for the top allocation sites (each tool would
+distort the other's numbers).
+
+The script is what you would pipe into the CLI, one line per prompt,
+including the y/n answers to "play again". A line '-' lets that turn run
+out the clock. When the script runs out mid-game the player continues
+with untried letters in frequency order; at the play-again prompt it
+keeps playing until --games games are done.
+
+    python run_hangman.py --profile --script session.txt --games 20
+    python -m hangman.profiling --gui --games 5
+"""
+from __future__ import annotations
+import argparse
+import cProfile
+import contextlib
+import io
+import os
+import pstats
+import tracemalloc
+import types
+from functools import partial
+from typing import Iterable, Iterator, List, Optional
+
+from . import cli
+from .dealer import DEFAULT_DEALER
+
+TIMEOUT = "-"
+FALLBACK_LETTERS = "etaoinshrdlucmfwypvbgkqjxz"
+
+
+class VirtualClock:
+    """Replacement for time.monotonic that only moves when told to"""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def read_script(path: str) -> List[str]:
+    """读取脚本：每行一次输入，'#' 开头的行为注释"""
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\r\n") for line in f if not line.startswith("#")]
+
+
+class ScriptedPlayer:
+    """Answers CLI prompts from a script on a virtual clock"""
+
+    def __init__(self, script: Iterable[str], clock: VirtualClock, games: int = 1, think: float = 1.0):
+        self.script: Iterator[str] = iter(script)
+        self.clock = clock
+        self.games = games
+        self.think = think
+        self.played = 1
+        self.typed: List[str] = []
+
+    def prompt(self, prompt: str, timeout: float) -> str:
+        """代替 prompt_with_timer：按脚本作答，虚拟时钟前进思考时间或整个回合"""
+        line = next(self.script, None)
+        if line is None:
+            line = next((c for c in FALLBACK_LETTERS if c not in self.typed), TIMEOUT)
+        if line == TIMEOUT:
+            self.clock.advance(timeout)
+            return ""
+        self.clock.advance(min(self.think, timeout))
+        self.typed.append(line.strip().lower())
+        return line
+
+    def ask_play_again(self) -> bool:
+        """代替 ask_play_again：先用脚本中的 y/n，脚本用完后玩满 games 局"""
+        self.typed = []
+        line = next(self.script, None)
+        again = self.played < self.games if line is None else line.strip().lower() in ("y", "yes")
+        self.played += again
+        return again
+
+
+@contextlib.contextmanager
+def scripted_cli(player: ScriptedPlayer):
+    """把 cli 的输入和时钟换成脚本玩家与虚拟时钟"""
+    saved = cli.prompt_with_timer, cli.ask_play_again, cli.time
+    cli.prompt_with_timer, cli.ask_play_again = player.prompt, player.ask_play_again
+    cli.time = types.SimpleNamespace(monotonic=player.clock.monotonic)
+    try:
+        yield
+    finally:
+        cli.prompt_with_timer, cli.ask_play_again, cli.time = saved
+
+
+def run_cli_session(script: List[str], games: int = 1, level: str = "basic", lives: int = 6,
+                    seconds: int = 15, mode: str = "classic", seed: int = 0, think: float = 1.0) -> int:
+    """用脚本玩一次完整的 CLI 会话（含所有打印输出）"""
+    DEFAULT_DEALER.reseed(seed)
+    player = ScriptedPlayer(script, VirtualClock(), games, think)
+    with scripted_cli(player):
+        return cli.run(level, lives, seconds, mode=mode)
+
+
+def run_gui_session(script: List[str], games: int = 1, seed: int = 0, think: float = 1.0) -> int:
+    """无人值守地驱动 GUI（需要显示器）：对话框自动应答，计时器用虚拟时钟"""
+    from unittest import mock
+    from . import gui
+
+    DEFAULT_DEALER.reseed(seed)
+    clock = VirtualClock()
+    player = ScriptedPlayer(script, clock, games, think)
+    fake_time = types.SimpleNamespace(monotonic=clock.monotonic)
+    with mock.patch.object(gui, "time", fake_time), \
+            mock.patch.object(gui.messagebox, "showinfo"), \
+            mock.patch.object(gui.messagebox, "showwarning"), \
+            mock.patch.object(gui.messagebox, "askyesno", side_effect=lambda *a: player.ask_play_again()):
+        app = gui.HangmanGUI()
+        app.root.withdraw()
+        try:
+            while app.game.state.status() == "playing":
+                text = player.prompt("", app.game.state.seconds_per_turn)
+                if text:
+                    app.letter_var.set(text)
+                    app.make_guess()
+                else:
+                    app.on_timer()  # 虚拟时钟已走完整个回合，触发超时
+                app.root.update_idletasks()
+        finally:
+            app.cancel_timer()
+            app.root.destroy()
+    return 0
+
+
+def profile(session, sort: str = "cumulative", limit: int = 25, dump: Optional[str] = None) -> str:
+    """运行两次同一会话：cProfile 调用统计与 tracemalloc 分配排行"""
+    out = io.StringIO()
+    profiler = cProfile.Profile()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        profiler.runcall(session)
+    if dump:
+        profiler.dump_stats(dump)
+    stats = pstats.Stats(profiler, stream=out)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+
+    tracemalloc.start(10)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            session()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    out.write(f"tracemalloc: {current / 1024:.1f} KiB live at the end, peak {peak / 1024:.1f} KiB\n")
+    out.write(f"top {limit} allocation sites (live at the end of the session):\n")
+    for stat in snapshot.statistics("lineno")[:limit]:
+        out.write(f"  {stat}\n")
+    return out.getvalue()
+
+
+def add_profile_options(p: argparse.ArgumentParser) -> None:
+    """--script/--games/--think 与报告选项"""
+    p.add_argument("--script", help="scripted input, one line per prompt ('-' lets the turn time out)")
+    p.add_argument("--games", type=int, default=10, help="games to play once the script runs out")
+    p.add_argument("--think", type=float, default=1.0, help="virtual seconds per typed answer")
+    p.add_argument("--sort", default="cumulative", help="pstats sort key")
+    p.add_argument("--limit", type=int, default=25, help="rows in each report")
+    p.add_argument("--dump", help="also save the raw cProfile stats to this file")
+
+
+def profile_from_args(a: argparse.Namespace, gui: bool = False) -> int:
+    script = read_script(a.script) if a.script else []
+    if not gui:
+        session = partial(run_cli_session, script, a.games, a.level, a.lives, a.seconds, a.mode, a.seed, a.think)
+        print(profile(session, a.sort, a.limit, a.dump))
+        return 0
+    try:
+        import tkinter
+    except ImportError as e:
+        print(f"GUI profiling needs Tkinter: {e}")
+        return 1
+    try:
+        print(profile(partial(run_gui_session, script, a.games, a.seed, a.think), a.sort, a.limit, a.dump))
+    except tkinter.TclError as e:
+        print(f"GUI profiling needs a display: {e}")
+        return 1
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Profile a scripted Hangman session")
+    cli.add_game_options(p)
+    p.add_argument("--mode", choices=("classic", "evil"), default="classic")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--gui", action="store_true", help="drive the Tk GUI headlessly (needs a display)")
+    add_profile_options(p)
+    a = p.parse_args(argv)
+    cli.use_levels(p, a.corpus, a.level)  # 会话开始时按 --seed 重置牌堆
+    return profile_from_args(a, a.gui)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,173 @@
+"""
+Event-sourced recording and replay of game sessions.
+RecordingGame logs every start_turn(now), guess(letter) and tick(now)
+together with what the engine returned. Replay feeds the same events to
+a fresh game on the recorded timestamps (a virtual clock, never sleeping)
+and reports the first step whose result or final outcome differs, e.g.
+after a scoring or timeout rule change.
+
+    python -m hangman.replay sessions.log --workers 4
+"""
+from __future__ import annotations
+import argparse
+import itertools
+import json
+import os
+import time
+from collections import deque
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .engine import HangmanGame
+from .results import ResultLog
+
+START, GUESS, TICK = "s", "g", "t"
+
+GameFactory = Callable[[str, int, float], HangmanGame]
+
+
+class RecordingGame(HangmanGame):
+    """HangmanGame that keeps an event log of every call"""
+
+    def __init__(self, answer: str, lives: int = 6, seconds_per_turn: int = 15):
+        super().__init__(answer, lives, seconds_per_turn)
+        self.initial_lives = lives
+        self.events: List[list] = []
+
+    def start_turn(self, now: float) -> None:
+        super().start_turn(now)
+        self.events.append([START, now])
+
+    def tick(self, now: float) -> bool:
+        timed_out = super().tick(now)
+        self.events.append([TICK, now, timed_out])
+        return timed_out
+
+    def guess(self, letter: str) -> Tuple[bool, int]:
+        ok, count = super().guess(letter)
+        self.events.append([GUESS, letter, [ok, count]])
+        return ok, count
+
+    def session(self) -> list:
+        """可序列化的会话记录：[answer, lives, seconds, events, outcome]"""
+        state = self.state
+        return [state.answer, self.initial_lives, state.seconds_per_turn, self.events,
+                [state.status(), state.lives, state.score]]
+
+
+class SessionLog(ResultLog):
+    """Buffered append-only log of recorded sessions, one JSON array per line"""
+
+    def append(self, game: RecordingGame) -> None:
+        self.write_record(game.session())
+
+
+def iter_sessions(path: str) -> Iterator[list]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class Divergence(NamedTuple):
+    index: int          # session number in the input
+    step: Optional[int]  # event index, or None when only the final outcome differs
+    expected: object
+    actual: object
+
+
+def replay(session: list, factory: GameFactory = HangmanGame,
+           index: int = 0) -> Optional[Divergence]:
+    """重放一局，返回第一处与记录不一致的地方（一致则返回 None）"""
+    answer, lives, seconds, events, outcome = session
+    game = factory(answer, lives, seconds)
+    for step, event in enumerate(events):
+        kind = event[0]
+        if kind == START:
+            game.start_turn(event[1])
+            continue
+        if kind == TICK:
+            actual = game.tick(event[1])
+        elif kind == GUESS:
+            actual = list(game.guess(event[1]))
+        else:
+            raise ValueError(f"unknown event {kind!r}")
+        if actual != event[2]:
+            return Divergence(index, step, event[2], actual)
+    state = game.state
+    actual = [state.status(), state.lives, state.score]
+    if actual != outcome:
+        return Divergence(index, None, outcome, actual)
+    return None
+
+
+def replay_batch(sessions: List[list], start: int = 0,
+                 factory: GameFactory = HangmanGame) -> Tuple[int, List[Divergence]]:
+    """重放一批会话，返回 (会话数, 不一致列表)"""
+    diverged = []
+    for i, session in enumerate(sessions, start):
+        d = replay(session, factory, i)
+        if d is not None:
+            diverged.append(d)
+    return len(sessions), diverged
+
+
+def _batches(sessions: Iterable[list], size: int) -> Iterator[Tuple[int, List[list]]]:
+    it = iter(sessions)
+    start = 0
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield start, batch
+        start += len(batch)
+
+
+def replay_all(sessions: Iterable[list], batch_size: int = 10000, workers: int = 1,
+               factory: GameFactory = HangmanGame) -> Tuple[int, List[Divergence]]:
+    """分批重放所有会话；workers > 1 时在进程池中并行
+
+    并行时最多 2 * workers 个批次在途，消费一个结果再读入并提交下一批，
+    内存占用与日志大小无关；结果按输入顺序汇总。
+    """
+    total, diverged = 0, []
+    if workers <= 1:
+        for start, batch in _batches(sessions, batch_size):
+            n, d = replay_batch(batch, start, factory)
+            total += n
+            diverged += d
+        return total, diverged
+    from concurrent.futures import ProcessPoolExecutor  # 进程池较重，按需导入
+    batches = _batches(sessions, batch_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque(pool.submit(replay_batch, batch, start, factory)
+                               for start, batch in itertools.islice(batches, 2 * workers))
+        while pending:
+            n, d = pending.popleft().result()
+            total += n
+            diverged += d
+            for start, batch in itertools.islice(batches, 1):
+                pending.append(pool.submit(replay_batch, batch, start, factory))
+    return total, diverged
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Replay recorded sessions and report divergences")
+    p.add_argument("path")
+    p.add_argument("--batch-size", type=int, default=10000)
+    p.add_argument("--workers", type=int, default=os.cpu_count())
+    p.add_argument("--show", type=int, default=20, help="divergences to print")
+    a = p.parse_args(argv)
+
+    start = time.perf_counter()
+    total, diverged = replay_all(iter_sessions(a.path), a.batch_size, a.workers)
+    elapsed = time.perf_counter() - start
+    for d in diverged[:a.show]:
+        where = "outcome" if d.step is None else f"event {d.step}"
+        print(f"session {d.index}: {where}: recorded {d.expected}, replayed {d.actual}")
+    print(f"{total} sessions replayed in {elapsed:.2f}s "
+          f"({total / elapsed if elapsed else 0:,.0f}/s), {len(diverged)} diverged")
+    return 1 if diverged else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
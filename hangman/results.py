@@ -0,0 +1,146 @@
+"""
+Append-only log of finished games.
+Each game is one JSON array per line (fields in GameResult order), written
+through an in-memory buffer so recording adds no work to the turn loop.
+The reader streams the file, so aggregates over very large logs run in
+memory proportional to the number of distinct words, not games.
+
+    python -m hangman.results results.log
+"""
+from __future__ import annotations
+import argparse
+import atexit
+import json
+import time
+from collections import Counter
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from .engine import HangmanGame
+
+
+class GameResult(NamedTuple):
+    answer: str
+    level: str
+    won: bool
+    lives: int
+    score: int
+    correct: int
+    wrong: int
+    guesses: str      # letters in the order they were guessed
+    duration: float   # seconds
+
+    @classmethod
+    def from_game(cls, game: HangmanGame, level: str, guesses: List[str], duration: float) -> "GameResult":
+        state = game.state
+        return cls(state.answer, level, state.is_won(), state.lives, state.score,
+                   state.get_correct_guesses(), state.get_wrong_guesses(),
+                   "".join(guesses), round(duration, 3))
+
+
+class ResultLog:
+    """Buffered appender; records reach disk every batch_size games and on close"""
+
+    def __init__(self, path: str, batch_size: int = 100):
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer: List[str] = []
+        atexit.register(self.flush)
+
+    def append(self, result: GameResult) -> None:
+        self.write_record(list(result))
+
+    def write_record(self, record) -> None:
+        """把一条记录编码为一行 JSON 放入缓冲区"""
+        self._buffer.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def close(self) -> None:
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __enter__(self) -> "ResultLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_results(path: str) -> Iterator[GameResult]:
+    """逐行读取结果日志"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield GameResult(*json.loads(line))
+
+
+class Summary:
+    """Streaming aggregates over a result log"""
+
+    def __init__(self, score_bucket: int = 10):
+        self.score_bucket = score_bucket
+        self.games = 0
+        self.wins = 0
+        self.total_duration = 0.0
+        self.scores: Counter = Counter()
+        self.words: Dict[str, List[int]] = {}  # word -> [games, wins]
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.wins += result.won
+        self.total_duration += result.duration
+        self.scores[result.score // self.score_bucket * self.score_bucket] += 1
+        entry = self.words.setdefault(result.answer, [0, 0])
+        entry[0] += 1
+        entry[1] += result.won
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    def word_win_rates(self) -> Dict[str, float]:
+        return {word: wins / games for word, (games, wins) in self.words.items()}
+
+    def format(self) -> str:
+        lines = [f"Games: {self.games}  Win rate: {self.win_rate:.1%}  "
+                 f"Average duration: {self.total_duration / self.games if self.games else 0:.1f}s",
+                 "", "Score histogram:"]
+        peak = max(self.scores.values(), default=1)
+        for bucket in sorted(self.scores):
+            n = self.scores[bucket]
+            lines.append(f"  {bucket:>5} .. {bucket + self.score_bucket - 1:<5} {n:>8}  "
+                         + "#" * max(1, n * 40 // peak))
+        lines += ["", "Win rate per word:"]
+        for word, (games, wins) in sorted(self.words.items()):
+            lines.append(f"  {word:<30} {wins / games:>6.1%} of {games}")
+        return "\n".join(lines)
+
+
+def summarize(path: str, score_bucket: int = 10) -> Summary:
+    summary = Summary(score_bucket)
+    for result in iter_results(path):
+        summary.add(result)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Summarize a Hangman result log")
+    p.add_argument("path")
+    p.add_argument("--bucket", type=int, default=10, help="score histogram bucket width")
+    a = p.parse_args(argv)
+    start = time.perf_counter()
+    summary = summarize(a.path, a.bucket)
+    print(summary.format())
+    print(f"\n({summary.games} records in {time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,227 @@
+"""
+Shared-puzzle rooms on asyncio.
+Every player in a room guesses letters on the same HangmanGame. Guesses
+go into the room's inbox and are applied by a single drain callback that
+the event loop runs once per batch, so each room is serialized on its own
+(no locks, no task per room) and all guesses that arrive together are
+fanned out as one write per player.
+
+Protocol (one line each way):
+    client  JOIN <room> [name]          then one letter per line, QUIT to leave
+    server  = <lives> <masked answer>   full state, on join and on a new round
+            + <letter> <p1,p2,..> <who> letter revealed at these positions
+            - <letter> <lives> <who>    wrong guess, lives left
+            ! won|lost <answer>         round over; a new '=' line follows
+            # <message>                 to one player only
+
+    python -m hangman.rooms --port 7778 --level basic
+
+A client that sends a line longer than the stream limit (64 KiB) is
+disconnected and logged.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import itertools
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .cli import add_game_options, choose_answer, use_levels
+from .engine import HangmanGame
+
+log = logging.getLogger(__name__)
+
+# 写缓冲超过该字节数的玩家（读得太慢）会被断开，避免拖慢整个房间
+MAX_BUFFER = 64 * 1024
+
+
+class Room:
+    """One shared game and its players"""
+
+    def __init__(self, name: str, new_game: Callable[[], HangmanGame], max_buffer: int = MAX_BUFFER):
+        self.name = name
+        self.new_game = new_game
+        self.max_buffer = max_buffer
+        self.game = new_game()
+        self.round = 0
+        self.players: Dict[asyncio.StreamWriter, str] = {}
+        self._inbox: List[Tuple[asyncio.StreamWriter, str, int]] = []
+        self._scheduled = False
+
+    def snapshot(self) -> str:
+        state = self.game.state
+        return f"= {state.lives} {state.masked_answer()}"
+
+    def join(self, writer: asyncio.StreamWriter, name: str) -> None:
+        self.players[writer] = name
+        writer.write(f"{self.snapshot()}\n".encode())
+
+    def leave(self, writer: asyncio.StreamWriter) -> None:
+        self.players.pop(writer, None)
+
+    def submit(self, writer: asyncio.StreamWriter, letter: str) -> None:
+        """放入收件箱；同一轮事件循环内到达的猜测在一次 drain 中处理"""
+        self._inbox.append((writer, letter, self.round))
+        if not self._scheduled:
+            self._scheduled = True
+            asyncio.get_running_loop().call_soon(self._drain)
+
+    def _drain(self) -> None:
+        self._scheduled = False
+        inbox, self._inbox = self._inbox, []
+        lines = []
+        for writer, letter, round_ in inbox:
+            if round_ != self.round:
+                continue  # 提交时的那一局已经结束
+            lines += self.apply(writer, letter)
+        if lines:
+            self.broadcast("".join(line + "\n" for line in lines).encode())
+
+    def apply(self, writer: asyncio.StreamWriter, letter: str) -> List[str]:
+        """处理一个猜测，返回要广播的增量行"""
+        state = self.game.state
+        who = self.players.get(writer, "?")
+        if len(letter) != 1 or not letter.isalpha():
+            writer.write(b"# enter a single letter\n")
+            return []
+        if letter in state.letters_guessed:
+            writer.write(f"# already guessed {letter}\n".encode())
+            return []
+        ok, _ = self.game.guess(letter)
+        if ok:
+            positions = ",".join(map(str, state.positions(letter)))
+            lines = [f"+ {letter} {positions} {who}"]
+        else:
+            lines = [f"- {letter} {state.lives} {who}"]
+        if state.status() != "playing":
+            lines.append(f"! {state.status()} {state.answer}")
+            self.game = self.new_game()
+            self.round += 1
+            lines.append(self.snapshot())
+        return lines
+
+    def broadcast(self, data: bytes) -> None:
+        for writer in list(self.players):
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                self.leave(writer)
+                writer.transport.abort()
+                continue
+            writer.write(data)
+
+
+class RoomServer:
+    """Line-protocol server hosting any number of shared-puzzle rooms"""
+
+    def __init__(self, level: str = "basic", lives: int = 6,
+                 answer_source: Callable[[str], str] = choose_answer, max_buffer: int = MAX_BUFFER):
+        self.level = level
+        self.lives = lives
+        self.answer_source = answer_source
+        self.max_buffer = max_buffer
+        self.rooms: Dict[str, Room] = {}
+        self.sessions = 0
+        self._ids = itertools.count(1)
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    def _new_game(self) -> HangmanGame:
+        return HangmanGame(self.answer_source(self.level), lives=self.lives)
+
+    def room(self, name: str) -> Room:
+        room = self.rooms.get(name)
+        if room is None:
+            room = self.rooms[name] = Room(name, self._new_game, self.max_buffer)
+        return room
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.sessions += 1
+        room = None
+        try:
+            words = (await reader.readline()).decode(errors="replace").split()
+            if len(words) < 2 or words[0].upper() != "JOIN":
+                writer.write(b"# expected: JOIN <room> [name]\n")
+                return
+            name = words[2] if len(words) > 2 else f"player{next(self._ids)}"
+            room = self.room(words[1])
+            room.join(writer, name)
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                text = line.decode(errors="replace").strip().lower()
+                if text == "quit":
+                    break
+                if text:
+                    room.submit(writer, text)
+        except ConnectionError:
+            pass
+        except ValueError as e:  # 行超过 StreamReader 的长度上限
+            log.warning("closing %s: %s", writer.get_extra_info("peername"), e)
+        finally:
+            self.sessions -= 1
+            if room is not None:
+                room.leave(writer)
+                if not room.players:
+                    self.rooms.pop(room.name, None)
+            writer.close()
+
+
+class RoomView:
+    """Client-side state rebuilt from the server's delta lines"""
+
+    def __init__(self):
+        self.masked: List[str] = []
+        self.lives = 0
+        self.finished: List[Tuple[str, str]] = []  # (won|lost, answer) per round
+
+    def apply(self, line: str) -> None:
+        kind, _, rest = line.rstrip("\n").partition(" ")
+        if kind == "=":
+            lives, _, masked = rest.partition(" ")
+            self.lives, self.masked = int(lives), list(masked)
+        elif kind == "+":
+            letter, positions, _ = rest.split(" ", 2)
+            for p in positions.split(","):
+                self.masked[int(p)] = letter
+        elif kind == "-":
+            self.lives = int(rest.split(" ")[1])
+        elif kind == "!":
+            status, _, answer = rest.partition(" ")
+            self.finished.append((status, answer))
+
+    def masked_answer(self) -> str:
+        return "".join(self.masked)
+
+
+async def serve(host: str, port: int, level: str, lives: int) -> None:
+    server = RoomServer(level, lives)
+    await server.start(host, port)
+    print(f"Hangman rooms listening on {host}:{server.port}")
+    async with server.server:
+        await server.server.serve_forever()
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Shared-puzzle Hangman rooms")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=7778)
+    add_game_options(p, seconds=False)
+    a = p.parse_args(argv)
+    use_levels(p, a.corpus, a.level)
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(serve(a.host, a.port, a.level, a.lives))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""
+Asyncio line-protocol game server.
+Each TCP connection plays its own HangmanGame session; per-turn timeouts
+are handled by the event loop instead of a polling loop.
+
+    python -m hangman.server --port 7777 --level basic
+    nc localhost 7777
+
+A client that sends a line longer than the stream limit (64 KiB) is
+disconnected and logged.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+from .cli import add_game_options, choose_answer, use_levels
+from .engine import HangmanGame
+
+log = logging.getLogger(__name__)
+
+PROMPT = "Enter a letter: "
+PLAY_AGAIN = "Do you want to play again? (y/n): "
+
+
+class HangmanServer:
+    """Serve one HangmanGame session per connection"""
+
+    def __init__(self, level: str = "basic", lives: int = 6, seconds_per_turn: float = 15,
+                 answer_source: Callable[[str], str] = choose_answer):
+        self.level = level
+        self.lives = lives
+        self.seconds_per_turn = seconds_per_turn
+        self.answer_source = answer_source
+        self.sessions = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.sessions += 1
+        try:
+            while True:
+                await self.play_game(reader, writer)
+                if not await self.ask_play_again(reader, writer):
+                    break
+            self._send(writer, "Thanks for playing!")
+            await writer.drain()
+        except (ConnectionError, EOFError):
+            pass
+        except ValueError as e:  # 行超过 StreamReader 的长度上限（LimitOverrunError 被转成 ValueError）
+            log.warning("closing %s: %s", writer.get_extra_info("peername"), e)
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    @staticmethod
+    def _send(writer: asyncio.StreamWriter, *lines: str) -> None:
+        writer.write("".join(line + "\n" for line in lines).encode())
+
+    @staticmethod
+    async def _readline(reader: asyncio.StreamReader) -> str:
+        line = await reader.readline()
+        if not line:
+            raise EOFError
+        return line.decode(errors="replace").rstrip("\r\n")
+
+    async def play_game(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """执行单次游戏（与 cli.play_single_game 输出一致）"""
+        loop = asyncio.get_running_loop()
+        answer = self.answer_source(self.level)
+        game = HangmanGame(answer=answer, lives=self.lives, seconds_per_turn=self.seconds_per_turn)
+        self._send(writer, f"Welcome to Hangman! Level: {self.level}",
+                   f"Hint: The word has {game.state.get_word_length()} letters.")
+        while game.state.status() == "playing":
+            self._send(writer, f"Word: {game.state.masked_answer()} Lives: {game.state.lives}", PROMPT)
+            await writer.drain()
+            game.start_turn(loop.time())
+            try:
+                s = await asyncio.wait_for(self._readline(reader), self.seconds_per_turn)
+            except asyncio.TimeoutError:
+                s = ""
+            timed_out = game.tick(loop.time())
+            if timed_out and not s:
+                self._send(writer, "Time's up! Life -1"); continue
+            if not s:
+                self._send(writer, "Try again."); continue
+            user_input = s.strip().lower()
+            if len(user_input) != 1 or not user_input.isalpha():
+                self._send(writer, "Please enter a single letter only."); continue
+            ok, cnt = game.guess(user_input)
+            self._send(writer, f"{'Correct +' if ok else 'Wrong -'} {cnt}")
+
+        state = game.state
+        self._send(writer, "=" * 50, f"Answer: {answer}", "Game Statistics:",
+                   f"  • Letters guessed: {state.get_guessed_letters()}",
+                   f"  • Correct guesses: {state.get_correct_guesses()}",
+                   f"  • Wrong guesses: {state.get_wrong_guesses()}",
+                   f"  • Lives remaining: {state.lives}")
+        if state.is_won():
+            self._send(writer, "Congratulations! You successfully guessed the word!")
+        else:
+            self._send(writer, "Game Over! You failed to guess the word.")
+        self._send(writer, "=" * 50)
+
+    async def ask_play_again(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        while True:
+            self._send(writer, PLAY_AGAIN)
+            await writer.drain()
+            choice = (await self._readline(reader)).strip().lower()
+            if choice in ("y", "yes"):
+                return True
+            if choice in ("n", "no"):
+                return False
+            self._send(writer, "Please enter 'y' for yes or 'n' for no.")
+
+
+async def serve(host: str, port: int, level: str, lives: int, seconds_per_turn: float) -> None:
+    server = HangmanServer(level, lives, seconds_per_turn)
+    await server.start(host, port)
+    print(f"Hangman server listening on {host}:{server.port}")
+    async with server.server:
+        await server.server.serve_forever()
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser()
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=7777)
+    add_game_options(p)
+    a = p.parse_args(argv)
+    use_levels(p, a.corpus, a.level)
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(serve(a.host, a.port, a.level, a.lives, a.seconds))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,198 @@
+"""
+Compact in-memory sessions for servers that park very many games.
+A CompactSession is a slotted object holding an interned answer (shared
+by every session with the same word) and one integer that packs the
+guessed-letter mask, lives, score, turn length, the answer's letters and
+turn start:
+
+    bits  0-25  guessed letters a-z
+    bits 26-33  lives (0-255)
+    bits 34-49  score + 32768
+    bits 50-61  seconds_per_turn in tenths of a second
+    bits 62-87  letters of the answer a-z
+    bits 88-    turn start in milliseconds + 1 (0 = no turn running)
+
+Keeping the answer's letters in the session means guesses and win checks
+never go through a per-answer cache, however many distinct answers are
+live. Times are kept to the millisecond and must not be negative.
+Answers must spell their letters with a-z; a guess outside a-z is a
+wrong guess, kept in a string of such guesses so repeating it is free.
+
+That keeps an idle session under 100 bytes (object plus its integer),
+against roughly a kilobyte for a HangmanGame with its HangmanState.
+Game rules are the same as HangmanGame; convert with from_game/to_game.
+"""
+from __future__ import annotations
+import sys
+from typing import Optional, Tuple
+
+from .engine import MASK_CACHE, HangmanGame, HangmanState, letter_bit, mask_to_letters
+
+_GUESSED = (1 << 26) - 1
+_LIVES_SHIFT, _SCORE_SHIFT, _SECONDS_SHIFT, _ANSWER_SHIFT, _TICK_SHIFT = 26, 34, 50, 62, 88
+_SCORE_BIAS = 1 << 15
+_KEEP = object()
+
+
+def intern_answer(answer: str) -> str:
+    """小写并驻留答案，使所有会话共享同一个字符串对象"""
+    return sys.intern(answer.lower())
+
+
+def _answer_mask(answer: str) -> int:
+    """答案中字母的位掩码；答案只能由 a-z 拼写"""
+    mask = 0
+    for ch in answer:
+        if ch.isalpha():
+            bit = letter_bit(ch)
+            if not bit:
+                raise ValueError(f"compact sessions only support answers spelled with a-z: {answer!r}")
+            mask |= bit
+    return mask
+
+
+def _pack(guessed: int, lives: int, score: int, seconds_per_turn: float, last_tick: Optional[float],
+          answer_mask: int) -> int:
+    if guessed & ~_GUESSED:
+        raise ValueError("compact sessions only support guesses a-z")
+    if not 0 <= lives <= 255:
+        raise ValueError(f"lives out of range: {lives}")
+    if not -_SCORE_BIAS <= score < _SCORE_BIAS:
+        raise ValueError(f"score out of range: {score}")
+    tenths = round(seconds_per_turn * 10)
+    if not 0 <= tenths < 1 << 12:
+        raise ValueError(f"seconds_per_turn out of range: {seconds_per_turn}")
+    if last_tick is None:
+        tick = 0
+    elif last_tick >= 0:
+        tick = round(last_tick * 1000) + 1
+    else:
+        raise ValueError("turn start must not be negative")
+    return (guessed | lives << _LIVES_SHIFT | (score + _SCORE_BIAS) << _SCORE_SHIFT
+            | tenths << _SECONDS_SHIFT | answer_mask << _ANSWER_SHIFT | tick << _TICK_SHIFT)
+
+
+class CompactSession:
+    """Slotted Hangman session: interned answer plus one packed integer"""
+
+    __slots__ = ("answer", "_bits", "_other")
+
+    def __init__(self, answer: str, lives: int = 6, seconds_per_turn: float = 15):
+        self.answer = intern_answer(answer)
+        self._bits = _pack(0, lives, 0, seconds_per_turn, None, _answer_mask(self.answer))
+        self._other = ""  # 猜过的 a-z 以外的字母（都是错的）
+
+    # 字段访问
+    @property
+    def guessed(self) -> int:
+        return self._bits & _GUESSED
+
+    @property
+    def lives(self) -> int:
+        return self._bits >> _LIVES_SHIFT & 0xFF
+
+    @property
+    def score(self) -> int:
+        return (self._bits >> _SCORE_SHIFT & 0xFFFF) - _SCORE_BIAS
+
+    @property
+    def seconds_per_turn(self) -> float:
+        tenths = self._bits >> _SECONDS_SHIFT & 0xFFF
+        return tenths // 10 if tenths % 10 == 0 else tenths / 10
+
+    @property
+    def answer_mask(self) -> int:
+        return self._bits >> _ANSWER_SHIFT & _GUESSED
+
+    @property
+    def last_tick(self) -> Optional[float]:
+        tick = self._bits >> _TICK_SHIFT
+        return None if tick == 0 else (tick - 1) / 1000
+
+    def _update(self, guessed: Optional[int] = None, lives: Optional[int] = None,
+                score: Optional[int] = None, last_tick=_KEEP) -> None:
+        self._bits = _pack(self.guessed if guessed is None else guessed,
+                           self.lives if lives is None else lives,
+                           self.score if score is None else score,
+                           self.seconds_per_turn,
+                           self.last_tick if last_tick is _KEEP else last_tick,
+                           self._bits >> _ANSWER_SHIFT & _GUESSED)
+
+    # 与 HangmanState / HangmanGame 相同的查询
+    def is_won(self) -> bool:
+        bits = self._bits
+        return bits >> _ANSWER_SHIFT & ~bits & _GUESSED == 0
+
+    def is_lost(self) -> bool:
+        return self.lives <= 0
+
+    def status(self) -> str:
+        if self.is_won():
+            return "won"
+        if self.is_lost():
+            return "lost"
+        return "playing"
+
+    def masked_answer(self) -> str:
+        return MASK_CACHE.get(self.answer, self.guessed & self.answer_mask)
+
+    # 与 HangmanGame 相同的规则
+    def start_turn(self, now: float) -> None:
+        self._update(last_tick=now)
+
+    def tick(self, now: float) -> bool:
+        if self.status() != "playing":
+            return False
+        last_tick = self.last_tick
+        if last_tick is None:
+            self._update(last_tick=now)
+            return False
+        if now - last_tick >= self.seconds_per_turn:
+            self._update(lives=self.lives - 1, last_tick=now)
+            return True
+        return False
+
+    def guess(self, letter: str) -> Tuple[bool, int]:
+        if self.status() != "playing":
+            return False, 0
+        if not letter or len(letter) != 1 or not letter.isalpha():
+            return False, 0
+        letter = letter.lower()
+        bit = letter_bit(letter)
+        if not bit:  # a-z 以外的字母不在答案中：猜错，记在 _other 里
+            if letter in self._other:
+                return False, 0
+            self._other += letter
+            self._update(score=self.score - 5, lives=self.lives - 1)
+            return False, 0
+        count = self.answer.count(letter) if self._bits >> _ANSWER_SHIFT & bit else 0
+        if self.guessed & bit:
+            return count > 0, count
+        if count:
+            self._update(guessed=self.guessed | bit, score=self.score + 10)
+            return True, count
+        self._update(guessed=self.guessed | bit, score=self.score - 5, lives=self.lives - 1)
+        return False, 0
+
+    # 与完整对象互相转换
+    @classmethod
+    def from_game(cls, game: HangmanGame) -> "CompactSession":
+        state = game.state
+        session = cls.__new__(cls)
+        session.answer = intern_answer(state.answer)
+        session._bits = _pack(state.guessed_mask, state.lives, state.score,
+                              state.seconds_per_turn, state.last_tick, _answer_mask(session.answer))
+        session._other = "".join(sorted(l for l in state.letters_guessed if not letter_bit(l)))
+        return session
+
+    def to_game(self) -> HangmanGame:
+        game = HangmanGame(self.answer, lives=self.lives, seconds_per_turn=self.seconds_per_turn)
+        letters = mask_to_letters(self.guessed) | set(self._other)
+        game.state = HangmanState(answer=self.answer, letters_guessed=letters,
+                                  lives=self.lives, last_tick=self.last_tick,
+                                  seconds_per_turn=self.seconds_per_turn, score=self.score)
+        return game
+
+    def __repr__(self) -> str:
+        return (f"CompactSession(answer={self.answer!r}, masked={self.masked_answer()!r}, "
+                f"lives={self.lives}, score={self.score})")
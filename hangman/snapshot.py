@@ -0,0 +1,159 @@
+"""
+Fixed-layout binary snapshots of HangmanState for checkpointing sessions.
+
+File layout (little endian):
+    header   magic(8s) record_count(Q) answer_count(Q)
+    records  record_count x RECORD
+    offsets  (answer_count + 1) x uint64, into the answer blob
+    blob     UTF-8 answers, concatenated
+
+Each record stores the answer id, guessed-letter bitmask, lives, score,
+seconds_per_turn and the time left in the current turn (NaN when no turn
+is running), so one session can be read through mmap without touching
+the rest of the file.
+
+The 32-bit mask holds a-z plus up to six answer-local bits for letters
+outside a-z that occur in the answer. Guesses outside a-z that are not
+in the answer are not stored; lives and score already count them.
+"""
+from __future__ import annotations
+import math
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .engine import HangmanGame, HangmanState, mask_to_letters
+
+MAGIC = b"HGSNAP01"
+HEADER = struct.Struct("<8sQQ")
+RECORD = struct.Struct("<IIiiff")  # answer_id, guessed, lives, score, seconds_per_turn, remaining
+OFFSET = struct.Struct("<Q")
+MASK_BITS = (1 << 32) - 1  # guessed 字段为 uint32
+
+
+def encode_state(state: HangmanState, answer_id: int, now: float) -> bytes:
+    """把一个 HangmanState 编码为定长记录"""
+    buf = bytearray(RECORD.size)
+    _pack_into(buf, 0, state, answer_id, now)
+    return bytes(buf)
+
+
+def _pack_into(buf, offset: int, state: HangmanState, answer_id: int, now: float) -> None:
+    mask = state.guessed_mask
+    if mask & ~MASK_BITS:
+        raise ValueError(f"answer has too many letters outside a-z for a snapshot: {state.answer!r}")
+    if state.last_tick is None:
+        remaining = math.nan
+    else:
+        remaining = state.seconds_per_turn - (now - state.last_tick)
+    RECORD.pack_into(buf, offset, answer_id, mask, state.lives, state.score,
+                     state.seconds_per_turn, remaining)
+
+
+def decode_state(data, answer: str, now: float, offset: int = 0) -> HangmanState:
+    """从定长记录恢复 HangmanState；计时按 now 重新定位"""
+    _, mask, lives, score, seconds, remaining = RECORD.unpack_from(data, offset)
+    if seconds == int(seconds):
+        seconds = int(seconds)
+    state = HangmanState(answer=answer, letters_guessed=mask_to_letters(mask, answer), lives=lives,
+                         seconds_per_turn=seconds, score=score)
+    if not math.isnan(remaining):
+        state.last_tick = now - (seconds - remaining)
+    return state
+
+
+def save_states(path: str, states: Iterable[HangmanState], now: Optional[float] = None) -> int:
+    """批量写入快照文件，返回写入的会话数"""
+    now = time.monotonic() if now is None else now
+    answer_ids: Dict[str, int] = {}
+    records = bytearray()
+    count = 0
+    for state in states:
+        answer_id = answer_ids.setdefault(state.answer, len(answer_ids))
+        records.extend(bytes(RECORD.size))
+        _pack_into(records, count * RECORD.size, state, answer_id, now)
+        count += 1
+
+    blobs = [answer.encode("utf-8") for answer in answer_ids]
+    offsets = bytearray(OFFSET.size * (len(blobs) + 1))
+    position = 0
+    for i, blob in enumerate(blobs):
+        OFFSET.pack_into(offsets, i * OFFSET.size, position)
+        position += len(blob)
+    OFFSET.pack_into(offsets, len(blobs) * OFFSET.size, position)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, count, len(blobs)))
+        f.write(records)
+        f.write(offsets)
+        f.write(b"".join(blobs))
+    return count
+
+
+class SnapshotFile:
+    """Random access to a snapshot file through mmap"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < HEADER.size:  # 空文件无法 mmap，过短的文件无法解析头部
+                raise ValueError(f"{path} is not a Hangman snapshot (only {size} bytes)")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.answer_count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a Hangman snapshot")
+        self._offsets = HEADER.size + self.count * RECORD.size
+        self._blob = self._offsets + (self.answer_count + 1) * OFFSET.size
+        if size < self._blob or size < self._blob + OFFSET.unpack_from(self._mm, self._blob - OFFSET.size)[0]:
+            self._mm.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "SnapshotFile":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def answer(self, answer_id: int) -> str:
+        start, end = struct.unpack_from("<QQ", self._mm, self._offsets + answer_id * OFFSET.size)
+        return self._mm[self._blob + start:self._blob + end].decode("utf-8")
+
+    def state(self, i: int, now: Optional[float] = None) -> HangmanState:
+        """只解码第 i 个会话"""
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        offset = HEADER.size + i * RECORD.size
+        (answer_id,) = struct.unpack_from("<I", self._mm, offset)
+        now = time.monotonic() if now is None else now
+        return decode_state(self._mm, self.answer(answer_id), now, offset)
+
+    __getitem__ = state
+
+    def game(self, i: int, now: Optional[float] = None) -> HangmanGame:
+        state = self.state(i, now)
+        game = HangmanGame(state.answer, lives=state.lives, seconds_per_turn=state.seconds_per_turn)
+        game.state = state
+        return game
+
+
+def load_states(path: str, now: Optional[float] = None) -> List[HangmanState]:
+    """读取整个快照文件"""
+    now = time.monotonic() if now is None else now
+    with SnapshotFile(path) as snap:
+        answers = [snap.answer(i) for i in range(snap.answer_count)]
+        mm = snap._mm
+        out = []
+        for i in range(snap.count):
+            offset = HEADER.size + i * RECORD.size
+            (answer_id,) = struct.unpack_from("<I", mm, offset)
+            out.append(decode_state(mm, answers[answer_id], now, offset))
+        return out
@@ -0,0 +1,170 @@
+"""
+Automated Hangman player.
+Builds a bitset index over a word list once, then narrows the candidates
+for a masked answer by intersecting per-(position, letter) bitsets.
+"""
+from __future__ import annotations
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .engine import HangmanGame, HangmanState, REVEAL_CHAR
+from .words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+# 没有候选词时使用的英文字母频率顺序
+FALLBACK_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+STRATEGIES = ("frequency", "partition", "random")
+
+
+try:
+    _popcount = int.bit_count
+except AttributeError:  # Python < 3.10
+    def _popcount(bits: int) -> int:
+        return bin(bits).count("1")
+
+
+def _members(bits: int) -> Iterator[int]:
+    """依次返回位集中置位的下标"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def word_shape(text: str) -> str:
+    """字母替换为 '_'，保留空格、连字符等字符"""
+    return "".join(REVEAL_CHAR if ch.isalpha() or ch == REVEAL_CHAR else ch for ch in text)
+
+
+class _ShapeGroup:
+    """All words sharing one shape, with bit i standing for words[i]"""
+
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.all = (1 << len(words)) - 1
+        self.at: Dict[Tuple[int, str], int] = {}
+        self.contains: Dict[str, int] = {}
+        for i, word in enumerate(words):
+            bit = 1 << i
+            for p, ch in enumerate(word):
+                if ch.isalpha():
+                    self.at[p, ch] = self.at.get((p, ch), 0) | bit
+                    self.contains[ch] = self.contains.get(ch, 0) | bit
+
+
+class WordIndex:
+    """按形状分组的候选词位集索引，每个词表只需构建一次"""
+
+    def __init__(self, words: Iterable[str]):
+        groups: Dict[str, List[str]] = {}
+        for word in dict.fromkeys(w.lower() for w in words):
+            groups.setdefault(word_shape(word), []).append(word)
+        self.groups = {shape: _ShapeGroup(ws) for shape, ws in groups.items()}
+
+    def candidates(self, masked: str, wrong: Iterable[str] = ()) -> Tuple[Optional[_ShapeGroup], int]:
+        """返回与显示串和错误字母一致的候选词（形状组, 位集）"""
+        group = self.groups.get(word_shape(masked))
+        if group is None:
+            return None, 0
+        bits = group.all
+        hidden = []
+        revealed = set()
+        for p, ch in enumerate(masked):
+            if ch == REVEAL_CHAR:
+                hidden.append(p)
+            elif ch.isalpha():
+                revealed.add(ch)
+                bits &= group.at.get((p, ch), 0)
+        for letter in wrong:
+            bits &= ~group.contains.get(letter, 0)
+        # 已揭示的字母不可能再出现在未揭示的位置
+        for letter in revealed:
+            for p in hidden:
+                bits &= ~group.at.get((p, letter), 0)
+        return group, bits
+
+    def matching(self, masked: str, wrong: Iterable[str] = ()) -> List[str]:
+        group, bits = self.candidates(masked, wrong)
+        if group is None:
+            return []
+        return [group.words[i] for i in _members(bits)]
+
+
+class Solver:
+    """根据当前显示串和错误字母选择下一个猜测"""
+
+    def __init__(self, words: Union[WordIndex, Sequence[str], None] = None,
+                 strategy: str = "frequency", seed: Optional[int] = None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy: {strategy}")
+        if words is None:
+            words = BASIC_WORDS + INTERMEDIATE_PHRASES
+        self.index = words if isinstance(words, WordIndex) else WordIndex(words)
+        self.strategy = strategy
+        self.rng = random.Random(seed)
+
+    def next_guess(self, masked: str, wrong: Iterable[str] = ()) -> str:
+        wrong = set(wrong)
+        guessed = wrong | {ch for ch in masked if ch.isalpha()}
+        group, bits = self.index.candidates(masked, wrong)
+        if bits:
+            options = [ch for ch in group.contains if ch not in guessed]
+            if self.strategy == "random":
+                useful = [ch for ch in options if bits & group.contains[ch]]
+                if useful:
+                    return self.rng.choice(sorted(useful))
+            elif self.strategy == "partition":
+                hidden = [p for p, ch in enumerate(masked) if ch == REVEAL_CHAR]
+                best = self._best_partition(group, bits, options, hidden)
+                if best:
+                    return best
+            else:
+                best = max(options, key=lambda ch: (_popcount(bits & group.contains[ch]), -ord(ch)), default=None)
+                if best and bits & group.contains[best]:
+                    return best
+        for ch in FALLBACK_ORDER:
+            if ch not in guessed:
+                return ch
+        return ""
+
+    @staticmethod
+    def _best_partition(group: _ShapeGroup, bits: int, options: List[str], hidden: List[int]) -> Optional[str]:
+        """选择使期望剩余候选数最小的字母
+
+        按字母在各隐藏位置是否出现逐位切分候选位集，得到所有位置模式类。
+        """
+        best, best_cost = None, None
+        for ch in sorted(options):
+            present = bits & group.contains[ch]
+            if not present:
+                continue
+            classes = [present]
+            for p in hidden:
+                at = group.at.get((p, ch), 0)
+                split = []
+                for members in classes:
+                    inside = members & at
+                    if inside:
+                        split.append(inside)
+                    if inside != members:
+                        split.append(members ^ inside)
+                classes = split
+            cost = _popcount(bits ^ present) ** 2 + sum(_popcount(c) ** 2 for c in classes)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = ch, cost
+        return best
+
+    def guess_for(self, state: HangmanState) -> str:
+        masked = state.masked_answer()
+        return self.next_guess(masked, state.letters_guessed - set(masked))
+
+
+def play(game: HangmanGame, solver: Solver) -> int:
+    """让 solver 玩完一局，返回猜测次数"""
+    guesses = 0
+    while game.state.status() == "playing":
+        letter = solver.guess_for(game.state)
+        if not letter:
+            break
+        game.guess(letter)
+        guesses += 1
+    return guesses
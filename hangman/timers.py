@@ -0,0 +1,118 @@
+"""
+Hashed timing wheel for per-turn timeouts across many games.
+Arming, cancelling and firing a timer are O(1); expired turns are handed
+to a callback in one batch per advance() instead of polling every game.
+"""
+from __future__ import annotations
+import math
+from typing import Any, Callable, Dict, Hashable, List
+
+from .engine import HangmanGame
+
+
+class TimerHandle:
+    """Returned by TimingWheel.arm(); pass it to cancel()"""
+    __slots__ = ("key", "deadline", "tick", "payload")
+
+    def __init__(self, key: Hashable, deadline: float, tick: int, payload: Any):
+        self.key = key
+        self.deadline = deadline
+        self.tick = tick
+        self.payload = payload
+
+
+class TimingWheel:
+    """Hashed timing wheel: a timer lives in slot (tick % slots)
+
+    Timers more than one revolution away share a slot with nearer ones
+    and are skipped until the wheel reaches their absolute tick.
+    """
+
+    def __init__(self, resolution: float = 0.1, slots: int = 512, now: float = 0.0):
+        self.resolution = resolution
+        self.slots: List[Dict[int, TimerHandle]] = [{} for _ in range(slots)]
+        self.current = math.floor(now / resolution) + 1  # next tick to process
+        self._armed = 0
+
+    def __len__(self) -> int:
+        return self._armed
+
+    def arm(self, deadline: float, key: Hashable = None, payload: Any = None) -> TimerHandle:
+        """在 deadline 时触发；返回可用于取消的句柄"""
+        tick = max(math.ceil(deadline / self.resolution), self.current)
+        handle = TimerHandle(key, deadline, tick, payload)
+        self.slots[tick % len(self.slots)][id(handle)] = handle
+        self._armed += 1
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        if self.slots[handle.tick % len(self.slots)].pop(id(handle), None) is None:
+            return False
+        self._armed -= 1
+        return True
+
+    def advance(self, now: float) -> List[TimerHandle]:
+        """处理到 now 为止的所有刻度，返回本批到期的定时器"""
+        end = math.floor(now / self.resolution)
+        if end < self.current:
+            return []
+        size = len(self.slots)
+        expired: List[TimerHandle] = []
+        # 跳过整圈以上时每个槽只需检查一次
+        for tick in range(self.current, min(end, self.current + size - 1) + 1):
+            slot = self.slots[tick % size]
+            if not slot:
+                continue
+            due = [hid for hid, handle in slot.items() if handle.tick <= end]
+            for hid in due:
+                expired.append(slot.pop(hid))
+        self.current = end + 1
+        self._armed -= len(expired)
+        return expired
+
+
+class TurnTimers:
+    """Per-turn timeouts for many HangmanGame objects on one timing wheel
+
+    arm() starts a turn and schedules its deadline; advance() calls
+    game.tick(now) for every due game, so lives are lost exactly as with
+    a direct tick(), and reports the games that timed out in one batch.
+    """
+
+    def __init__(self, on_timeout: Callable[[List[HangmanGame]], None],
+                 resolution: float = 0.1, slots: int = 512, now: float = 0.0):
+        self.wheel = TimingWheel(resolution, slots, now)
+        self.on_timeout = on_timeout
+        self._handles: Dict[int, TimerHandle] = {}
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def arm(self, game: HangmanGame, now: float) -> None:
+        self.cancel(game)
+        game.start_turn(now)
+        self._handles[id(game)] = self.wheel.arm(now + game.state.seconds_per_turn, id(game), game)
+
+    def cancel(self, game: HangmanGame) -> None:
+        handle = self._handles.pop(id(game), None)
+        if handle is not None:
+            self.wheel.cancel(handle)
+
+    def advance(self, now: float) -> List[HangmanGame]:
+        timed_out = []
+        for handle in self.wheel.advance(now):
+            game = handle.payload
+            del self._handles[handle.key]
+            if game.tick(now):
+                timed_out.append(game)
+                if game.state.status() == "playing":
+                    # tick() 已把 last_tick 设为 now，下一回合从这里开始计时
+                    self._handles[handle.key] = self.wheel.arm(
+                        now + game.state.seconds_per_turn, handle.key, game)
+            elif game.state.status() == "playing" and game.state.last_tick is not None:
+                # 回合被重新开始过（例如直接调用了 start_turn），按新的截止时间重新挂上
+                self._handles[handle.key] = self.wheel.arm(
+                    game.state.last_tick + game.state.seconds_per_turn, handle.key, game)
+        if timed_out:
+            self.on_timeout(timed_out)
+        return timed_out
@@ -0,0 +1,282 @@
+"""
+Discrete-event simulator for tuning seconds_per_turn and lives.
+Simulated players answer after a response time drawn from a model
+(lognormal, or empirical from recorded sessions) with a solver strategy
+choosing the letter. Events from all concurrent players go through one
+heap ordered by virtual time; nothing ever sleeps. Each turn drives the
+real HangmanGame: start_turn, then tick at the answer or at the deadline,
+then guess. An answer that is not in before the deadline is lost, as in
+the CLI, and the turn costs a life.
+
+The report separates games lost to the timer (the last life went to a
+timeout) from games lost to wrong guesses, for every seconds x lives
+combination. A player whose solver has no letter left (the answer is not
+in its word list) abandons the game; those games are reported as given
+up and not counted in the other columns.
+
+    python -m hangman.timersim --seconds 5,10,15 --lives 4,6 --response lognormal:4,0.8
+    python -m hangman.timersim --response empirical:sessions.log --games 200000
+"""
+from __future__ import annotations
+import argparse
+import heapq
+import itertools
+import math
+import random
+import time
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .corpus import load_levels
+from .engine import HangmanGame
+from .replay import GUESS, START, TICK, iter_sessions
+from .solver import STRATEGIES, Solver
+from .tournament import lives_list
+
+ANSWER, DEADLINE = 0, 1  # 事件类型
+
+
+class LogNormal:
+    """Response times with the given median (seconds) and log-space sigma"""
+
+    def __init__(self, median: float, sigma: float):
+        if median <= 0 or sigma < 0:
+            raise ValueError("lognormal needs median > 0 and sigma >= 0")
+        self.median = median
+        self.sigma = sigma
+        self.mu = math.log(median)
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.lognormvariate(self.mu, self.sigma)
+
+    def __repr__(self) -> str:
+        return f"lognormal(median={self.median}s, sigma={self.sigma})"
+
+
+class Empirical:
+    """Response times resampled from observations.
+
+    censored holds lower bounds from turns that timed out unanswered; a
+    draw of one is replaced by a random observed time above the bound,
+    or by infinity (never answers) when there is none.
+    """
+
+    def __init__(self, answered: Sequence[float], censored: Sequence[float] = ()):
+        self.answered = sorted(answered)
+        self.samples = [(t, False) for t in answered] + [(t, True) for t in censored]
+        if not self.samples:
+            raise ValueError("no response times to sample from")
+
+    @classmethod
+    def from_sessions(cls, path: str) -> "Empirical":
+        """从会话日志取每回合的作答时间（START 到 TICK；超时未答的回合是删失样本）"""
+        answered, censored = [], []
+        for session in iter_sessions(path):
+            events = session[3]
+            started = None
+            for i, event in enumerate(events):
+                if event[0] == START:
+                    started = event[1]
+                elif event[0] == TICK and started is not None:
+                    elapsed = event[1] - started
+                    if i + 1 < len(events) and events[i + 1][0] == GUESS:
+                        answered.append(elapsed)
+                    elif event[2]:  # 超时且没有作答
+                        censored.append(elapsed)
+                    started = None
+        return cls(answered, censored)
+
+    def sample(self, rng: random.Random) -> float:
+        value, censored = rng.choice(self.samples)
+        if not censored:
+            return value
+        i = bisect_right(self.answered, value)
+        return self.answered[rng.randrange(i, len(self.answered))] if i < len(self.answered) else math.inf
+
+    def __repr__(self) -> str:
+        censored = len(self.samples) - len(self.answered)
+        return f"empirical({len(self.answered)} answered, {censored} timed out)"
+
+
+def parse_response(text: str):
+    """lognormal:MEDIAN,SIGMA 或 empirical:SESSIONS.LOG"""
+    kind, _, args = text.partition(":")
+    if kind == "lognormal":
+        median, _, sigma = args.partition(",")
+        return LogNormal(float(median), float(sigma or 0.5))
+    if kind == "empirical":
+        return Empirical.from_sessions(args)
+    raise ValueError(f"unknown response model: {text!r} (lognormal:MEDIAN,SIGMA or empirical:PATH)")
+
+
+class SimStats:
+    def __init__(self, seconds: float, lives: int):
+        self.seconds = seconds
+        self.lives = lives
+        self.games = 0
+        self.wins = 0
+        self.lost_to_timeouts = 0   # the last life went to the timer
+        self.lost_to_wrong = 0      # the last life went to a wrong guess
+        self.timeouts = 0           # lives lost to the timer in all games
+        self.wrong = 0              # lives lost to wrong guesses in all games
+        self.turns = 0
+        self.game_time = 0.0        # virtual seconds spent in games
+        self.gave_up = 0            # games abandoned because the solver had no letter left
+
+    def row(self) -> str:
+        games = self.games or 1
+        lives_lost = (self.timeouts + self.wrong) or 1
+        return (f"{self.seconds:>7g} {self.lives:>5} {self.games:>9} {self.wins / games:>6.1%} "
+                f"{self.lost_to_timeouts / games:>10.1%} {self.lost_to_wrong / games:>10.1%} "
+                f"{self.timeouts / lives_lost:>13.1%} {self.turns / games:>10.1f} {self.game_time / games:>9.1f}s "
+                f"{self.gave_up:>7}")
+
+
+HEADER = (f"{'seconds':>7} {'lives':>5} {'games':>9} {'win%':>6} {'lost:timer':>10} {'lost:wrong':>10} "
+          f"{'lives:timer%':>13} {'turns/game':>10} {'game time':>10} {'gave up':>7}")
+
+
+def cached_policy(solver: Solver) -> Callable[[HangmanGame, List[str]], str]:
+    """确定性策略按 (显示串, 已猜掩码) 缓存选择；random 策略每次都问 solver"""
+    if solver.strategy == "random":
+        return lambda game, wrong: solver.next_guess(game.state.masked_answer(), wrong)
+    cache: Dict[Tuple[str, int], str] = {}
+
+    def policy(game: HangmanGame, wrong: List[str]) -> str:
+        masked = game.state.masked_answer()
+        key = (masked, game.state.guessed_mask)
+        letter = cache.get(key)
+        if letter is None:
+            letter = cache[key] = solver.next_guess(masked, wrong)
+        return letter
+    return policy
+
+
+def simulate(words: Sequence[str], seconds: float, lives: int, response, solver: Solver,
+             games: int, players: int = 1000, spread: float = 0.0, seed: Optional[int] = None,
+             policy: Optional[Callable[[HangmanGame, List[str]], str]] = None) -> SimStats:
+    """模拟 games 局：players 个玩家并发，事件按虚拟时间从一个堆中取出
+
+    spread > 0 时每个玩家有自己的快慢系数（对数正态，sigma=spread）。
+    引擎只看到每回合内的相对时间（start_turn(0)、tick(作答时间)），截止判断没有浮点误差。
+    """
+    rng = random.Random(seed)
+    policy = policy or cached_policy(solver)
+    stats = SimStats(seconds, lives)
+    deadline = float(seconds)
+    heap: List[Tuple[float, int, int, int, float]] = []
+    seq = itertools.count()
+    games_left = games
+    speed = [rng.lognormvariate(0.0, spread) if spread else 1.0 for _ in range(min(players, games))]
+    current: List[Optional[HangmanGame]] = [None] * len(speed)
+    wrong: List[List[str]] = [[] for _ in speed]
+    started = [0.0] * len(speed)
+
+    def start_turn(p: int, now: float) -> None:
+        current[p].start_turn(0.0)
+        answer_in = response.sample(rng) * speed[p]
+        if answer_in < deadline:
+            heapq.heappush(heap, (now + answer_in, next(seq), p, ANSWER, answer_in))
+        else:
+            heapq.heappush(heap, (now + deadline, next(seq), p, DEADLINE, deadline))
+
+    def new_game(p: int, now: float) -> None:
+        nonlocal games_left
+        games_left -= 1
+        current[p] = HangmanGame(rng.choice(words), lives=lives, seconds_per_turn=seconds)
+        wrong[p] = []
+        started[p] = now
+        start_turn(p, now)
+
+    for p in range(len(speed)):
+        new_game(p, 0.0)
+    while heap:
+        now, _, p, kind, elapsed = heapq.heappop(heap)
+        game = current[p]
+        stats.turns += 1
+        if game.tick(elapsed):
+            stats.timeouts += 1
+            last = DEADLINE
+        else:
+            letter = policy(game, wrong[p])
+            if not letter:  # 求解器无字母可猜：放弃这一局（否则回合永远不会结束）
+                stats.gave_up += 1
+                if games_left > 0:
+                    new_game(p, now)
+                continue
+            lives_before = game.state.lives
+            ok, _ = game.guess(letter)
+            if not ok:
+                wrong[p].append(letter)
+            if game.state.lives < lives_before:
+                stats.wrong += 1
+            last = ANSWER
+        state = game.state
+        if state.status() == "playing":
+            start_turn(p, now)
+            continue
+        stats.games += 1
+        stats.game_time += now - started[p]
+        if state.is_won():
+            stats.wins += 1
+        elif last == DEADLINE:
+            stats.lost_to_timeouts += 1
+        else:
+            stats.lost_to_wrong += 1
+        if games_left > 0:
+            new_game(p, now)
+    return stats
+
+
+def seconds_list(text: str) -> List[float]:
+    """解析 --seconds，如 "5,10,15"；每项须为正的有限数"""
+    try:
+        values = [float(x) for x in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated numbers, got {text!r}") from None
+    if not all(0 < v < math.inf for v in values):
+        raise argparse.ArgumentTypeError(f"seconds must be positive, got {text!r}")
+    return values
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Simulate turn timers and lives against modeled response times")
+    p.add_argument("--seconds", type=seconds_list, default=[5.0, 10.0, 15.0],
+                   help="comma-separated seconds_per_turn values")
+    p.add_argument("--lives", type=lives_list, default=[6], help="comma-separated lives values")
+    p.add_argument("--response", default="lognormal:4,0.8",
+                   help="lognormal:MEDIAN,SIGMA or empirical:SESSIONS.LOG (see --record)")
+    p.add_argument("--spread", type=float, default=0.0,
+                   help="per-player speed variation (lognormal sigma; 0 = every player alike)")
+    p.add_argument("--strategy", choices=STRATEGIES, default="frequency")
+    p.add_argument("--level", default="basic")
+    p.add_argument("--corpus", help="compiled word corpus (see python -m hangman.corpus)")
+    p.add_argument("--games", type=int, default=100000, help="games per configuration")
+    p.add_argument("--players", type=int, default=1000, help="concurrent simulated players")
+    p.add_argument("--seed", type=int, default=0)
+    a = p.parse_args(argv)
+    try:
+        response = parse_response(a.response)
+        levels = load_levels(a.corpus)
+    except (OSError, ValueError) as e:
+        p.error(str(e))
+    if a.level not in levels:
+        p.error(f"unknown level {a.level!r} (choose from {', '.join(levels)})")
+    solver = Solver([w for words in levels.values() for w in words], strategy=a.strategy, seed=a.seed)
+    policy = cached_policy(solver)
+    print(f"response {response}, strategy {a.strategy}, level {a.level}, spread {a.spread}")
+    print(HEADER)
+    turns, start = 0, time.perf_counter()
+    for seconds in a.seconds:
+        for lives in a.lives:
+            stats = simulate(levels[a.level], seconds, lives, response, solver, a.games,
+                             a.players, a.spread, a.seed, policy)
+            turns += stats.turns
+            print(stats.row())
+    elapsed = time.perf_counter() - start
+    print(f"{turns:,} turns in {elapsed:.1f}s ({turns / elapsed * 60:,.0f} turns/min)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
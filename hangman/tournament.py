@@ -0,0 +1,189 @@
+"""
+Headless tournament runner.
+Plays many solver games for every strategy x lives x level configuration
+across a process pool and reports win rate, score distribution and
+guesses to solve per configuration and per word.
+
+    python -m hangman.tournament --games 100000 --seed 1
+"""
+from __future__ import annotations
+import argparse
+import itertools
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from .corpus import load_levels
+from .engine import HangmanGame
+from .solver import STRATEGIES, Solver, play
+
+Config = Tuple[str, int, str]  # (strategy, lives, level)
+
+# 每个工作进程缓存一个 Solver，避免每块重建索引
+_SOLVERS: Dict[Tuple[str, Optional[str]], Solver] = {}
+
+
+class Aggregate:
+    """Compact partial results for one configuration, mergeable across workers"""
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.scores: Counter = Counter()
+        self.solve_guesses: Counter = Counter()
+        # word -> [games, wins, guesses on won games]
+        self.words: Dict[str, List[int]] = {}
+
+    def add(self, answer: str, won: bool, score: int, guesses: int) -> None:
+        self.games += 1
+        self.scores[score] += 1
+        entry = self.words.setdefault(answer, [0, 0, 0])
+        entry[0] += 1
+        if won:
+            self.wins += 1
+            self.solve_guesses[guesses] += 1
+            entry[1] += 1
+            entry[2] += guesses
+
+    def merge(self, other: "Aggregate") -> None:
+        self.games += other.games
+        self.wins += other.wins
+        self.scores.update(other.scores)
+        self.solve_guesses.update(other.solve_guesses)
+        for word, (games, wins, guesses) in other.words.items():
+            entry = self.words.setdefault(word, [0, 0, 0])
+            entry[0] += games
+            entry[1] += wins
+            entry[2] += guesses
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    def mean_solve_guesses(self) -> float:
+        total = sum(k * n for k, n in self.solve_guesses.items())
+        return total / self.wins if self.wins else 0.0
+
+    def score_percentiles(self, *qs: float) -> List[int]:
+        ordered = sorted(self.scores.items())
+        out = []
+        for q in qs:
+            target, seen = q * self.games, 0
+            for score, n in ordered:
+                seen += n
+                if seen >= target:
+                    out.append(score)
+                    break
+            else:
+                out.append(0)
+        return out
+
+
+def play_chunk(config: Config, seed: str, games: int, corpus: Optional[str] = None) -> Aggregate:
+    """工作进程入口：用固定种子玩一块游戏，只返回汇总结果
+
+    corpus 为编译语料的路径，各工作进程 mmap 同一文件。
+    """
+    strategy, lives, level = config
+    levels = load_levels(corpus)
+    solver = _SOLVERS.get((strategy, corpus))
+    if solver is None:
+        words = [w for level_words in levels.values() for w in level_words]
+        solver = _SOLVERS[strategy, corpus] = Solver(words, strategy=strategy)
+    words = levels[level]
+    rng = random.Random(seed)
+    solver.rng.seed(seed)
+    agg = Aggregate()
+    for _ in range(games):
+        answer = rng.choice(words)
+        game = HangmanGame(answer, lives=lives)
+        guesses = play(game, solver)
+        agg.add(answer, game.state.is_won(), game.state.score, guesses)
+    return agg
+
+
+def run_tournament(configs: List[Config], games: int, chunk_size: int = 1000,
+                   workers: Optional[int] = None, seed: Optional[int] = None,
+                   corpus: Optional[str] = None) -> Dict[Config, Aggregate]:
+    """把每个配置的 games 局按块分发给进程池并合并结果"""
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    results = {config: Aggregate() for config in configs}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for i, config in enumerate(configs):
+            for chunk, start in enumerate(range(0, games, chunk_size)):
+                n = min(chunk_size, games - start)
+                # 种子只取决于配置和块编号，与调度顺序无关
+                future = pool.submit(play_chunk, config, f"{seed}:{i}:{chunk}", n, corpus)
+                futures[future] = config
+        for future in as_completed(futures):
+            results[futures[future]].merge(future.result())
+    return results
+
+
+def format_report(results: Dict[Config, Aggregate], per_word: bool = False) -> str:
+    lines = [f"{'strategy':>10} {'lives':>5} {'level':>12} {'games':>9} {'win%':>6} "
+             f"{'guesses':>7} {'score p10/p50/p90':>18}"]
+    for (strategy, lives, level), agg in results.items():
+        p10, p50, p90 = agg.score_percentiles(0.1, 0.5, 0.9)
+        lines.append(f"{strategy:>10} {lives:>5} {level:>12} {agg.games:>9} "
+                     f"{agg.win_rate:>6.1%} {agg.mean_solve_guesses():>7.2f} "
+                     f"{f'{p10}/{p50}/{p90}':>18}")
+        if per_word:
+            for word, (games, wins, guesses) in sorted(agg.words.items()):
+                avg = guesses / wins if wins else 0.0
+                lines.append(f"{'':>10} {word:<30} {games:>9} {wins / games:>6.1%} {avg:>7.2f}")
+    return "\n".join(lines)
+
+
+def lives_list(text: str) -> List[int]:
+    """解析 --lives，如 "4,6,8"；每项须为正整数"""
+    try:
+        values = [int(x) for x in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got {text!r}") from None
+    if any(v < 1 for v in values):
+        raise argparse.ArgumentTypeError(f"lives must be at least 1, got {text!r}")
+    return values
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description="Run solver tournaments")
+    p.add_argument("--strategies", default=",".join(STRATEGIES))
+    p.add_argument("--lives", type=lives_list, default=[6], help="comma-separated, e.g. 4,6,8")
+    p.add_argument("--levels", default="basic,intermediate")
+    p.add_argument("--games", type=int, default=10000, help="games per configuration")
+    p.add_argument("--chunk-size", type=int, default=1000)
+    p.add_argument("--workers", type=int, default=os.cpu_count())
+    p.add_argument("--seed", type=int)
+    p.add_argument("--per-word", action="store_true")
+    p.add_argument("--corpus", help="compiled word corpus to draw answers and solver words from")
+    a = p.parse_args(argv)
+
+    try:
+        levels = load_levels(a.corpus)
+    except (OSError, ValueError) as e:
+        p.error(str(e))
+    configs = list(itertools.product(
+        a.strategies.split(","), a.lives, a.levels.split(",")))
+    for strategy, _, level in configs:
+        if strategy not in STRATEGIES:
+            p.error(f"unknown strategy: {strategy}")
+        if level not in levels:
+            p.error(f"unknown level: {level}")
+
+    start = time.perf_counter()
+    results = run_tournament(configs, a.games, a.chunk_size, a.workers, a.seed, a.corpus)
+    elapsed = time.perf_counter() - start
+    print(format_report(results, a.per_word))
+    total = sum(agg.games for agg in results.values())
+    print(f"\n{total} games in {elapsed:.2f}s ({total / elapsed:,.0f} games/s, {a.workers} workers)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,3 +13,8 @@ INTERMEDIATE_PHRASES = [
     "cyber security", "model view controller", "application server",
     "artificial intelligence", "data structure", "version control",
 ]
+
+LEVELS = {
+    "basic": BASIC_WORDS,
+    "intermediate": INTERMEDIATE_PHRASES,
+}
@@ -17,9 +17,8 @@ def main():
     )
     parser.add_argument(
         "--level", 
-        choices=["basic", "intermediate"], 
         default="basic",
-        help="Game difficulty level (CLI only)"
+        help="Game difficulty level: basic, intermediate or a level of --corpus (CLI only)"
     )
     parser.add_argument(
         "--lives", 
@@ -33,15 +32,94 @@ def main():
         default=15,
         help="Seconds per turn (CLI only)"
     )
+    parser.add_argument(
+        "--mode",
+        choices=["classic", "evil"],
+        default="classic",
+        help="Game mode; evil keeps changing the answer to dodge guesses (CLI only)"
+    )
+    parser.add_argument(
+        "--corpus",
+        help="Compiled word corpus built with python -m hangman.corpus"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed the word deck for a reproducible run (CLI only; --profile defaults to 0)"
+    )
+    parser.add_argument(
+        "--difficulty",
+        help="easy, medium, hard or a percentile range such as 0.8-1.0 (CLI only)"
+    )
+    parser.add_argument(
+        "--results",
+        help="Append finished games to this result log"
+    )
+    parser.add_argument(
+        "--record",
+        help="Record event streams of finished games for replay (CLI only)"
+    )
+    parser.add_argument(
+        "--leaderboard",
+        help="Submit scores to this leaderboard log"
+    )
+    parser.add_argument(
+        "--player",
+        help="Name on the leaderboard (default: login name)"
+    )
+    parser.add_argument(
+        "--metrics",
+        help="Write engine and turn metrics to this file every 10s (.prom: Prometheus text, else JSON)"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on localhost:PORT/metrics"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Play a scripted session on a virtual clock and print cProfile and tracemalloc reports"
+    )
+    parser.add_argument(
+        "--script",
+        help="Scripted input for --profile, one line per prompt ('-' lets the turn time out)"
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=10,
+        help="Games to play in --profile mode once the script runs out"
+    )
     
     args = parser.parse_args()
     
+    if args.profile:
+        from hangman.profiling import main as profile_main
+        profile_args = [
+            "--level", args.level,
+            "--lives", str(args.lives),
+            "--seconds", str(args.seconds),
+            "--mode", args.mode,
+            "--games", str(args.games)
+        ]
+        if args.corpus:
+            profile_args += ["--corpus", args.corpus]
+        if args.seed is not None:
+            profile_args += ["--seed", str(args.seed)]
+        if args.script:
+            profile_args += ["--script", args.script]
+        if args.gui:
+            profile_args.append("--gui")
+        sys.exit(profile_main(profile_args))
+    
     if args.gui:
         # Launch GUI version
         try:
             from hangman.gui import main as gui_main
             print("Starting Hangman GUI...")
-            gui_main()
+            gui_main(args.results, args.leaderboard, args.player, args.metrics, args.metrics_port,
+                     args.corpus)
         except ImportError as e:
             print(f"Error: Could not import GUI module: {e}")
             print("Make sure Tkinter is installed.")
@@ -53,11 +131,31 @@ def main():
         # Launch CLI version
         try:
             from hangman.cli import main as cli_main
-            sys.exit(cli_main([
+            cli_args = [
                 "--level", args.level,
                 "--lives", str(args.lives),
-                "--seconds", str(args.seconds)
-            ]))
+                "--seconds", str(args.seconds),
+                "--mode", args.mode
+            ]
+            if args.corpus:
+                cli_args += ["--corpus", args.corpus]
+            if args.seed is not None:
+                cli_args += ["--seed", str(args.seed)]
+            if args.difficulty:
+                cli_args += ["--difficulty", args.difficulty]
+            if args.results:
+                cli_args += ["--results", args.results]
+            if args.record:
+                cli_args += ["--record", args.record]
+            if args.leaderboard:
+                cli_args += ["--leaderboard", args.leaderboard]
+            if args.player:
+                cli_args += ["--player", args.player]
+            if args.metrics:
+                cli_args += ["--metrics", args.metrics]
+            if args.metrics_port is not None:
+                cli_args += ["--metrics-port", str(args.metrics_port)]
+            sys.exit(cli_main(cli_args))
         except Exception as e:
             print(f"Error starting CLI: {e}")
             sys.exit(1)
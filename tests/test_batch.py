@@ -0,0 +1,67 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from hangman.batch import HangmanBatch, WON, LOST
+from hangman.engine import HangmanGame
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def test_batch_matches_scalar_engine():
+    rng = random.Random(7)
+    answers = [rng.choice(BASIC_WORDS + INTERMEDIATE_PHRASES) for _ in range(200)]
+    batch = HangmanBatch(answers, lives=4)
+    games = [HangmanGame(a, lives=4) for a in answers]
+    for _ in range(30):
+        letters = [rng.choice("abcdefghijklmnopqrstuvwxyz?") for _ in answers]
+        ok, count = batch.guess(letters)
+        for i, g in enumerate(games):
+            assert g.guess(letters[i]) == (bool(ok[i]), int(count[i]))
+    for i, g in enumerate(games):
+        assert batch.status_name(i) == g.state.status()
+        assert batch.masked_answer(i) == g.state.masked_answer()
+        assert int(batch.lives[i]) == g.state.lives
+        assert int(batch.score[i]) == g.state.score
+        assert int(batch.correct_guesses()[i]) == g.state.get_correct_guesses()
+        assert int(batch.wrong_guesses()[i]) == g.state.get_wrong_guesses()
+
+
+def test_batch_tick_matches_scalar_engine():
+    batch = HangmanBatch(["test", "go"], lives=1, seconds_per_turn=[1, 5])
+    batch.start_turn(0.0)
+    assert batch.tick(1.1).tolist() == [True, False]
+    assert batch.status.tolist() == [LOST, 0]
+    batch.guess(["g", "g"]); batch.guess(["o", "o"])
+    assert batch.status.tolist() == [LOST, WON]
+
+
+def test_from_word_ids_matches_answer_strings():
+    words = ["Go", "test", "go"]
+    ids = [1, 0, 2, 1]
+    by_id = HangmanBatch.from_word_ids(words, ids, lives=2)
+    by_text = HangmanBatch([words[i] for i in ids], lives=2)
+    for letters in (["t", "o", "z", "q"], ["e", "g", "g", "s"]):
+        assert [a.tolist() for a in by_id.guess(letters)] == [a.tolist() for a in by_text.guess(letters)]
+    assert [by_id.masked_answer(i) for i in range(4)] == [by_text.masked_answer(i) for i in range(4)]
+    assert by_id.status.tolist() == by_text.status.tolist()
+    with pytest.raises(ValueError):
+        HangmanBatch.from_word_ids(words, [3])
+
+
+def test_letters_outside_a_to_z_match_scalar_engine():
+    answers = ["cafe", "go", "test"]
+    batch = HangmanBatch(answers, lives=3)
+    games = [HangmanGame(a, lives=3) for a in answers]
+    for letters in (["é", "g", "ß"], ["é", "É", "t"], ["c", "o", "é"]):
+        ok, count = batch.guess(letters)
+        for i, g in enumerate(games):
+            assert g.guess(letters[i]) == (bool(ok[i]), int(count[i]))
+    for i, g in enumerate(games):
+        assert int(batch.lives[i]) == g.state.lives
+        assert int(batch.score[i]) == g.state.score
+        assert int(batch.wrong_guesses()[i]) == g.state.get_wrong_guesses()
+        assert batch.masked_answer(i) == g.state.masked_answer()
+    batch.guess(["à", "á", "â"])                  # 共 5 个 a-z 以外的字母；第 7 个没有编码
+    with pytest.raises(ValueError):
+        batch.guess(["ã", "ä", "å"])
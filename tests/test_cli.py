@@ -0,0 +1,43 @@
+import io
+import os
+
+import pytest
+
+from hangman import cli
+
+pytestmark = pytest.mark.skipif(not cli.HAS_SELECT, reason="needs select on stdin")
+
+
+@pytest.fixture
+def pipe_stdin(monkeypatch):
+    r, w = os.pipe()
+    reader = os.fdopen(r)
+    monkeypatch.setattr(cli.sys, "stdin", reader)
+    yield w
+    reader.close()
+    os.close(w)
+
+
+def test_prompt_returns_typed_line(pipe_stdin, monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(cli.sys, "stdout", out)
+    os.write(pipe_stdin, b"e\n")
+    assert cli.prompt_with_timer("Enter a letter: ", 5) == "e"
+    assert out.getvalue().count("Enter a letter: [5s] ") == 1
+
+
+def test_prompt_times_out_and_redraws_once_per_second(pipe_stdin, monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(cli.sys, "stdout", out)
+    assert cli.prompt_with_timer("Enter a letter: ", 0.3) == ""
+    assert out.getvalue().count("Enter a letter: [") == 1
+
+
+def test_prompt_reads_stdin_redirected_from_a_file(tmp_path, monkeypatch):
+    path = tmp_path / "moves.txt"
+    path.write_text("e\nn\n")
+    out = io.StringIO()
+    monkeypatch.setattr(cli.sys, "stdout", out)
+    with open(path) as f:
+        monkeypatch.setattr(cli.sys, "stdin", f)
+        assert [cli.prompt_with_timer("Enter a letter: ", 5) for _ in range(3)] == ["e", "n", ""]
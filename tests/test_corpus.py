@@ -0,0 +1,52 @@
+import pickle
+
+import pytest
+
+from hangman.corpus import Corpus, compile_corpus, main, open_corpus
+from hangman.dealer import WordDealer
+from hangman.words import BASIC_WORDS, LEVELS
+
+
+def test_builtin_levels_round_trip(tmp_path):
+    path = str(tmp_path / "builtin.hgc")
+    assert compile_corpus(path, LEVELS) == sum(len(v) for v in LEVELS.values())
+    with Corpus(path) as corpus:
+        assert list(corpus) == list(LEVELS)
+        for level, words in LEVELS.items():
+            assert sorted(corpus[level]) == sorted(words)
+        view = corpus["basic"]
+        assert view[-1] == max(BASIC_WORDS, key=lambda w: (len(w), w))
+        assert view[:2] == list(view)[:2]
+        assert sorted(corpus.by_length("basic", 6)) == sorted(w for w in BASIC_WORDS if len(w) == 6)
+        assert len(corpus.by_length("basic", 99)) == 0
+        assert sum(corpus.lengths("intermediate").values()) == len(LEVELS["intermediate"])
+
+
+def test_dealer_and_pickle_share_the_mapped_file(tmp_path):
+    path = str(tmp_path / "c.hgc")
+    compile_corpus(path, {"tiny": ["Alpha", "beta", "beta", " gamma "]})
+    corpus = open_corpus(path)
+    assert pickle.loads(pickle.dumps(corpus)) is corpus
+    dealer = WordDealer(corpus, seed=1)
+    assert sorted(dealer.deal("tiny") for _ in range(3)) == ["alpha", "beta", "gamma"]
+
+
+def test_cli_build_from_text_and_reject_other_files(tmp_path, capsys):
+    src = tmp_path / "words.txt"
+    src.write_text("# comment\nzebra\n\nyak\n", encoding="utf-8")
+    out = str(tmp_path / "out.hgc")
+    assert main(["build", out, f"animals={src}", "--builtin"]) == 0
+    assert set(Corpus(out)) == {"basic", "intermediate", "animals"}
+    main(["info", out])
+    assert "animals" in capsys.readouterr().out
+    with pytest.raises(ValueError):
+        Corpus(str(src))
+    with pytest.raises(SystemExit):
+        main(["info", str(src)])
+
+
+def test_cli_missing_word_list_is_a_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as e:
+        main(["build", str(tmp_path / "out.hgc"), f"animals={tmp_path / 'missing.txt'}"])
+    assert e.value.code == 2
+    assert "missing.txt" in capsys.readouterr().err
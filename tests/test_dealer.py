@@ -0,0 +1,35 @@
+import pytest
+
+from hangman.dealer import WordDealer
+from hangman.words import BASIC_WORDS
+
+
+def test_deck_has_no_repeats_until_exhausted():
+    dealer = WordDealer(seed=3)
+    first = [dealer.deal("basic") for _ in BASIC_WORDS]
+    assert sorted(first) == sorted(BASIC_WORDS)
+    second = [dealer.deal("basic") for _ in BASIC_WORDS]
+    assert sorted(second) == sorted(BASIC_WORDS)
+    assert second[0] != first[-1]
+
+
+def test_seed_reproduces_sequence_and_player_decks():
+    a, b = WordDealer(seed=11), WordDealer(seed=11)
+    assert [a.deal("intermediate") for _ in range(25)] == [b.deal("intermediate") for _ in range(25)]
+    # 玩家牌堆与其他玩家的发牌顺序无关
+    b.deal("basic", player="bob")
+    assert [a.deal("basic", player="ann") for _ in range(5)] == \
+           [b.deal("basic", player="ann") for _ in range(5)]
+
+
+def test_single_word_deck_and_forget():
+    dealer = WordDealer({"one": ["solo"]}, seed=1)
+    assert [dealer.deal("one", player=1) for _ in range(3)] == ["solo"] * 3
+    dealer.forget(1)
+    assert dealer._decks == {}
+
+
+def test_empty_level_is_a_clear_error():
+    dealer = WordDealer({"empty": []}, seed=1)
+    with pytest.raises(ValueError, match="no words"):
+        dealer.deal("empty")
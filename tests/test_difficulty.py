@@ -0,0 +1,65 @@
+import json
+import random
+
+import pytest
+
+from hangman.difficulty import DifficultyIndex, corpus_hash, parse_range
+
+WORDS = ["cat", "dog", "cot", "jazz", "quiz", "banana", "bandana", "ooze"]
+
+
+def test_index_is_sorted_and_choose_respects_range():
+    index = DifficultyIndex.build(WORDS)
+    assert sorted(index.words) == sorted(WORDS)
+    assert index.scores == sorted(index.scores)
+    rng = random.Random(0)
+    easy = {index.choose(0.0, 0.25, rng) for _ in range(50)}
+    assert easy == set(index.words[:2])
+    assert index.choose(0.99, 1.0, rng) == index.words[-1]
+    with pytest.raises(ValueError):
+        index.choose(0.5, 0.5)
+
+
+def test_cache_is_reused_and_invalidated_by_content(tmp_path):
+    first = DifficultyIndex.load(WORDS, str(tmp_path))
+    (path,) = tmp_path.iterdir()
+    data = json.loads(path.read_text())
+    assert data["hash"] == corpus_hash(WORDS)
+    # 读取缓存而不是重新计算
+    data["words"] = list(reversed(data["words"]))
+    path.write_text(json.dumps(data))
+    assert DifficultyIndex.load(WORDS, str(tmp_path)).words == list(reversed(first.words))
+    DifficultyIndex.load(WORDS + ["zebra"], str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_cache_key_covers_solver_setting_and_weights(tmp_path, monkeypatch):
+    from hangman import difficulty
+    DifficultyIndex.load(WORDS, str(tmp_path))
+    DifficultyIndex.load(WORDS, str(tmp_path), use_solver=False)
+    assert len(list(tmp_path.iterdir())) == 2
+    monkeypatch.setitem(difficulty.WEIGHTS, "solver", 0.0)
+    assert DifficultyIndex.cached(WORDS, str(tmp_path)) is None
+    DifficultyIndex.load(WORDS, str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_parse_range():
+    assert parse_range("hard") == (2 / 3, 1.0)
+    assert parse_range("0.2-0.4") == (0.2, 0.4)
+    for bad in ("0.5-0.2", "x", "0-2"):
+        with pytest.raises(ValueError):
+            parse_range(bad)
+
+
+def test_choose_answer_with_difficulty(tmp_path, monkeypatch, capsys):
+    from hangman.cli import choose_answer
+    from hangman.difficulty import level_index
+    from hangman.words import BASIC_WORDS
+    monkeypatch.setenv("HANGMAN_CACHE_DIR", str(tmp_path))
+    level_index.cache_clear()
+    hardest = level_index("basic").words[-1]
+    assert "Building the difficulty index" in capsys.readouterr().err
+    assert choose_answer("basic", random.Random(1), (0.99, 1.0)) == hardest
+    assert choose_answer("basic", difficulty=parse_range("easy")) in BASIC_WORDS
+    level_index.cache_clear()
@@ -79,3 +79,62 @@ def test_timer_functionality():
     timeout_occurred = g.tick(start_time + 2.1)
     assert timeout_occurred is True
     assert g.state.lives == 2
+
+def test_state_index_tracks_direct_set_changes():
+    g = HangmanGame(answer="unit testing")
+    g.state.letters_guessed |= {"t", "z"}
+    assert g.state.masked_answer() == "___t t__t___"
+    assert g.state.get_correct_guesses() == 1
+    assert g.state.get_wrong_guesses() == 1
+    g.state.letters_guessed.discard("t")
+    assert g.state.masked_answer() == "____ _______"
+    g.state.letters_guessed = {"u", "n", "i", "t", "e", "s", "g"}
+    assert g.state.is_won()
+    assert g.state.guessed_mask.bit_count() == 7
+
+def test_repeat_guess_reports_count_without_penalty():
+    g = HangmanGame(answer="banana", lives=3)
+    assert g.guess("a") == (True, 3)
+    assert g.guess("A") == (True, 3)
+    g.guess("z")
+    assert g.guess("z") == (False, 0)
+    assert g.state.lives == 2 and g.state.score == 5
+
+def test_letters_outside_a_to_z_use_no_global_bits():
+    from hangman.engine import _LETTER_BITS
+    g = HangmanGame(answer="café", lives=3)
+    assert g.guess("é") == (True, 1)
+    assert g.guess("ß") == (False, 0)
+    assert g.guess("ß") == (False, 0)        # 重复猜不再扣命
+    assert g.state.lives == 2 and g.state.get_wrong_guesses() == 1
+    for letter in "caf":
+        g.guess(letter)
+    assert g.state.masked_answer() == "café" and g.state.is_won()
+    assert len(_LETTER_BITS) == 26
+
+def test_copies_do_not_share_guessed_letters():
+    import copy
+    g = HangmanGame(answer="python")
+    g.guess("p")
+    for clone in (copy.copy(g.state), copy.deepcopy(g.state)):
+        clone.letters_guessed.add("y")
+        assert clone.masked_answer() == "py____"
+        assert g.state.masked_answer() == "p_____"
+        assert g.state.letters_guessed == {"p"}
+    plain = copy.copy(g.state.letters_guessed)
+    plain.add("o")
+    assert g.state.masked_answer() == "p_____"
+
+def test_mask_cache_shares_strings_and_counts_evictions():
+    from hangman.engine import MaskCache
+    a, b = HangmanGame(answer="python"), HangmanGame(answer="python")
+    a.guess("p"); a.guess("z")
+    b.guess("q"); b.guess("p")
+    assert a.state.masked_answer() == "p_____"
+    assert a.state.masked_answer() is b.state.masked_answer()
+    cache = MaskCache(maxsize=2)
+    for mask in (0, 1, 2, 0, 1):
+        cache.get("ab", mask)
+    assert cache.get("ab", 3) == "ab"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], len(cache)) == (0, 6, 4, 2)
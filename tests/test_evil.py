@@ -0,0 +1,39 @@
+from hangman.evil import EvilHangmanGame, create_game, largest_class, partition
+from hangman.engine import HangmanGame
+from hangman.solver import WordIndex, _popcount
+
+WORDS = ["echo", "heal", "belt", "peel", "hell", "else", "jazz", "buzz"]
+
+
+def test_partition_classes_and_largest_class():
+    group = WordIndex(WORDS).groups["____"]
+    classes = dict(partition(group, group.all, "e", range(4)))
+    assert {k: sorted(group.words[i] for i in range(len(WORDS)) if m >> i & 1)
+            for k, m in classes.items()} == {
+        0: ["buzz", "jazz"], 0b0001: ["echo"], 0b0010: ["belt", "heal", "hell"],
+        0b0110: ["peel"], 0b1001: ["else"]}
+    for letter in "ehlz":
+        best = max(partition(group, group.all, letter, range(4)),
+                   key=lambda c: (_popcount(c[1]), -_popcount(c[0]), -c[0]))
+        assert largest_class(group, group.all, letter, range(4)) == best
+
+
+def test_evil_game_dodges_and_stays_consistent():
+    game = EvilHangmanGame("jazz", lives=10, index=WordIndex(WORDS))
+    assert game.guess("e") == (True, 1)  # _e__ is the largest class
+    assert game.state.masked_answer() == "_e__"
+    assert sorted(game.state.candidate_words()) == ["belt", "heal", "hell"]
+    assert game.guess("z") == (False, 0)
+    assert game.state.lives == 9 and game.state.score == 5
+    assert game.guess("h") == (True, 1)  # heal/hell outnumber belt
+    assert game.guess("l") == (True, 1)  # heal reveals fewer positions than hell
+    assert game.state.candidate_count() == 1
+    assert game.guess("a") == (True, 1)
+    assert game.state.is_won() and game.state.answer == "heal"
+
+
+def test_create_game_modes():
+    assert type(create_game("classic", "python", "basic")) is HangmanGame
+    game = create_game("evil", "python", "basic")
+    assert game.state.candidate_count() == sum(len(w) == 6 for w in
+                                               ["python", "object", "module", "thread", "memory"])
@@ -71,6 +71,27 @@ class TestHangmanGUI:
             assert gui.game.state.lives == 6
             assert gui.game.state.seconds_per_turn == 15
     
+    def test_evil_game_uses_the_corpus(self, tmp_path, monkeypatch):
+        """Evil mode draws its candidates from the loaded corpus"""
+        from hangman import evil
+        from hangman.corpus import compile_corpus, load_levels
+        from hangman.dealer import DEFAULT_DEALER
+        path = str(tmp_path / "tiny.corpus")
+        compile_corpus(path, {"tiny": ["zebra"]})
+        monkeypatch.setattr(DEFAULT_DEALER, "levels", load_levels(path))
+        calls = []
+        monkeypatch.setattr(evil, "create_game", lambda *args: calls.append(args) or HangmanGame("zebra"))
+        gui = HangmanGUI.__new__(HangmanGUI)
+        for name in ("result_label", "letter_var", "letter_entry", "guess_button"):
+            setattr(gui, name, Mock())
+        gui.level_var, gui.lives_var = Mock(get=lambda: "tiny"), Mock(get=lambda: "6")
+        gui.timeout_var, gui.mode_var = Mock(get=lambda: "15"), Mock(get=lambda: "evil")
+        with patch.object(HangmanGUI, 'cancel_timer'), \
+             patch.object(HangmanGUI, 'update_display'), \
+             patch.object(HangmanGUI, 'start_timer'):
+            gui.new_game()
+        assert calls == [("evil", "zebra", "tiny", 6, 15, path)]
+
     def test_timer_functionality(self, mock_root):
         """Test timer-related methods"""
         with patch.object(HangmanGUI, 'setup_styles'), \
@@ -92,6 +113,46 @@ class TestHangmanGUI:
             assert gui.current_time_left == 5
             assert gui.timer_running is True
 
+    def test_timer_scheduler(self, mock_root):
+        """Test the after()-driven countdown wakes once per displayed second"""
+        with patch.object(HangmanGUI, 'setup_styles'), \
+             patch.object(HangmanGUI, 'create_widgets'), \
+             patch.object(HangmanGUI, 'setup_layout'), \
+             patch.object(HangmanGUI, 'bind_events'), \
+             patch.object(HangmanGUI, 'new_game'), \
+             patch('hangman.gui.time.monotonic') as clock, \
+             patch.object(HangmanGUI, 'handle_timeout') as handle_timeout:
+
+            gui = HangmanGUI()
+            gui.timer_label = Mock()
+            gui.game = HangmanGame("test", lives=6, seconds_per_turn=5)
+
+            clock.return_value = 100.0
+            gui.start_timer()
+            gui.timer_label.config.assert_called_with(text="Time: 5s")
+            assert mock_root.after.call_args[0][0] == 1000
+
+            # Redraw only when the shown second changes
+            clock.return_value = 100.4
+            gui.on_timer()
+            assert gui.timer_label.config.call_count == 1
+            assert mock_root.after.call_args[0][0] == 600
+
+            clock.return_value = 101.0
+            gui.on_timer()
+            assert gui.timer_label.config.call_count == 2
+            gui.timer_label.config.assert_called_with(text="Time: 4s")
+
+            clock.return_value = 105.0
+            gui.on_timer()
+            handle_timeout.assert_called_once()
+            assert gui.game.state.lives == 5
+
+            gui.start_timer()
+            gui.cancel_timer()
+            assert gui.timer_running is False
+            mock_root.after_cancel.assert_called_once_with(mock_root.after.return_value)
+
 
 def test_gui_import():
     """Test that GUI module can be imported"""
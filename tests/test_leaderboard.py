@@ -0,0 +1,86 @@
+import random
+
+from hangman.leaderboard import BackgroundSubmitter, Leaderboard, SortedScores
+
+
+def test_sorted_scores_matches_sorted_list():
+    rng = random.Random(3)
+    scores, expected = SortedScores(load=4), []
+    for _ in range(2000):
+        key = (rng.randrange(-50, 50), f"p{rng.randrange(300)}")
+        if key in expected:
+            scores.remove(key)
+            expected.remove(key)
+        else:
+            scores.add(key)
+            expected.append(key)
+        expected.sort()
+        assert len(scores) == len(expected)
+        probe = (rng.randrange(-60, 60), f"p{rng.randrange(300)}")
+        assert scores.rank(probe) == sum(k < probe for k in expected)
+    assert list(scores) == expected
+    assert scores.top(5) == expected[:5]
+
+
+def test_best_scores_ranks_and_log_replay(tmp_path):
+    path = str(tmp_path / "scores.wal")
+    with Leaderboard(path) as board:
+        assert board.submit("ann", 30)
+        assert board.submit("bob", 50)
+        assert not board.submit("ann", 10)   # 不是个人最高分
+        assert board.submit("ann", 60)
+        assert board.submit("cid", 50)
+        assert board.top(3) == [("ann", 60), ("bob", 50), ("cid", 50)]
+        assert [board.rank(p) for p in ("ann", "bob", "cid", "dan")] == [1, 2, 3, None]
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('["dan", 7')                   # 崩溃时写了一半的行
+    reloaded = Leaderboard(path)
+    assert reloaded.best == {"ann": 60, "bob": 50, "cid": 50}
+    assert reloaded.log_records == 4
+    reloaded.close()
+
+
+def test_crash_reopen_append_reload(tmp_path):
+    path = str(tmp_path / "scores.wal")
+    board = Leaderboard(path)
+    board.submit("ann", 30)
+    board.submit("bob", 40)
+    # 不调用 close：每条记录在更新内存前已经写入文件
+    with open(path, encoding="utf-8") as f:
+        assert f.read().splitlines() == ['["ann",30]', '["bob",40]']
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('not json\n["cid",20]\n["dan", 1')   # 坏行 + 崩溃时写了一半的行
+    with Leaderboard(path) as board:
+        assert board.skipped == 1
+        assert board.best == {"ann": 30, "bob": 40, "cid": 20}
+        assert board.submit("eve", 50)
+        assert board.submit("ann", 35)
+    with Leaderboard(path) as board:
+        assert board.best == {"ann": 35, "bob": 40, "cid": 20, "eve": 50}
+        assert board.rank("eve") == 1
+
+
+def test_compaction_and_background_submits(tmp_path):
+    path = str(tmp_path / "scores.wal")
+    submitter = BackgroundSubmitter(Leaderboard(path, compact_min=20))
+    futures = [submitter.submit(f"p{i % 5}", i) for i in range(50)]
+    assert futures[-1].result(timeout=5) == 1
+    submitter.close()
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) < 50
+    assert Leaderboard(path).top(2) == [("p4", 49), ("p3", 48)]
+
+
+def test_failed_background_submit_is_logged(tmp_path, caplog):
+    board = Leaderboard(str(tmp_path / "scores.wal"))
+
+    def fail(player, score):
+        raise OSError("disk full")
+    board.submit = fail
+    submitter = BackgroundSubmitter(board)
+    with caplog.at_level("ERROR", logger="hangman.leaderboard"):
+        future = submitter.submit("ann", 30)
+        submitter.close()
+    assert isinstance(future.exception(), OSError)
+    assert "'ann' failed: disk full" in caplog.text
@@ -0,0 +1,51 @@
+import asyncio
+import random
+
+import pytest
+
+from hangman.loadgen import GUESS, TICK, LoadStats, check_game, play_client, run_load
+from hangman.server import HangmanServer
+from hangman.solver import Solver
+
+
+def test_check_game_replays_turns_with_hangman_game():
+    frames = [("__", 2), ("__", 1), ("g_", 1)]
+    events = [[TICK], [GUESS, "g", [True, 1]], [GUESS, "o", [True, 1]]]
+    assert check_game("go", 2, 5, frames, events, won=True)
+    assert not check_game("go", 2, 5, frames, events[:2] + [[GUESS, "o", [True, 2]]], won=True)
+    assert not check_game("go", 2, 5, frames, events, won=False)
+
+
+def test_clients_play_full_games_against_in_process_server():
+    stats, _ = asyncio.run(run_load(clients=20, games=2, lives=6, seconds=5, seed=1))
+    assert stats.games == 40 and stats.errors == 0 and stats.mismatches == 0
+    assert stats.timeouts == 0 and len(stats.latencies) > 40
+    p50, p95, p99 = stats.percentiles()
+    assert 0 < p50 <= p95 <= p99
+
+
+def test_slow_thinkers_lose_lives_to_the_timer():
+    stats, _ = asyncio.run(run_load(clients=5, games=1, lives=2, seconds=0.2, think=60, seed=1))
+    assert stats.games == 5 and stats.wins == 0 and stats.mismatches == 0
+    assert stats.timeouts == 10 and stats.latencies == []
+
+
+def test_client_gives_up_when_the_solver_has_no_letter():
+    async def scenario():
+        server = HangmanServer(lives=30, answer_source=lambda level: "é")
+        await server.start()
+        stats = LoadStats()
+        await play_client("127.0.0.1", server.port, 1, 30, 5, Solver(), 0.0, random.Random(0), stats)
+        while server.sessions:
+            await asyncio.sleep(0.01)
+        server.server.close()
+        await server.server.wait_closed()
+        return stats
+    stats = asyncio.run(scenario())
+    assert stats.gave_up == 1 and stats.games == 0 and len(stats.latencies) == 26
+
+
+def test_level_is_checked_against_the_levels():
+    from hangman.loadgen import main
+    with pytest.raises(SystemExit):
+        main(["--level", "nope", "--clients", "1"])
@@ -0,0 +1,61 @@
+import json
+import urllib.request
+
+from hangman import cli, metrics
+from hangman.engine import HangmanGame, HangmanState
+
+
+def test_enable_counts_and_disable_restores_engine():
+    originals = (HangmanGame.guess, HangmanGame.tick, HangmanState.masked_answer)
+    m = metrics.enable()
+    try:
+        assert metrics.enable() is m
+        assert cli.active_metrics() is m
+        game = HangmanGame("abc", lives=3, seconds_per_turn=1)
+        game.start_turn(0.0)
+        assert game.tick(1.0)                 # 超时一次
+        for letter in "axbc":
+            game.guess(letter)
+        game.guess("z")                       # 已结束，不计数
+        game.state.masked_answer()
+        assert m.counters == {"guesses": 4, "correct_guesses": 3, "wrong_guesses": 1,
+                              "timeouts": 1, "wins": 1, "losses": 0}
+        assert m.histograms["guess_seconds"].count == 5
+        assert m.histograms["tick_seconds"].count == 1
+        assert m.histograms["masked_answer_seconds"].count >= 1
+    finally:
+        metrics.disable()
+    assert (HangmanGame.guess, HangmanGame.tick, HangmanState.masked_answer) == originals
+    assert metrics.active() is None
+    assert cli.active_metrics() is None
+
+
+def test_histogram_buckets_and_prometheus_text():
+    m = metrics.Metrics()
+    for value in (5e-8, 1e-7, 3e-7, 2.0, 1e9):
+        m.observe("guess_seconds", value)
+    h = m.histograms["guess_seconds"]
+    assert list(h.counts[:3]) == [2, 0, 1] and h.counts[-1] == 1
+    assert h.quantile(0.5) == metrics.BUCKETS[2]
+    text = m.to_prometheus()
+    assert '# TYPE hangman_guess_seconds histogram' in text
+    assert 'hangman_guess_seconds_bucket{le="1e-07"} 2' in text
+    assert 'hangman_guess_seconds_bucket{le="+Inf"} 5' in text
+    assert "hangman_wins_total 0" in text
+
+
+def test_exporter_writes_snapshots_and_serves_http(tmp_path):
+    m = metrics.Metrics()
+    m.inc("wins")
+    path = str(tmp_path / "metrics.json")
+    exporter = metrics.Exporter(m, path, interval=0.01, port=0)
+    try:
+        port = exporter.http.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as r:
+            assert "hangman_wins_total 1" in r.read().decode()
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics.json") as r:
+            assert json.load(r)["counters"]["wins"] == 1
+    finally:
+        exporter.close()
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["counters"]["wins"] == 1
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import hangman
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def test_cli_import_does_not_load_tkinter():
+    out = _run("import sys, hangman.cli; print('tkinter' in sys.modules)")
+    assert out.strip() == "False"
+
+
+def test_cli_import_does_not_load_optional_modules():
+    optional = ["hangman.metrics", "hangman.evil", "hangman.solver", "hangman.replay",
+                "hangman.results", "hangman.corpus"]
+    out = _run(f"import sys, hangman.cli; print([m for m in {optional!r} if m in sys.modules])")
+    assert out.strip() == "[]"
+
+
+def test_public_names_load_on_first_use():
+    assert isinstance(hangman.GUI_AVAILABLE, bool)
+    assert hangman.HangmanGame("go").state.answer == "go"
+    assert "HangmanGUI" in dir(hangman)
+
+
+def test_gui_import_does_not_load_optional_modules():
+    optional = ["hangman.metrics", "hangman.evil", "hangman.solver", "hangman.results", "hangman.corpus"]
+    out = _run(f"import sys, hangman.gui; print([m for m in {optional!r} if m in sys.modules])")
+    assert out.strip() == "[]"
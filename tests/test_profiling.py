@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from hangman import cli
+from hangman.corpus import compile_corpus
+from hangman.dealer import DEFAULT_DEALER
+from hangman.profiling import ScriptedPlayer, VirtualClock, main, profile, run_cli_session
+
+
+def test_scripted_session_runs_on_a_virtual_clock(capsys):
+    saved = cli.prompt_with_timer, cli.ask_play_again, cli.time
+    start = time.perf_counter()
+    run_cli_session(["e", "-", "?", "y", "a"], games=3, seconds=30)
+    assert time.perf_counter() - start < 5     # 超时回合不真的等 30 秒
+    out = capsys.readouterr().out
+    assert out.count("Welcome to Hangman!") == 3
+    assert out.count("Time's up! Life -1") == 1
+    assert "Please enter a single letter only." in out
+    assert (cli.prompt_with_timer, cli.ask_play_again, cli.time) == saved
+    run_cli_session(["e", "-", "?", "y", "a"], games=3, seconds=30)
+    assert capsys.readouterr().out == out      # 同一种子、同一脚本：输出完全相同
+
+
+def test_player_falls_back_to_untried_letters():
+    clock = VirtualClock(0.0)
+    player = ScriptedPlayer(["e", "n"], clock, games=2, think=0.5)
+    assert [player.prompt("", 10) for _ in range(3)] == ["e", "n", "t"]
+    assert clock.monotonic() == 1.5
+    assert player.ask_play_again() and not player.ask_play_again()
+    assert player.prompt("", 10) == "e"         # 新的一局重新从 e 开始
+
+
+def test_profile_reports_calls_and_allocations():
+    report = profile(lambda: run_cli_session([], games=2), limit=5)
+    assert "play_single_game" in report
+    assert "allocation sites" in report
+
+
+def test_main_profiles_games_from_the_corpus(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / "tiny.corpus")
+    compile_corpus(path, {"tiny": ["zebra"]})
+    monkeypatch.setattr(DEFAULT_DEALER, "levels", DEFAULT_DEALER.levels)
+    assert main(["--corpus", path, "--level", "tiny", "--games", "1", "--limit", "3"]) == 0
+    assert DEFAULT_DEALER.deal("tiny") == "zebra"
+    with pytest.raises(SystemExit):
+        main(["--corpus", path, "--level", "basic"])
@@ -0,0 +1,42 @@
+from hangman.engine import HangmanGame
+from hangman.replay import RecordingGame, SessionLog, iter_sessions, replay, replay_all
+
+
+def _recorded():
+    g = RecordingGame("go", lives=3, seconds_per_turn=10)
+    g.start_turn(0.0); g.tick(4.0); g.guess("z")
+    g.start_turn(5.0); g.tick(16.0)
+    g.start_turn(16.0); g.tick(17.0); g.guess("g")
+    g.start_turn(18.0); g.guess("o")
+    return g
+
+
+def test_replay_matches_recording(tmp_path):
+    path = tmp_path / "sessions.log"
+    with SessionLog(str(path)) as log:
+        for _ in range(3):
+            log.append(_recorded())
+    sessions = list(iter_sessions(str(path)))
+    assert sessions[0][4] == ["won", 1, 15]
+    assert replay(sessions[0]) is None
+    assert replay_all(sessions, batch_size=2) == (3, [])
+
+
+def test_parallel_replay_keeps_input_order():
+    sessions = (_recorded().session() for _ in range(40))
+    total, diverged = replay_all(sessions, batch_size=2, workers=2, factory=_NoTimeouts)
+    assert total == 40
+    assert [d.index for d in diverged] == list(range(40))   # 按输入顺序
+
+
+class _NoTimeouts(HangmanGame):
+    def tick(self, now):
+        super().tick(0.0 if self.state.last_tick is None else self.state.last_tick)
+        return False
+
+
+def test_rule_change_is_reported():
+    session = _recorded().session()
+    d = replay(session, factory=_NoTimeouts, index=4)
+    assert d.index == 4 and d.step == 4
+    assert (d.expected, d.actual) == (True, False)
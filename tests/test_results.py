@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from hangman import cli
+from hangman.results import GameResult, ResultLog, iter_results, summarize
+
+
+def _result(answer, won, score):
+    return GameResult(answer, "basic", won, 3, score, 2, 1, "abc", 1.5)
+
+
+def test_log_buffers_until_batch_or_close(tmp_path):
+    path = tmp_path / "results.log"
+    log = ResultLog(str(path), batch_size=2)
+    log.append(_result("python", True, 25))
+    assert not path.exists()
+    log.append(_result("python", False, -5))
+    assert len(list(iter_results(str(path)))) == 2
+    log.append(_result("thread", True, 40))
+    log.close()
+    assert [r.answer for r in iter_results(str(path))] == ["python", "python", "thread"]
+
+
+def test_summary_aggregates(tmp_path):
+    path = tmp_path / "results.log"
+    with ResultLog(str(path)) as log:
+        for answer, won, score in [("python", True, 25), ("python", False, -5), ("thread", True, 40)]:
+            log.append(_result(answer, won, score))
+    summary = summarize(str(path))
+    assert summary.games == 3 and summary.wins == 2
+    assert summary.word_win_rates() == {"python": 0.5, "thread": 1.0}
+    assert summary.scores == {20: 1, -10: 1, 40: 1}
+
+
+def test_cli_records_finished_game(tmp_path):
+    path = tmp_path / "results.log"
+    with ResultLog(str(path)) as log, \
+         patch.object(cli, "choose_answer", return_value="go"), \
+         patch.object(cli, "prompt_with_timer", side_effect=["z", "g", "o"]):
+        assert cli.play_single_game("basic", results=log) == 0
+    (result,) = iter_results(str(path))
+    assert result.answer == "go" and result.won and result.guesses == "zgo"
+    assert (result.correct, result.wrong, result.score) == (2, 1, 15)
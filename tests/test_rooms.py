@@ -0,0 +1,70 @@
+import asyncio
+
+from hangman.rooms import RoomServer, RoomView
+
+
+async def _line(reader):
+    return (await asyncio.wait_for(reader.readline(), 5)).decode()
+
+
+def test_players_share_one_puzzle_and_receive_deltas():
+    async def scenario():
+        server = RoomServer(lives=3, answer_source=lambda level: "noon")
+        await server.start()
+        clients = []
+        for name in ("ann", "bob"):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            writer.write(f"JOIN lobby {name}\n".encode())
+            clients.append((reader, writer, RoomView()))
+        for reader, _, view in clients:
+            view.apply(await _line(reader))
+            assert view.masked_answer() == "____" and view.lives == 3
+        assert list(server.rooms) == ["lobby"] and len(server.rooms["lobby"].players) == 2
+
+        ann, bob = clients[0][1], clients[1][1]
+        ann.write(b"o\n")
+        bob.write(b"x\n")
+        expected = [["+ o 1,2 ann\n", "- x 2 bob\n"], ["- x 2 bob\n", "+ o 1,2 ann\n"]]
+        for reader, _, view in clients:
+            lines = [await _line(reader), await _line(reader)]
+            assert lines in expected
+            for line in lines:
+                view.apply(line)
+            assert view.masked_answer() == "_oo_" and view.lives == 2
+
+        bob.write(b"o\n")
+        assert await _line(clients[1][0]) == "# already guessed o\n"
+        ann.write(b"n\n")
+        for reader, _, view in clients:
+            for _ in range(3):
+                view.apply(await _line(reader))
+            assert view.finished == [("won", "noon")]
+            assert view.masked_answer() == "____" and view.lives == 3
+
+        for _, writer, _ in clients:
+            writer.write(b"quit\n")
+            await writer.drain()
+            writer.close()
+        while server.sessions:
+            await asyncio.sleep(0.01)
+        assert server.rooms == {}
+        server.server.close()
+        await server.server.wait_closed()
+    asyncio.run(scenario())
+
+
+def test_overlong_line_closes_the_connection(caplog):
+    async def scenario():
+        server = RoomServer(answer_source=lambda level: "noon")
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(b"JOIN lobby ann\n")
+        await _line(reader)
+        writer.write(b"x" * 100_000 + b"\n")
+        assert await asyncio.wait_for(reader.read(), 5) == b""
+        assert server.sessions == 0 and not server.rooms
+        writer.close()
+        server.server.close()
+        await server.server.wait_closed()
+    asyncio.run(scenario())
+    assert any("closing" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,70 @@
+import asyncio
+
+from hangman.server import HangmanServer, PLAY_AGAIN, PROMPT
+
+
+async def _read_until(reader, marker):
+    lines = []
+    while True:
+        line = (await asyncio.wait_for(reader.readline(), 5)).decode().rstrip("\n")
+        lines.append(line)
+        if line == marker:
+            return lines
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_session_plays_full_game():
+    async def scenario():
+        server = HangmanServer(lives=2, answer_source=lambda level: "go")
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        lines = await _read_until(reader, PROMPT)
+        assert "Word: __ Lives: 2" in lines
+        writer.write(b"z\n")
+        lines = await _read_until(reader, PROMPT)
+        assert "Wrong - 0" in lines and "Word: __ Lives: 1" in lines
+        writer.write(b"g\n")
+        await _read_until(reader, PROMPT)
+        writer.write(b"o\n")
+        lines = await _read_until(reader, PLAY_AGAIN)
+        assert "Answer: go" in lines
+        assert "Congratulations! You successfully guessed the word!" in lines
+        writer.write(b"n\n")
+        assert (await reader.readline()).decode() == "Thanks for playing!\n"
+        writer.close()
+        server.server.close()
+        await server.server.wait_closed()
+    _run(scenario())
+
+
+def test_turn_timeout_costs_a_life():
+    async def scenario():
+        server = HangmanServer(lives=1, seconds_per_turn=0.05, answer_source=lambda level: "go")
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        lines = await _read_until(reader, PLAY_AGAIN)
+        assert "Time's up! Life -1" in lines
+        assert "Game Over! You failed to guess the word." in lines
+        writer.close()
+        server.server.close()
+        await server.server.wait_closed()
+    _run(scenario())
+
+
+def test_overlong_line_closes_the_connection(caplog):
+    async def scenario():
+        server = HangmanServer(answer_source=lambda level: "go")
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        await _read_until(reader, PROMPT)
+        writer.write(b"x" * 100_000 + b"\n")
+        assert await asyncio.wait_for(reader.read(), 5) == b""
+        assert server.sessions == 0
+        writer.close()
+        server.server.close()
+        await server.server.wait_closed()
+    _run(scenario())
+    assert any("closing" in r.getMessage() for r in caplog.records)
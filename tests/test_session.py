@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from hangman.engine import HangmanGame, _answer_index
+from hangman.session import CompactSession
+
+DIGITS = str.maketrans("0123456789", "abcdefghij")
+
+
+def test_compact_session_follows_hangman_game_rules():
+    rng = random.Random(5)
+    for answer in ("python", "Open Source", "model view controller"):
+        for _ in range(20):
+            game, session = HangmanGame(answer, lives=4, seconds_per_turn=2), CompactSession(answer, 4, 2)
+            now = 10.0
+            for obj in (game, session):
+                obj.start_turn(now)
+            while game.state.status() == "playing":
+                now += rng.choice([0.5, 1.0, 2.5])
+                assert session.tick(now) == game.tick(now)
+                letter = rng.choice("abcdeilmnoprstuvwxyz")
+                assert session.guess(letter) == game.guess(letter)
+                assert session.masked_answer() == game.state.masked_answer()
+                assert (session.lives, session.score, session.guessed) == \
+                       (game.state.lives, game.state.score, game.state.guessed_mask)
+            assert session.status() == game.state.status()
+
+
+def test_round_trip_and_shared_answers():
+    game = HangmanGame("Python", lives=5, seconds_per_turn=7.5)
+    game.start_turn(123.25)
+    game.guess("p"); game.guess("z")
+    session = CompactSession.from_game(game)
+    assert (session.lives, session.score, session.seconds_per_turn, session.last_tick) == (4, 5, 7.5, 123.25)
+    back = session.to_game().state
+    assert back.masked_answer() == "p_____" and back.letters_guessed == {"p", "z"}
+    assert CompactSession("PYTHON").answer is CompactSession("python").answer is session.answer
+
+
+def test_out_of_range_values_are_rejected():
+    with pytest.raises(ValueError):
+        CompactSession("python", lives=300)
+    with pytest.raises(ValueError):
+        CompactSession("café")
+
+
+def test_guess_outside_a_to_z_is_a_wrong_guess():
+    session = CompactSession("python", lives=3)
+    assert session.guess("é") == (False, 0)
+    assert (session.lives, session.score, session.guessed) == (2, -5, 0)
+    assert session.guess("É") == (False, 0)        # 重复猜不再扣命，与 HangmanGame 相同
+    assert (session.lives, session.score) == (2, -5)
+    assert session.masked_answer() == "______"
+    game = session.to_game()
+    assert game.state.letters_guessed == {"é"} and game.guess("é") == (False, 0)
+    assert game.state.lives == 2
+    assert CompactSession.from_game(game).guess("é") == (False, 0)
+
+
+def test_guesses_do_not_depend_on_the_answer_index_cache():
+    misses = _answer_index.cache_info().misses
+    sessions = [CompactSession(f"word{chr(97 + i % 26)}{i:05d}".translate(DIGITS)) for i in range(5000)]
+    for session in sessions:
+        assert session.guess("w")[0]
+        session.guess("q")
+        assert not session.is_won()
+    assert _answer_index.cache_info().misses == misses
@@ -0,0 +1,54 @@
+import pytest
+
+from hangman.engine import HangmanGame
+from hangman.snapshot import RECORD, SnapshotFile, decode_state, encode_state, load_states, save_states
+
+
+def test_record_roundtrip_rebases_turn_timer():
+    g = HangmanGame("unit testing", lives=4, seconds_per_turn=15)
+    g.guess("t"); g.guess("z")
+    g.start_turn(100.0)
+    data = encode_state(g.state, 7, now=104.0)
+    assert len(data) == RECORD.size
+    state = decode_state(data, "unit testing", now=50.0)
+    assert state.masked_answer() == g.state.masked_answer()
+    assert (state.lives, state.score, state.seconds_per_turn) == (3, 5, 15)
+    assert state.last_tick == 46.0
+
+
+def test_bulk_file_random_access(tmp_path):
+    games = [HangmanGame(a) for a in ("python", "open source", "python")]
+    games[1].guess("o")
+    path = tmp_path / "sessions.bin"
+    assert save_states(str(path), [g.state for g in games], now=0.0) == 3
+    with SnapshotFile(str(path)) as snap:
+        assert len(snap) == 3 and snap.answer_count == 2
+        game = snap.game(1, now=0.0)
+        assert game.state.masked_answer() == "o___ _o____"
+        assert game.state.last_tick is None
+        assert game.guess("e") == (True, 2)
+        with pytest.raises(IndexError):
+            snap[3]
+    assert [s.answer for s in load_states(str(path))] == ["python", "open source", "python"]
+
+
+def test_guesses_outside_a_to_z_round_trip():
+    g = HangmanGame("café", lives=3)
+    g.guess("é")
+    g.guess("ß")
+    state = decode_state(encode_state(g.state, 0, now=0.0), "café", now=0.0)
+    assert state.masked_answer() == "___é"
+    assert (state.lives, state.score) == (2, 5)
+    assert state.letters_guessed == {"é"}
+
+
+def test_short_or_truncated_files_are_rejected(tmp_path):
+    path = tmp_path / "sessions.bin"
+    for data in (b"", b"HGSNAP01"):
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            SnapshotFile(str(path))
+    save_states(str(path), [HangmanGame("python").state], now=0.0)
+    path.write_bytes(path.read_bytes()[:-2])
+    with pytest.raises(ValueError, match="truncated"):
+        SnapshotFile(str(path))
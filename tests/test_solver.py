@@ -0,0 +1,30 @@
+import pytest
+from hangman.engine import HangmanGame
+from hangman.solver import Solver, WordIndex, STRATEGIES, play
+from hangman.words import BASIC_WORDS, INTERMEDIATE_PHRASES
+
+
+def test_index_narrows_candidates():
+    index = WordIndex(["python", "thread", "memory", "unit testing", "open source"])
+    assert index.matching("______") == ["python", "thread", "memory"]
+    assert index.matching("_____d") == ["thread"]
+    assert index.matching("______", wrong="y") == ["thread"]
+    assert index.matching("____ _______") == ["unit testing"]
+    # 已揭示的 t 不能出现在其他隐藏位置
+    assert WordIndex(["tot", "tog"]).matching("t__") == ["tog"]
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_solver_wins_every_builtin_answer(strategy):
+    solver = Solver(strategy=strategy, seed=1)
+    for answer in BASIC_WORDS + INTERMEDIATE_PHRASES:
+        game = HangmanGame(answer, lives=26)
+        play(game, solver)
+        assert game.state.is_won(), answer
+
+
+def test_solver_falls_back_for_unknown_words():
+    solver = Solver(["python"])
+    game = HangmanGame("hyphen-ated", lives=26)
+    play(game, solver)
+    assert game.state.is_won()
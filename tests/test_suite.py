@@ -0,0 +1,46 @@
+import math
+
+import pytest
+
+from benchmarks.suite import compare, mann_whitney_greater
+
+
+def test_mann_whitney_separated_samples():
+    # U = 9, 均值 4.5, sigma = sqrt(5.25)
+    p = 0.5 * math.erfc((9 - 4.5 - 0.5) / math.sqrt(5.25) / math.sqrt(2))
+    assert mann_whitney_greater([4, 5, 6], [1, 2, 3]) == pytest.approx(p)
+    assert mann_whitney_greater([4, 5, 6], [1, 2, 3]) == pytest.approx(0.0404, abs=1e-4)
+    assert mann_whitney_greater([1, 2, 3], [4, 5, 6]) > 0.98
+
+
+def test_mann_whitney_ties():
+    # 秩：1 -> 1，四个 2 -> 3.5，三个 3 -> 7；U = 11，并列校正后 sigma = sqrt(10)
+    p = 0.5 * math.erfc((11 - 8 - 0.5) / math.sqrt(10) / math.sqrt(2))
+    assert mann_whitney_greater([2, 2, 3, 3], [1, 2, 2, 3]) == pytest.approx(p)
+    assert mann_whitney_greater([1, 1, 1], [1, 1, 1]) == 1.0
+    assert mann_whitney_greater([1, 2, 3], [1, 2, 3]) > 0.5
+
+
+def _result(*samples):
+    return {"samples": list(samples)}
+
+
+def test_compare_flags_only_significant_slowdowns(capsys):
+    base = _result(*range(100, 110))
+    current = {
+        "slower": _result(*range(200, 210)),
+        "same": _result(*range(100, 110)),
+        "faster": _result(*range(50, 60)),
+        "slightly_slower": _result(*range(105, 115)),  # 显著但低于阈值
+        "new": _result(1, 2, 3),
+    }
+    baseline = {name: base for name in ("slower", "same", "faster", "slightly_slower")}
+    assert compare(current, baseline, threshold=0.10, alpha=0.01) == ["slower"]
+    out = capsys.readouterr().out
+    assert "REGRESSION" in out and "faster" in out and "(no baseline)" in out
+
+
+def test_compare_without_regressions(capsys):
+    baseline = {"guess": _result(1.0, 1.1, 0.9, 1.0, 1.05)}
+    assert compare({"guess": _result(1.0, 0.95, 1.1, 1.0, 1.02)}, baseline, 0.10, 0.01) == []
+    assert "REGRESSION" not in capsys.readouterr().out
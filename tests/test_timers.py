@@ -0,0 +1,35 @@
+from hangman.engine import HangmanGame
+from hangman.timers import TimingWheel, TurnTimers
+
+
+def test_wheel_fires_in_batches_and_cancels():
+    wheel = TimingWheel(resolution=1.0, slots=8)
+    a = wheel.arm(2.5, "a")
+    wheel.arm(2.0, "b")
+    c = wheel.arm(3.0, "c")
+    far = wheel.arm(20.0, "far")  # 超过一圈，与 tick 4 共用一个槽
+    assert wheel.cancel(c) and not wheel.cancel(c)
+    assert wheel.advance(1.9) == []
+    assert sorted(h.key for h in wheel.advance(3.0)) == ["a", "b"]
+    assert not wheel.cancel(a)
+    assert wheel.advance(12.0) == []
+    assert wheel.advance(100.0) == [far]
+    assert len(wheel) == 0
+
+
+def test_turn_timers_match_tick_behaviour():
+    fired = []
+    timers = TurnTimers(fired.extend, resolution=0.1)
+    slow = HangmanGame("test", lives=2, seconds_per_turn=1)
+    fast = HangmanGame("test", lives=2, seconds_per_turn=5)
+    timers.arm(slow, 0.0)
+    timers.arm(fast, 0.0)
+    assert timers.advance(0.95) == []
+    assert timers.advance(1.05) == [slow]
+    assert slow.state.lives == 1 and fast.state.lives == 2
+    # 超时后自动开始下一回合
+    assert timers.advance(2.1) == [slow]
+    assert slow.state.is_lost() and len(timers) == 1
+    timers.cancel(fast)
+    assert timers.advance(10.0) == [] and fast.state.lives == 2
+    assert fired == [slow, slow]
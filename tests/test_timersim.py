@@ -0,0 +1,59 @@
+import math
+import random
+
+import pytest
+
+from hangman.replay import RecordingGame, SessionLog
+from hangman.solver import Solver
+from hangman.timersim import Empirical, LogNormal, main, simulate
+from hangman.words import BASIC_WORDS
+
+SOLVER = Solver(BASIC_WORDS)
+
+
+def test_timer_losses_are_separated_from_wrong_guesses():
+    fast = simulate(BASIC_WORDS, 5, 6, LogNormal(1.0, 0.0), SOLVER, games=500, players=50, seed=1)
+    assert fast.games == 500 and fast.timeouts == 0 and fast.lost_to_timeouts == 0
+    assert fast.wins + fast.lost_to_wrong == 500
+    slow = simulate(BASIC_WORDS, 5, 3, LogNormal(10.0, 0.0), SOLVER, games=200, players=7, seed=1)
+    assert slow.lost_to_timeouts == 200 and slow.turns == 600 and slow.wins == 0
+    assert slow.game_time == 200 * 3 * 5.0      # 每局 3 个回合，每回合用满 5 秒
+
+
+def test_same_seed_same_result():
+    runs = [simulate(BASIC_WORDS, 4, 5, LogNormal(3.0, 0.7), SOLVER, games=300, players=20,
+                     spread=0.3, seed=9) for _ in range(2)]
+    assert vars(runs[0]) == vars(runs[1])
+    assert 0 < runs[0].lost_to_timeouts < 300
+
+
+def test_empirical_response_times_from_recorded_sessions(tmp_path):
+    path = str(tmp_path / "sessions.log")
+    game = RecordingGame("cat", lives=3, seconds_per_turn=5)
+    game.start_turn(100.0)
+    game.tick(102.5)
+    game.guess("c")
+    game.start_turn(102.5)
+    game.tick(107.5)                             # 超时，没有作答
+    with SessionLog(path) as log:
+        log.append(game)
+    model = Empirical.from_sessions(path)
+    assert model.answered == [2.5]
+    rng = random.Random(0)
+    assert {model.sample(rng) for _ in range(50)} == {2.5, math.inf}
+
+
+def test_solver_without_candidates_gives_up():
+    solver = Solver(["cat"])
+    stats = simulate(["é"], 5, 30, LogNormal(1.0, 0.0), solver, games=20, players=4, seed=1)
+    assert stats.gave_up == 20 and stats.games == 0 and stats.wrong == 20 * 26
+    assert stats.turns == 20 * 27  # 猜完 26 个字母后的第 27 回合放弃
+
+
+@pytest.mark.parametrize("option", [["--lives", "six"], ["--lives", "0"], ["--seconds", "0"],
+                                    ["--seconds", "-5"], ["--seconds", "x"]])
+def test_bad_seconds_or_lives_is_a_usage_error(option, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(option + ["--games", "1"])
+    assert exc.value.code == 2
+    assert option[0] in capsys.readouterr().err
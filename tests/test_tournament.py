@@ -0,0 +1,31 @@
+import pytest
+
+from hangman.tournament import Aggregate, play_chunk, run_tournament
+
+
+def test_fixed_seed_is_reproducible():
+    configs = [("random", 3, "basic"), ("frequency", 6, "intermediate")]
+    first = run_tournament(configs, games=50, chunk_size=20, workers=2, seed=42)
+    second = run_tournament(configs, games=50, chunk_size=20, workers=2, seed=42)
+    for config in configs:
+        assert first[config].games == 50
+        assert first[config].words == second[config].words
+        assert first[config].scores == second[config].scores
+
+
+def test_chunks_merge_into_totals():
+    total = Aggregate()
+    for seed in ("a", "b"):
+        total.merge(play_chunk(("frequency", 6, "basic"), seed, 10))
+    assert total.games == 20
+    assert sum(games for games, _, _ in total.words.values()) == 20
+    assert total.win_rate == 1.0
+
+
+def test_bad_lives_is_a_usage_error(capsys):
+    from hangman.tournament import main
+    for lives in ("six", "6,0", "4,,6"):
+        with pytest.raises(SystemExit) as exc:
+            main(["--lives", lives, "--games", "1"])
+        assert exc.value.code == 2
+    assert "--lives" in capsys.readouterr().err